@@ -0,0 +1,543 @@
+"""
+Clan Lord time for RankCounter: Puddleby time from real time and back,
+seasons, weekdays, moon phases, zodiac signs and dawn/dusk. Nothing here
+imports tkinter.
+"""
+import os
+import mmap
+import array
+import struct
+import threading
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: the batch conversions fall back to lists
+    np = None
+
+# The game time multiplier is exactly 45.0 / 11.0 (time passes faster in-game)[cite: 1]
+IC_SPEED_MULTIPLIER = 45.0 / 11.0
+
+# Base Puddleby Time epoch offset used internally by the client[cite: 1]
+IC_BASE_OFFSET = 24371635.0
+IC_BASE_YEAR = 411  # The base calculation starts at the year 411[cite: 1]
+
+IC_SECONDS_PER_DAY = 86400
+IC_SECONDS_PER_YEAR = 31104000  # 360 days * 86,400 seconds[cite: 1]
+IC_DAYS_PER_YEAR = 360
+IC_DAYS_PER_SEASON = 90
+IC_DAYS_PER_WEEK = 7
+IC_MOON_CYCLE_DAYS = 28
+IC_ZODIAC_SIGN_DAYS = 30
+IC_ZODIAC_SIGNS_COUNT = 12
+
+SEASONS = ["Spring", "Summer", "Autumn", "Winter"]
+WEEKDAYS = ["Sombdi", "Gradi", "Tridi", "Quartidi", "Quintidi", "Sixdi", "Sevdi"]
+
+# Replaced the A-L placeholders with known Clan Lord zodiac entities.
+# Note: The exact calendar order needs to be arranged based on in-game observation.
+ZODIAC_SIGNS = [
+    "Ancients", "Centaur", "Fox", "Rat",
+    "Rooster", "Runkee", "Shredder", "Cat",
+    "Healer", "Mystic", "Orcipus the Pig", "Warrior",
+]
+
+MOON_PHASE_NAMES = [
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+]
+
+@dataclass
+class CLTimeStruct:
+    ic_seconds: int
+    ic_day: int
+    ic_hour: int
+    ic_minute: int
+    ic_second: int
+    year: int
+    day_of_year: int
+    season_index: int
+    season_day: int
+    weekday_index: int
+    lunar_day: int
+    zodiac_day: int
+    zodiac_index: int
+
+    @property
+    def season_name(self) -> str:
+        return SEASONS[self.season_index]
+
+    @property
+    def weekday_name(self) -> str:
+        return WEEKDAYS[self.weekday_index]
+
+    @property
+    def zodiac_name(self) -> str:
+        return ZODIAC_SIGNS[self.zodiac_index]
+
+    @property
+    def moon_phase_name(self) -> str:
+        idx = (self.lunar_day * len(MOON_PHASE_NAMES)) // IC_MOON_CYCLE_DAYS
+        return MOON_PHASE_NAMES[idx]
+
+
+def _to_unix(dt_or_unix) -> float:
+    if isinstance(dt_or_unix, (int, float)):
+        return float(dt_or_unix)
+    if isinstance(dt_or_unix, datetime):
+        return dt_or_unix.astimezone(timezone.utc).timestamp()
+    raise TypeError("real_to_cl expects datetime or unix timestamp")
+
+
+def real_to_cl(dt_or_unix) -> CLTimeStruct:
+    unix_time = _to_unix(dt_or_unix)
+
+    # Accurate Puddleby time conversion[cite: 1]
+    ic_seconds_total = unix_time * IC_SPEED_MULTIPLIER + IC_BASE_OFFSET
+
+    # Year calculation starting from base year 411[cite: 1]
+    year = int(ic_seconds_total / IC_SECONDS_PER_YEAR) + IC_BASE_YEAR
+
+    # Remaining seconds in the current year[cite: 1]
+    seconds_in_year = ic_seconds_total - (year - IC_BASE_YEAR) * IC_SECONDS_PER_YEAR
+
+    # Day of the year (0-indexed internally initially)[cite: 1]
+    day_of_year = int(seconds_in_year / IC_SECONDS_PER_DAY)
+
+    # Remaining seconds in the day[cite: 1]
+    seconds_in_day = seconds_in_year - (day_of_year * IC_SECONDS_PER_DAY)
+
+    ic_hour = int(seconds_in_day / 3600.0)
+    seconds_in_hour = seconds_in_day - (ic_hour * 3600.0)
+    ic_minute = int(seconds_in_hour / 60.0)
+    ic_second = int(seconds_in_hour - (ic_minute * 60.0))
+
+    # Weekday calculation[cite: 1]
+    weekday_index = int(ic_seconds_total / IC_SECONDS_PER_DAY) % 7
+
+    # If day_of_year is 0, it wraps around to the last day of the previous year[cite: 1]
+    if day_of_year == 0:
+        day_of_year_out = 360
+        season_day = 90
+        year_out = year - 1
+        season_index = 3
+    else:
+        day_of_year_out = day_of_year
+        season_day = (day_of_year - 1) % IC_DAYS_PER_SEASON + 1
+        season_index = (day_of_year - 1) // IC_DAYS_PER_SEASON
+        year_out = year
+
+    # Total IC days passed (useful for zodiac/moon phases)
+    ic_day = int(ic_seconds_total / IC_SECONDS_PER_DAY)
+
+    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
+    zodiac_day = ic_day % IC_ZODIAC_SIGN_DAYS
+    zodiac_index = (ic_day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT
+
+    return CLTimeStruct(
+        ic_seconds=int(ic_seconds_total),
+        ic_day=ic_day,
+        ic_hour=ic_hour,
+        ic_minute=ic_minute,
+        ic_second=ic_second,
+        year=year_out,
+        day_of_year=day_of_year_out - 1, # 0-indexed for external formatting parity
+        season_index=season_index,
+        season_day=season_day - 1,       # 0-indexed for external formatting parity
+        weekday_index=weekday_index,
+        lunar_day=lunar_day,
+        zodiac_day=zodiac_day,
+        zodiac_index=zodiac_index,
+    )
+
+
+def cl_to_real(ic_day: int, hour: int = 0, minute: int = 0, second: int = 0) -> datetime:
+    ic_seconds_total = ic_day * IC_SECONDS_PER_DAY + hour * 3600 + minute * 60 + second
+    # Reverse the exact logic
+    real_seconds = (ic_seconds_total - IC_BASE_OFFSET) / IC_SPEED_MULTIPLIER
+    return datetime.fromtimestamp(real_seconds, tz=timezone.utc)
+
+
+def moon_phase_for_day(ic_day: int) -> Tuple[int, str]:
+    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
+    idx = (lunar_day * len(MOON_PHASE_NAMES)) // IC_MOON_CYCLE_DAYS
+    return lunar_day, MOON_PHASE_NAMES[idx]
+
+
+def zodiac_for_day(ic_day: int) -> Tuple[str, int, int]:
+    zodiac_day = ic_day % IC_ZODIAC_SIGN_DAYS
+    zodiac_index = (ic_day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT
+    sign = ZODIAC_SIGNS[zodiac_index]
+    days_until_next = IC_ZODIAC_SIGN_DAYS - zodiac_day
+    return sign, zodiac_day, days_until_next
+
+
+def dawn_dusk_for_day(ic_day: int) -> Tuple[datetime, datetime]:
+    sunrise = cl_to_real(ic_day, 6, 0, 0)
+    sunset = cl_to_real(ic_day, 18, 0, 0)
+    return sunrise, sunset
+
+
+# -----------------------------
+# Ephemeris
+# -----------------------------
+# Moon phase and zodiac sign are plain modular arithmetic on the IC day, so
+# the next occurrence of anything is a subtraction, not a day-by-day search.
+# A moon phase covers the lunar days whose phase index is that phase: Full
+# Moon is lunar days 14-17, New Moon 0-3.
+
+def phase_lunar_days(phase_name: str) -> range:
+    """The lunar days (0-27) of a moon phase."""
+    idx = MOON_PHASE_NAMES.index(phase_name)
+    n = len(MOON_PHASE_NAMES)
+    first = -(-idx * IC_MOON_CYCLE_DAYS // n)
+    last = -(-(idx + 1) * IC_MOON_CYCLE_DAYS // n)
+    return range(first, last)
+
+
+def next_phase_days(ic_day: int, phase_name: str, count: int = 1):
+    """
+    The IC days of the next count moons of a phase: the first is ic_day
+    itself if the phase is on then, each later one is its first day.
+    """
+    lunar = phase_lunar_days(phase_name)
+    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
+    if lunar_day in lunar:
+        first = ic_day
+        nxt = ic_day - lunar_day + lunar.start + IC_MOON_CYCLE_DAYS
+        return [first] + [nxt + i * IC_MOON_CYCLE_DAYS for i in range(count - 1)]
+    first = ic_day + (lunar.start - lunar_day) % IC_MOON_CYCLE_DAYS
+    return [first + i * IC_MOON_CYCLE_DAYS for i in range(count)]
+
+
+def day_span(ic_day: int) -> Tuple[datetime, datetime, datetime]:
+    """Real start, noon and end (last tick, 23:59:40) of an IC day."""
+    return (cl_to_real(ic_day, 0, 0, 0), cl_to_real(ic_day, 12, 0, 0),
+            cl_to_real(ic_day, 23, 59, 40))
+
+
+def next_moons(ic_day: int, phase_name: str = "Full Moon", count: int = 1):
+    """[(ic_day, start, noon, end)] of the next count moons of a phase."""
+    return [(d, *day_span(d)) for d in next_phase_days(ic_day, phase_name, count)]
+
+
+def next_full_moons(ic_day: int, count: int = 1):
+    return next_moons(ic_day, "Full Moon", count)
+
+
+def next_new_moons(ic_day: int, count: int = 1):
+    return next_moons(ic_day, "New Moon", count)
+
+
+def next_full_moon(ic_day: int, search_days: int = IC_DAYS_PER_YEAR * 3):
+    day, start, noon, end = next_full_moons(ic_day)[0]
+    if day - ic_day >= search_days:
+        return None, None, None, None
+    return day, start, noon, end
+
+
+def next_zodiac_changes(ic_day: int, count: int = 1):
+    """[(ic_day, sign, real start)] of the next count days a new sign rises."""
+    first = ic_day - ic_day % IC_ZODIAC_SIGN_DAYS + IC_ZODIAC_SIGN_DAYS
+    changes = []
+    for i in range(count):
+        day = first + i * IC_ZODIAC_SIGN_DAYS
+        sign = ZODIAC_SIGNS[(day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT]
+        changes.append((day, sign, cl_to_real(day)))
+    return changes
+
+
+def next_ic_tick(unix_time: float, ic_seconds: int = 60) -> float:
+    """
+    Unix time the IC clock next reaches a whole multiple of ic_seconds
+    (60: the next IC minute, IC_SECONDS_PER_DAY: the next IC day).
+    """
+    total = unix_time * IC_SPEED_MULTIPLIER + IC_BASE_OFFSET
+    tick = (total // ic_seconds + 1) * ic_seconds
+    return (tick - IC_BASE_OFFSET) / IC_SPEED_MULTIPLIER
+
+
+def dawn_dusk_times(ic_day: int, count: int = 1):
+    """[(sunrise, sunset)] for count IC days from ic_day."""
+    return [dawn_dusk_for_day(ic_day + i) for i in range(count)]
+
+
+# -----------------------------
+# Batch conversion
+# -----------------------------
+# real_to_cl() for many timestamps at once, as columns named like the
+# CLTimeStruct fields plus "moon_phase_index" (into MOON_PHASE_NAMES). With
+# NumPy installed the columns are int64 arrays computed in one pass each;
+# without it they are lists. The arithmetic is real_to_cl()'s, so every
+# row matches what real_to_cl() gives for that timestamp.
+
+CL_COLUMNS = (
+    "ic_seconds", "ic_day", "ic_hour", "ic_minute", "ic_second", "year",
+    "day_of_year", "season_index", "season_day", "weekday_index",
+    "lunar_day", "zodiac_day", "zodiac_index", "moon_phase_index",
+)
+
+
+def real_to_cl_batch(unix_times) -> dict:
+    """{column: values} for a sequence or array of Unix timestamps."""
+    if np is not None:
+        return _real_to_cl_numpy(np.asarray(unix_times, dtype=np.float64))
+    return _real_to_cl_lists([float(t) for t in unix_times])
+
+
+def cl_to_real_batch(ic_days, hours=0, minutes=0, seconds=0):
+    """
+    cl_to_real() for many IC times at once, as Unix timestamps rather than
+    datetimes. hours, minutes and seconds may be sequences or single values.
+    """
+    if np is not None:
+        total = (np.asarray(ic_days, dtype=np.float64) * IC_SECONDS_PER_DAY
+                 + np.asarray(hours) * 3600 + np.asarray(minutes) * 60
+                 + np.asarray(seconds))
+        return (total - IC_BASE_OFFSET) / IC_SPEED_MULTIPLIER
+    columns = [ic_days, hours, minutes, seconds]
+    n = len(ic_days)
+    columns = [c if hasattr(c, "__len__") else [c] * n for c in columns]
+    return [
+        (d * IC_SECONDS_PER_DAY + h * 3600 + m * 60 + sec - IC_BASE_OFFSET) / IC_SPEED_MULTIPLIER
+        for d, h, m, sec in zip(*columns)
+    ]
+
+
+def _real_to_cl_numpy(unix):
+    total = unix * IC_SPEED_MULTIPLIER + IC_BASE_OFFSET
+    year = np.trunc(total / IC_SECONDS_PER_YEAR).astype(np.int64) + IC_BASE_YEAR
+    in_year = total - (year - IC_BASE_YEAR) * IC_SECONDS_PER_YEAR
+    day = np.trunc(in_year / IC_SECONDS_PER_DAY).astype(np.int64)
+    in_day = in_year - day * IC_SECONDS_PER_DAY
+    hour = np.trunc(in_day / 3600.0).astype(np.int64)
+    in_hour = in_day - hour * 3600.0
+    minute = np.trunc(in_hour / 60.0).astype(np.int64)
+    ic_day = np.trunc(total / IC_SECONDS_PER_DAY).astype(np.int64)
+    # day 0 of a year is the last day of the one before
+    day_of_year = np.where(day == 0, IC_DAYS_PER_YEAR - 1, day - 1)
+    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
+    return {
+        "ic_seconds": np.trunc(total).astype(np.int64),
+        "ic_day": ic_day,
+        "ic_hour": hour,
+        "ic_minute": minute,
+        "ic_second": np.trunc(in_hour - minute * 60.0).astype(np.int64),
+        "year": year - (day == 0),
+        "day_of_year": day_of_year,
+        "season_index": np.where(day == 0, 3, (day - 1) // IC_DAYS_PER_SEASON),
+        "season_day": (day - 1) % IC_DAYS_PER_SEASON,
+        "weekday_index": ic_day % IC_DAYS_PER_WEEK,
+        "lunar_day": lunar_day,
+        "zodiac_day": ic_day % IC_ZODIAC_SIGN_DAYS,
+        "zodiac_index": (ic_day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT,
+        "moon_phase_index": lunar_day * len(MOON_PHASE_NAMES) // IC_MOON_CYCLE_DAYS,
+    }
+
+
+def _real_to_cl_lists(unix):
+    total = [t * IC_SPEED_MULTIPLIER + IC_BASE_OFFSET for t in unix]
+    year = [int(t / IC_SECONDS_PER_YEAR) + IC_BASE_YEAR for t in total]
+    in_year = [t - (y - IC_BASE_YEAR) * IC_SECONDS_PER_YEAR for t, y in zip(total, year)]
+    day = [int(t / IC_SECONDS_PER_DAY) for t in in_year]
+    in_day = [t - d * IC_SECONDS_PER_DAY for t, d in zip(in_year, day)]
+    hour = [int(t / 3600.0) for t in in_day]
+    in_hour = [t - h * 3600.0 for t, h in zip(in_day, hour)]
+    minute = [int(t / 60.0) for t in in_hour]
+    ic_day = [int(t / IC_SECONDS_PER_DAY) for t in total]
+    day_of_year = [d - 1 if d else IC_DAYS_PER_YEAR - 1 for d in day]
+    lunar_day = [d % IC_MOON_CYCLE_DAYS for d in ic_day]
+    phases = len(MOON_PHASE_NAMES)
+    return {
+        "ic_seconds": [int(t) for t in total],
+        "ic_day": ic_day,
+        "ic_hour": hour,
+        "ic_minute": minute,
+        "ic_second": [int(t - m * 60.0) for t, m in zip(in_hour, minute)],
+        "year": [y - (d == 0) for y, d in zip(year, day)],
+        "day_of_year": day_of_year,
+        "season_index": [(d - 1) // IC_DAYS_PER_SEASON if d else 3 for d in day],
+        "season_day": [(d - 1) % IC_DAYS_PER_SEASON for d in day],
+        "weekday_index": [d % IC_DAYS_PER_WEEK for d in ic_day],
+        "lunar_day": lunar_day,
+        "zodiac_day": [d % IC_ZODIAC_SIGN_DAYS for d in ic_day],
+        "zodiac_index": [(d // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT for d in ic_day],
+        "moon_phase_index": [d * phases // IC_MOON_CYCLE_DAYS for d in lunar_day],
+    }
+
+
+# -----------------------------
+# Calendar table
+# -----------------------------
+# One row per IC day for CALENDAR_YEARS years from IC_BASE_YEAR: real start
+# of the day and its year, season, weekday, moon and zodiac fields, as
+# real_to_cl() gives them during that day. It is built once, written to
+# CALENDAR_FILE column by column and memory-mapped on later starts; a file
+# built with other constants is rebuilt. If it cannot be written the table
+# is kept in memory.
+#
+# Day N of a year (1-360) is IC day (year - IC_BASE_YEAR) * 360 + N: day
+# 360 is day 0 of the next IC year, as real_to_cl() counts it.
+
+CALENDAR_FILE = "cltime_calendar.bin"
+CALENDAR_YEARS = 600
+_CALENDAR_MAGIC = b"CLCAL\x00\x00\x01"
+_CALENDAR_HEADER = struct.Struct("<8sddqq")  # magic, multiplier, offset, first day, days
+_CALENDAR_COLUMNS = (
+    # (name, array typecode); "start" has one extra row: the end of the last day
+    ("start", "d"), ("year", "H"), ("day_of_year", "H"),
+    ("season_index", "B"), ("season_day", "B"), ("weekday_index", "B"),
+    ("lunar_day", "B"), ("moon_phase_index", "B"),
+    ("zodiac_index", "B"), ("zodiac_day", "B"),
+)
+
+CalendarDay = namedtuple("CalendarDay", (
+    "ic_day", "start", "end", "year", "day_of_year", "season_index", "season_day",
+    "weekday_index", "lunar_day", "moon_phase_index", "zodiac_index", "zodiac_day",
+))
+
+
+def ic_day_for(year: int, day_of_year: int) -> int:
+    """IC day of day_of_year (1-360) of a year as real_to_cl() numbers them."""
+    return (year - IC_BASE_YEAR) * IC_DAYS_PER_YEAR + day_of_year
+
+
+def _build_calendar(first_day, days):
+    """The table file's bytes."""
+    starts = cl_to_real_batch(range(first_day, first_day + days + 1))
+    noons = cl_to_real_batch(range(first_day, first_day + days), 12)
+    cols = real_to_cl_batch(noons)
+    parts = [_CALENDAR_HEADER.pack(_CALENDAR_MAGIC, IC_SPEED_MULTIPLIER, IC_BASE_OFFSET,
+                                   first_day, days)]
+    for name, code in _CALENDAR_COLUMNS:
+        values = starts if name == "start" else cols[name]
+        column = array.array(code, map(float if code == "d" else int, values))
+        data = column.tobytes()
+        parts.append(data + b"\x00" * (-len(data) % 8))  # keep columns 8-aligned
+    return b"".join(parts)
+
+
+class CalendarTable:
+    """The calendar table (see above). Rows are looked up by IC day."""
+
+    def __init__(self, path=CALENDAR_FILE, first_day=0,
+                 days=CALENDAR_YEARS * IC_DAYS_PER_YEAR):
+        self.first_day = first_day
+        self.days = days
+        self._buf = self._load(path) or self._create(path)
+        view = memoryview(self._buf)
+        offset = _CALENDAR_HEADER.size
+        self.columns = {}
+        for name, code in _CALENDAR_COLUMNS:
+            n = days + 1 if name == "start" else days
+            size = n * array.array(code).itemsize
+            self.columns[name] = view[offset:offset + size].cast(code)
+            offset += size + (-size % 8)
+
+    def _load(self, path):
+        try:
+            with open(path, "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if buf[:_CALENDAR_HEADER.size] == self._header():
+            return buf
+        buf.close()
+        return None
+
+    def _create(self, path):
+        data = _build_calendar(self.first_day, self.days)
+        try:
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            return data
+        return self._load(path) or data
+
+    def _header(self):
+        return _CALENDAR_HEADER.pack(_CALENDAR_MAGIC, IC_SPEED_MULTIPLIER, IC_BASE_OFFSET,
+                                     self.first_day, self.days)
+
+    def __contains__(self, ic_day):
+        return self.first_day <= ic_day < self.first_day + self.days
+
+    def start(self, ic_day: int) -> float:
+        """Unix time the IC day starts."""
+        if ic_day not in self:
+            return cl_to_real(ic_day).timestamp()
+        return self.columns["start"][ic_day - self.first_day]
+
+    def real_time(self, ic_day: int, hour: int = 0, minute: int = 0,
+                  second: int = 0) -> datetime:
+        """cl_to_real() through the table."""
+        elapsed = (hour * 3600 + minute * 60 + second) / IC_SPEED_MULTIPLIER
+        return datetime.fromtimestamp(self.start(ic_day) + elapsed, tz=timezone.utc)
+
+    def day(self, ic_day: int) -> CalendarDay:
+        if ic_day not in self:
+            return _calendar_day(ic_day)
+        i = ic_day - self.first_day
+        c = self.columns
+        return CalendarDay(
+            ic_day, c["start"][i], c["start"][i + 1], c["year"][i], c["day_of_year"][i],
+            c["season_index"][i], c["season_day"][i], c["weekday_index"][i],
+            c["lunar_day"][i], c["moon_phase_index"][i],
+            c["zodiac_index"][i], c["zodiac_day"][i],
+        )
+
+    def year(self, year: int):
+        """CalendarDay rows of days 1-360 of a year."""
+        first = ic_day_for(year, 1)
+        return [self.day(d) for d in range(first, first + IC_DAYS_PER_YEAR)]
+
+
+def _calendar_day(ic_day):
+    """A CalendarDay computed directly, for days outside the table."""
+    start = cl_to_real_batch([ic_day, ic_day + 1])
+    cols = real_to_cl_batch(cl_to_real_batch([ic_day], 12))
+    return CalendarDay(ic_day, start[0], start[1], *(
+        int(cols[name][0]) for name, _ in _CALENDAR_COLUMNS[1:]
+    ))
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+def get_calendar() -> CalendarTable:
+    """The shared calendar table, opened (or built) on first use."""
+    global _calendar
+    with _calendar_lock:
+        if _calendar is None:
+            _calendar = CalendarTable()
+    return _calendar
+
+
+def fmt_real(dt: datetime) -> str:
+    return dt.astimezone().strftime("%a %b %d %H:%M:%S %Y")
+
+
+def fmt_cl_header(cl: CLTimeStruct) -> str:
+    hour_12 = ((cl.ic_hour + 11) % 12) + 1
+    ampm = "AM" if cl.ic_hour < 12 else "PM"
+    return (
+        f"{cl.weekday_name} {hour_12}:{cl.ic_minute:02d}:{cl.ic_second:02d} {ampm}, "
+        f"day {cl.season_day + 1} of {cl.season_name}, "
+        f"day {cl.day_of_year + 1} of the year {cl.year}"
+    )
+
+
+def cl_now() -> CLTimeStruct:
+    return real_to_cl(datetime.now(timezone.utc))
+
+
+if __name__ == "__main__":
+    now_cl = cl_now()
+    print("Current Puddleby Time:")
+    print(fmt_cl_header(now_cl))
+    print(f"Zodiac: {now_cl.zodiac_name}")
+    print(f"Moon: {now_cl.moon_phase_name}")
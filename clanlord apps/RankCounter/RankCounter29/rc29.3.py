@@ -2,7 +2,6 @@ from __future__ import annotations
 import os
 import sys
 import traceback
-import codecs
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter import font as tkfont
@@ -12,10 +11,33 @@ import threading
 import json
 import time
 import csv
+import multiprocessing
+import importlib.machinery
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 from typing import Tuple
 
+from rcengine import (
+    kills_to_next, get_process_pool, LogWatcher,
+    load_rules, LogIndex,
+    aggregate_folder, get_min_time_from_filter, summarize_coin_events,
+    CoinIndex, ScanReducer, CheckpointStore, LiveScan,
+)
+from cltime import (
+    IC_DAYS_PER_SEASON, SEASONS,
+    real_to_cl, cl_to_real, moon_phase_for_day, zodiac_for_day, dawn_dusk_times,
+    next_full_moon, fmt_real, fmt_cl_header, cl_now, get_calendar, ic_day_for,
+    next_ic_tick,
+)
+
+if __name__ == "__main__":
+    # Frozen (PyInstaller) builds: a parse worker started from the exe runs
+    # its task here and exits instead of opening another window.
+    multiprocessing.freeze_support()
+    # Parse workers only need rcengine. A module-style spec stops spawned
+    # workers from re-running this script, GUI and all.
+    __spec__ = importlib.machinery.ModuleSpec("__main__", None)
+
 # ----------------------------------------------------------------------
 # ---------------------- GLOBAL DATA / CONSTANTS -----------------------
 # ----------------------------------------------------------------------
@@ -51,96 +73,8 @@ def _get_stage_index_for_template(template_text: str) -> int:
             return i
     return 0
 
-kills_to_next = {
-    "almost nothing left to learn about the movements of the": {1:4,2:2,3:2,4:2,5:2},
-    "almost nothing left to learn about the ways of the": {1:4,2:2,3:2,4:2,5:2},
-    "almost nothing left to learn about the essence of the": {1:4,2:2,3:2,4:2,5:2},
-
-    "a few things to learn about the movements of the": {1:3,2:3,3:3,4:3,5:3},
-    "a few things to learn about the ways of the": {1:3,2:3,3:3,4:3,5:3},
-    "a few things to learn about the essence of the": {1:3,2:3,3:3,4:3,5:3},
-
-    "more than a few things to learn about the ways of the": {1:7,2:7,3:7,4:7,5:8},
-    "more than a few things to learn about the essence of the": {1:7,2:7,3:7,4:7,5:8},
-
-    "some things to learn about the ways of the": {1:12,2:12,3:12,4:12,5:12,6:12,7:9},
-    "some things to learn about the essence of the": {1:12,2:12,3:12,4:12,5:12,6:12,7:9},
-
-    "many things to learn about the ways of the": {1:20,2:20,3:20,4:20,5:20,6:20,7:16},
-    "many things to learn about the essence of the": {1:20,2:20,3:20,4:20,5:20,6:20,7:16},
-
-    "much to learn about the ways of the": {1:30,2:30,3:30,4:30,5:30,6:30,7:20},
-    "much to learn about the essence of the": {1:30,2:30,3:30,4:30,5:30,6:30,7:20},
-
-    "a lot to learn about the ways of the": {1:100,2:30,3:30,4:30,5:30},
-    "a lot to learn about the essence of the": {1:100,2:30,3:30,4:30,5:30},
-
-    "a vast amount to learn about the ways of the": {1:100,2:100,3:100,4:100,5:100,6:100},
-    "a vast amount to learn about the essence of the": {1:100,2:100,3:100,4:100,5:100,6:100}
-}
-
-kills_table = [
-    (1,  "almost nothing", 2),
-    (2,  "almost nothing", 2),
-    (3,  "almost nothing", 2),
-    (4,  "almost nothing", 2),
-    (5,  "almost nothing", 4),
-
-    (6,  "a few", 3),
-    (7,  "a few", 3),
-    (8,  "a few", 3),
-    (9,  "a few", 3),
-    (10, "a few", 3),
-
-    (11, "more than a few", 8),
-    (12, "more than a few", 7),
-    (13, "more than a few", 7),
-    (14, "more than a few", 7),
-    (15, "more than a few", 7),
-
-    (16, "some things", 9),
-    (17, "some things", 12),
-    (18, "some things", 12),
-    (19, "some things", 12),
-    (20, "some things", 12),
-    (21, "some things", 12),
-    (23, "some things", 12),
-
-    (24, "many things", 16),
-    (25, "many things", 20),
-    (26, "many things", 20),
-    (27, "many things", 20),
-    (28, "many things", 20),
-    (29, "many things", 20),
-    (30, "many things", 20),
-
-    (31, "much to learn", 20),
-    (32, "much to learn", 30),
-    (33, "much to learn", 30),
-    (34, "much to learn", 30),
-    (35, "much to learn", 30),
-    (36, "much to learn", 30),
-    (37, "much to learn", 30),
-
-    (38, "a lot to learn", 30),
-    (39, "a lot to learn", 30),
-    (40, "a lot to learn", 30),
-    (41, "a lot to learn", 30),
-    (42, "a lot to learn", 100),
-
-    (43, "a vast amount", 100),
-    (44, "a vast amount", 100),
-    (45, "a vast amount", 100),
-    (46, "a vast amount", 100),
-    (47, "a vast amount", 100),
-    (48, "a vast amount", 100),
-]
-
-phrase_to_msgnums = {}
-for msg_num, phrase_group, _kills_required in kills_table:
-    phrase_to_msgnums.setdefault(phrase_group, []).append(msg_num)
-
 CHAR_FILE = "characters.json"
+
 character_ranks = {}
 
 def resource_path(relative_path):
@@ -159,18 +93,6 @@ def exception_hook(exctype, value, tb):
 
 sys.excepthook = exception_hook
 
-# -- Smart File Reader --------------------------------------------------------
-
-def smart_read_file(path, encodings=('utf-8', 'mac_roman')):
-    last_exc = None
-    for enc in encodings:
-        try:
-            with codecs.open(path, 'r', encoding=enc) as f:
-                return f.read()
-        except UnicodeDecodeError as e:
-            last_exc = e
-    raise last_exc
-
 # -- Paths & Globals ---------------------------------------------------------
 
 words_file_path       = resource_path('rankmessages.txt')
@@ -183,8 +105,18 @@ character_folders  = {}
 character_ranks    = {}     # Stores rank data
 character_creatures= {}     # Stores creature data
 character_ignored  = {}     # Stores ignored creatures
+character_checkpoints = {}  # Per-file scan checkpoints, per folder (checkpoints.db)
+checkpoint_store   = CheckpointStore()
 current_folder_name= None
 executor           = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+scan_serial        = 0      # Bumped per scan
+latest_scans       = {}     # character -> serial of their newest scan
+live_watcher       = None   # LogWatcher while live mode is on
+live_serial        = 0      # Bumped whenever live mode starts or stops
+live_scan          = None   # LiveScan of the live character, once built
+live_pending       = {}     # (folder, path) reported while an update ran
+live_busy          = False  # A live update is running on a worker
+live_saved         = {}     # folder -> checkpoints live mode last saved
 
 moon_icons = {
     "New Moon": "img/nm.gif",
@@ -197,6 +129,16 @@ moon_icons = {
 merged_skinned = 0
 merged_share = 0
 merged_coin_events = []
+coin_indexes = {}  # character -> CoinIndex of every coin, for the time filter
+
+# characters.json is written by one worker, in order, so the Tk thread only
+# builds the text. Checkpoints are kept apart in checkpoints.db (see
+# rcengine.CheckpointStore) and saved by the scans themselves; live mode's
+# saves and dropped checkpoints go through the same worker, so they land in
+# the order they were made.
+save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+SAVE_DELAY_MS = 2000  # live mode saves at most this often
+save_after_id = None
 
 def save_characters():
     data = {}
@@ -209,8 +151,11 @@ def save_characters():
             "kills_table": kills_to_next,
             "last_scan_time": time.time(),
         }
+    save_executor.submit(write_characters, json.dumps(data, indent=4))
+
+def write_characters(text):
     with open(CHAR_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+        f.write(text)
 
 def load_characters():
     if not os.path.exists(CHAR_FILE):
@@ -219,28 +164,20 @@ def load_characters():
         with open(CHAR_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
 
+        character_checkpoints.update(checkpoint_store.load())
         for name, info in data.items():
             character_folders[name] = info.get("folders", [])
             character_ranks[name] = info.get("ranks", {})
             character_creatures[name] = info.get("creatures", {})
             character_ignored[name] = info.get("ignored", [])
+            if info.get("checkpoints") and name not in character_checkpoints:
+                # saved by an older version: move them to checkpoints.db
+                for folder, checkpoints in info["checkpoints"].items():
+                    checkpoint_store.save_folder(name, folder, checkpoints)
+                character_checkpoints[name] = info["checkpoints"]
     except Exception as e:
         print(f"Error loading JSON: {e}")
 
-# -- Shared Exclusion Helper -------------------------------------------------
-
-def is_excluded(line: str) -> bool:
-    """Return True if the line should be skipped."""
-    low = line.lower().strip()
-    excluded = ["says,", "growls,", "yells,", "ponders,", "thinks,"]
-    if any(exc in low for exc in excluded):
-        return True
-    if low.startswith("(") and low.endswith(")"):
-        return True
-    if "):" in low:
-        return True
-    return False
-
 def search_word_in_file(file_path, word):
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -271,539 +208,20 @@ def open_file_with_default_app(file_path):
     except Exception as e:
         messagebox.showerror("Error", f"Failed to open file: {e}")
 
-def get_min_time_from_filter(filter_value):
-    now = time.time()
-    mapping = {
-        "Last 5 minutes": 5 * 60,
-        "Last 10 minutes": 10 * 60,
-        "Last 30 minutes": 30 * 60,
-        "Last 1 hour": 60 * 60,
-        "Last 3 hours": 3 * 60 * 60,
-        "Last 6 hours": 6 * 60 * 60,
-        "Last 12 hours": 12 * 60 * 60,
-        "Last 24 hours": 24 * 60 * 60
-    }
-    if filter_value in mapping:
-        return now - mapping[filter_value]
-    return None  # "All logs" or unknown
-
-# -- File / Folder Readers ---------------------------------------------------
-
-def read_words_from_file(file_path):
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    lines = [line.strip() for line in smart_read_file(file_path).splitlines()]
-    return [l for l in lines if l]
-
-def read_text_files(folder_path):
-    texts = []
-    files = sorted(
-        os.listdir(folder_path),
-        key=lambda f: os.path.getmtime(os.path.join(folder_path, f))
-    )
-
-    for fname in files:
-        fpath = os.path.join(folder_path, fname)
-        if not os.path.isfile(fpath):
-            continue
-
-        try:
-            content = smart_read_file(fpath)
-            file_time = os.path.getmtime(fpath)
-            texts.append((content, file_time))
-        except UnicodeDecodeError:
-            continue
-
-    return texts
-
-def count_word_occurrences(texts, words):
-    counts = {w: 0 for w in words}
-    for content, _ in texts:
-        for line in content.splitlines():
-            if is_excluded(line):
-                continue
-            for w in words:
-                counts[w] += line.count(w)
-    return counts
-
-# -----------------------------
-# Clan Lord Time Engine (Updated)
-# -----------------------------
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Tuple
-
-# The game time multiplier is exactly 45.0 / 11.0 (time passes faster in-game)[cite: 1]
-IC_SPEED_MULTIPLIER = 45.0 / 11.0
-
-# Base Puddleby Time epoch offset used internally by the client[cite: 1]
-IC_BASE_OFFSET = 24371635.0
-IC_BASE_YEAR = 411  # The base calculation starts at the year 411[cite: 1]
-
-IC_SECONDS_PER_DAY = 86400
-IC_SECONDS_PER_YEAR = 31104000  # 360 days * 86,400 seconds[cite: 1]
-IC_DAYS_PER_YEAR = 360
-IC_DAYS_PER_SEASON = 90
-IC_DAYS_PER_WEEK = 7
-IC_MOON_CYCLE_DAYS = 28
-IC_ZODIAC_SIGN_DAYS = 30
-IC_ZODIAC_SIGNS_COUNT = 12
-
-SEASONS = ["Spring", "Summer", "Autumn", "Winter"]
-WEEKDAYS = ["Sombdi", "Gradi", "Tridi", "Quartidi", "Quintidi", "Sixdi", "Sevdi"]
-
-# Replaced the A-L placeholders with known Clan Lord zodiac entities.
-# Note: The exact calendar order needs to be arranged based on in-game observation.
-ZODIAC_SIGNS = [
-    "Ancients", "Centaur", "Fox", "Rat",
-    "Rooster", "Runkee", "Shredder", "Cat",
-    "Healer", "Mystic", "Orcipus the Pig", "Warrior",
-]
-
-MOON_PHASE_NAMES = [
-    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
-    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
-]
-
-@dataclass
-class CLTimeStruct:
-    ic_seconds: int
-    ic_day: int
-    ic_hour: int
-    ic_minute: int
-    ic_second: int
-    year: int
-    day_of_year: int
-    season_index: int
-    season_day: int
-    weekday_index: int
-    lunar_day: int
-    zodiac_day: int
-    zodiac_index: int
-
-    @property
-    def season_name(self) -> str:
-        return SEASONS[self.season_index]
-
-    @property
-    def weekday_name(self) -> str:
-        return WEEKDAYS[self.weekday_index]
-
-    @property
-    def zodiac_name(self) -> str:
-        return ZODIAC_SIGNS[self.zodiac_index]
-
-    @property
-    def moon_phase_name(self) -> str:
-        idx = (self.lunar_day * len(MOON_PHASE_NAMES)) // IC_MOON_CYCLE_DAYS
-        return MOON_PHASE_NAMES[idx]
-
-
-def _to_unix(dt_or_unix) -> float:
-    if isinstance(dt_or_unix, (int, float)):
-        return float(dt_or_unix)
-    if isinstance(dt_or_unix, datetime):
-        return dt_or_unix.astimezone(timezone.utc).timestamp()
-    raise TypeError("real_to_cl expects datetime or unix timestamp")
-
-
-def real_to_cl(dt_or_unix) -> CLTimeStruct:
-    unix_time = _to_unix(dt_or_unix)
-
-    # Accurate Puddleby time conversion[cite: 1]
-    ic_seconds_total = unix_time * IC_SPEED_MULTIPLIER + IC_BASE_OFFSET
-
-    # Year calculation starting from base year 411[cite: 1]
-    year = int(ic_seconds_total / IC_SECONDS_PER_YEAR) + IC_BASE_YEAR
-
-    # Remaining seconds in the current year[cite: 1]
-    seconds_in_year = ic_seconds_total - (year - IC_BASE_YEAR) * IC_SECONDS_PER_YEAR
-
-    # Day of the year (0-indexed internally initially)[cite: 1]
-    day_of_year = int(seconds_in_year / IC_SECONDS_PER_DAY)
-
-    # Remaining seconds in the day[cite: 1]
-    seconds_in_day = seconds_in_year - (day_of_year * IC_SECONDS_PER_DAY)
-
-    ic_hour = int(seconds_in_day / 3600.0)
-    seconds_in_hour = seconds_in_day - (ic_hour * 3600.0)
-    ic_minute = int(seconds_in_hour / 60.0)
-    ic_second = int(seconds_in_hour - (ic_minute * 60.0))
-
-    # Weekday calculation[cite: 1]
-    weekday_index = int(ic_seconds_total / IC_SECONDS_PER_DAY) % 7
-
-    # If day_of_year is 0, it wraps around to the last day of the previous year[cite: 1]
-    if day_of_year == 0:
-        day_of_year_out = 360
-        season_day = 90
-        year_out = year - 1
-        season_index = 3
-    else:
-        day_of_year_out = day_of_year
-        season_day = (day_of_year - 1) % IC_DAYS_PER_SEASON + 1
-        season_index = (day_of_year - 1) // IC_DAYS_PER_SEASON
-        year_out = year
-
-    # Total IC days passed (useful for zodiac/moon phases)
-    ic_day = int(ic_seconds_total / IC_SECONDS_PER_DAY)
-
-    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
-    zodiac_day = ic_day % IC_ZODIAC_SIGN_DAYS
-    zodiac_index = (ic_day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT
-
-    return CLTimeStruct(
-        ic_seconds=int(ic_seconds_total),
-        ic_day=ic_day,
-        ic_hour=ic_hour,
-        ic_minute=ic_minute,
-        ic_second=ic_second,
-        year=year_out,
-        day_of_year=day_of_year_out - 1, # 0-indexed for external formatting parity
-        season_index=season_index,
-        season_day=season_day - 1,       # 0-indexed for external formatting parity
-        weekday_index=weekday_index,
-        lunar_day=lunar_day,
-        zodiac_day=zodiac_day,
-        zodiac_index=zodiac_index,
-    )
-
-
-def cl_to_real(ic_day: int, hour: int = 0, minute: int = 0, second: int = 0) -> datetime:
-    ic_seconds_total = ic_day * IC_SECONDS_PER_DAY + hour * 3600 + minute * 60 + second
-    # Reverse the exact logic
-    real_seconds = (ic_seconds_total - IC_BASE_OFFSET) / IC_SPEED_MULTIPLIER
-    return datetime.fromtimestamp(real_seconds, tz=timezone.utc)
-
-
-def moon_phase_for_day(ic_day: int) -> Tuple[int, str]:
-    lunar_day = ic_day % IC_MOON_CYCLE_DAYS
-    idx = (lunar_day * len(MOON_PHASE_NAMES)) // IC_MOON_CYCLE_DAYS
-    return lunar_day, MOON_PHASE_NAMES[idx]
-
-
-def zodiac_for_day(ic_day: int) -> Tuple[str, int, int]:
-    zodiac_day = ic_day % IC_ZODIAC_SIGN_DAYS
-    zodiac_index = (ic_day // IC_ZODIAC_SIGN_DAYS) % IC_ZODIAC_SIGNS_COUNT
-    sign = ZODIAC_SIGNS[zodiac_index]
-    days_until_next = IC_ZODIAC_SIGN_DAYS - zodiac_day
-    return sign, zodiac_day, days_until_next
-
-
-def dawn_dusk_for_day(ic_day: int) -> Tuple[datetime, datetime]:
-    sunrise = cl_to_real(ic_day, 6, 0, 0)
-    sunset = cl_to_real(ic_day, 18, 0, 0)
-    return sunrise, sunset
-
-
-def next_full_moon(ic_day: int, search_days: int = IC_DAYS_PER_YEAR * 3):
-    for offset in range(search_days):
-        test_day = ic_day + offset
-        lunar_day, phase_name = moon_phase_for_day(test_day)
-        if phase_name == "Full Moon":
-            start = cl_to_real(test_day, 0, 0, 0)
-            noon = cl_to_real(test_day, 12, 0, 0)
-            end = cl_to_real(test_day, 23, 59, 40)
-            return test_day, start, noon, end
-    return None, None, None, None
-
-
-def fmt_real(dt: datetime) -> str:
-    return dt.astimezone().strftime("%a %b %d %H:%M:%S %Y")
-
-
-def fmt_cl_header(cl: CLTimeStruct) -> str:
-    hour_12 = ((cl.ic_hour + 11) % 12) + 1
-    ampm = "AM" if cl.ic_hour < 12 else "PM"
-    return (
-        f"{cl.weekday_name} {hour_12}:{cl.ic_minute:02d}:{cl.ic_second:02d} {ampm}, "
-        f"day {cl.season_day + 1} of {cl.season_name}, "
-        f"day {cl.day_of_year + 1} of the year {cl.year}"
-    )
-
-
-def cl_now() -> CLTimeStruct:
-    return real_to_cl(datetime.now(timezone.utc))
-
-# Example usage check for testing:
-if __name__ == "__main__":
-    now_cl = cl_now()
-    print("Current Puddleby Time:")
-    print(fmt_cl_header(now_cl))
-    print(f"Zodiac: {now_cl.zodiac_name}")
-    print(f"Moon: {now_cl.moon_phase_name}")
 # ----------------------------------------------------------------------
 # ---------------------- CORE PARSING / COUNTS ------------------------
 # ----------------------------------------------------------------------
 
 
-def count_special_lines(texts):
-    """
-    Extracts all study-related lines and returns:
-        special_occ: { trainer_clean: [entry, entry, ...] }
-        exclude: set()   (kept for compatibility)
-
-    Each entry contains:
-        phrase_group, function, timestamp, kills_left, count, display_label
-    """
-    import re
-    from datetime import datetime
-
-    special_occ = {}
-    exclude = set()
-
-    # Timestamp format: 5/10/26 8:35:19a • You have many things...
-    ts_re = re.compile(r"^(\d+/\d+/\d+ \d+:\d+:\d+[ap])\s*[•>:-]*\s*(.*)$")
-
-    # Study message regex
-    study_re = re.compile(
-        r"You have (almost nothing|a few|more than a few|some things|many things|much to learn|a lot to learn|a vast amount)"
-        r" to learn about the (movements|ways|essence) of the (.+?)\.",
-        re.IGNORECASE
-    )
-
-    # Kill message regex
-    kill_re = re.compile(
-        r"(?:you|you helped)\s+(?:slaughtered|dispatched|killed|vanquished)\s+the\s+(.+?)\.",
-        re.IGNORECASE
-    )
-
-    # Count kills per creature
-    kill_counts = {}
-    for content, _ in texts:
-        for line in content.splitlines():
-            m = kill_re.search(line)
-            if m:
-                creature = m.group(1).strip().lower()
-                kill_counts[creature] = kill_counts.get(creature, 0) + 1
-
-    # MAIN LOOP
-    for content, _ in texts:
-        for raw_line in content.splitlines():
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
-
-            # Extract timestamp + message
-            m = ts_re.match(raw_line)
-            if not m:
-                continue
-
-            ts_raw, msg = m.groups()
-
-            # Convert timestamp
-            try:
-                timestamp = datetime.strptime(ts_raw, "%m/%d/%y %I:%M:%S%p")
-            except Exception:
-                timestamp = None
-
-            low = msg.lower()
-
-            # ---------------------------------------------------------
-            # Abandon study (this is the ONLY old rule we keep)
-            # ---------------------------------------------------------
-            if "you abandon your study of the" in low:
-                m_ab = re.search(r"you abandon your study of the (.+?)\.", low)
-                if m_ab:
-                    creature = m_ab.group(1).strip().lower()
-                    special_occ.pop(creature, None)
-                continue
-
-            # ---------------------------------------------------------
-            # Study progression message
-            # ---------------------------------------------------------
-            m2 = study_re.search(msg)
-            if not m2:
-                continue
-
-            phrase_group = m2.group(1).lower()
-            function     = m2.group(2).lower()
-            creature     = m2.group(3).strip().lower()
-
-            trainer_clean = creature
-
-            # Build kills_to_next lookup key
-            kt_key = f"{phrase_group} to learn about the {function} of the"
-
-            # Determine kills_left
-            kills_done = kill_counts.get(trainer_clean, 0)
-            stage_table = kills_to_next.get(kt_key, {})
-
-            if stage_table:
-                total_required = sum(stage_table.values())
-                kills_left = max(total_required - kills_done, 0)
-            else:
-                kills_left = None
-
-            # Build display label
-            display_label = f"You have {phrase_group} to learn about the {function} of the {creature}."
-            if kills_left is not None:
-                display_label += f" — {kills_left} kills left"
-
-            # Build entry
-            entry = {
-                "phrase_group": phrase_group,
-                "function": function,
-                "timestamp": timestamp,
-                "kills_left": kills_left,
-                "count": 1,
-                "display_label": display_label,
-            }
-
-            special_occ.setdefault(trainer_clean, []).append(entry)
-
-    return special_occ, exclude
-
-# -- Coin Scanning -----------------------------------------------------------
-
-def count_coins(texts, character_name, min_time=None):
-    skinned_total = 0
-    share_total = 0
-    events = []
-
-    coin_rx = re.compile(
-        r"\*\s*(You|.+?) recover[s]? the (.+?) (?:fur|blood|mandibles), worth (\d+)c\. Your share is (\d+)c",
-        re.IGNORECASE
-    )
-
-    for content, file_time in texts:
-        if min_time and file_time < min_time:
-            continue
-
-        for line in content.splitlines():
-            m = coin_rx.search(line)
-            if not m:
-                continue
-
-            groups = m.groups()
-            if len(groups) != 4:
-                continue
-            player, monster, worth, share = groups
-            did_skin = (player == "You" or player == character_name)
-
-            worth = int(worth)
-            share = int(share)
-
-            if did_skin:
-                skinned_total += worth
-            share_total += share
-
-            events.append({
-                "monster": monster,
-                "worth": worth,
-                "share": share,
-                "skinned": did_skin,
-                "file_time": file_time
-            })
-
-    return skinned_total, share_total, events
-
 # -- Background Task ---------------------------------------------------------
 
-def scan_and_aggregate(folder_path, character_name):
-    import re
-
-    # --------------------------------------------------------------
-    # Load mapping for normal ranks
-    # --------------------------------------------------------------
-    words        = read_words_from_file(words_file_path)
-    replacements = read_words_from_file(replacement_file_path)
-
-    if len(words) != len(replacements):
-        raise ValueError(
-            f"File Alignment Error: rankmessages.txt ({len(words)} lines) and "
-            f"trainers.txt ({len(replacements)} lines) must match exactly."
-        )
-
-    mapping = dict(zip(words, replacements))
-
-    # --------------------------------------------------------------
-    # Load text logs
-    # --------------------------------------------------------------
-    texts = read_text_files(folder_path)
-    word_occ = count_word_occurrences(texts, words)
-
-    # NEW: extract study messages
-    special_occ, exclude = count_special_lines(texts)
-
-    # --------------------------------------------------------------
-    # Coin counting
-    # --------------------------------------------------------------
-    filter_value = time_filter_var.get()
-    min_time = get_min_time_from_filter(filter_value)
-    skinned, share, coin_events = count_coins(texts, character_name, min_time)
-
-    # --------------------------------------------------------------
-    # NORMAL RANKS
-    # --------------------------------------------------------------
-    normal_ranks = {}
-    for w, c in word_occ.items():
-        if c:
-            t = mapping.get(w, "Unknown")
-            if isinstance(t, str):
-                normal_ranks[t] = normal_ranks.get(t, 0) + c
-
-    # --------------------------------------------------------------
-    # SPECIAL CREATURE PROCESSING (MOST RECENT STAGE)
-    # --------------------------------------------------------------
-    latest_per_creature = {}
-
-    for trainer_clean, entries in special_occ.items():
-        if not entries:
-            continue
-
-        # Attach msg_num to each entry
-        for e in entries:
-            phrase_group = e["phrase_group"]
-            msgnums = phrase_to_msgnums.get(phrase_group)
-            if msgnums:
-                e["msg_num"] = min(msgnums)
-            else:
-                e["msg_num"] = None
-
-        # ----------------------------------------------------------
-        # Determine current stage using MOST RECENT message
-        # ----------------------------------------------------------
-        entries_sorted = sorted(
-            entries,
-            key=lambda e: (e["timestamp"] is None, e["timestamp"])
-        )
-        current_stage = entries_sorted[-1]["function"]
-
-        # Filter to only messages of the current stage
-        stage_entries = [e for e in entries if e["function"] == current_stage]
-
-        # ----------------------------------------------------------
-        # Pick the most recent message WITHIN the current stage
-        # ----------------------------------------------------------
-        stage_entries_sorted = sorted(
-            stage_entries,
-            key=lambda e: (e["timestamp"] is None, e["timestamp"])
-        )
-        best = stage_entries_sorted[-1]
-
-        latest_per_creature[trainer_clean] = best
-
-    # --------------------------------------------------------------
-    # Convert to UI format
-    # --------------------------------------------------------------
-    special_creatures = {}
-
-    for trainer_clean, e in latest_per_creature.items():
-        lbl = e["display_label"]
-        msg_num = e["msg_num"]
-        kl  = e["kills_left"]
-
-        if isinstance(kl, int):
-            kl_str = str(kl)
-        elif kl is None:
-            kl_str = ""
-        else:
-            kl_str = str(kl)
-
-        special_creatures[lbl] = (msg_num, kl_str)
-
-    return normal_ranks, special_creatures, skinned, share, coin_events, os.path.basename(folder_path)
+def scan_and_aggregate(folder_path, character_name, checkpoints=None, min_time=None):
+    # Rank phrases -> trainers (recompiled only when the files change)
+    rules = load_rules(words_file_path, replacement_file_path, special_file_path)
+    result = aggregate_folder(folder_path, character_name, rules, checkpoints,
+                              min_time, pool=get_process_pool())
+    checkpoint_store.save_folder(character_name, folder_path, result[6][1], checkpoints)
+    return result
 
 # -- Helpers for merging / parsing counts ------------------------------------
 
@@ -818,199 +236,72 @@ def parse_creature_count(count_str):
         return base, bonus
     return 0, 0
 
-def summarize_coin_events(events):
-    summary = {}
-    for ev in events:
-        monster = ev["monster"]
-        if monster not in summary:
-            summary[monster] = {
-                "total_worth": 0,
-                "total_share": 0,
-                "your_skins": 0
-            }
-        summary[monster]["total_worth"] += ev["worth"]
-        summary[monster]["total_share"] += ev["share"]
-        if ev["skinned"]:
-            summary[monster]["your_skins"] += 1
-    return summary
-
-
-
 # ----------------------------------------------------------------------
 # ------------------------- GUI / CALLBACKS ----------------------------
 # ----------------------------------------------------------------------
 
-    import traceback as _tb
-    print("DIAG: on_scan_done entered")
-    print("  merged_skinned type/value:", type(merged_skinned), repr(merged_skinned)[:200])
-    print("  merged_share type/value:", type(merged_share), repr(merged_share)[:200])
-    print("  returned skinned type/value:", type(skinned), repr(skinned)[:200])
-    print("  returned share type/value:", type(share), repr(share)[:200])
-    print("  normal_ranks sample:", list(normal_ranks.items())[:8])
-    print("  merged_counts sample:", list(merged_counts.items())[:8])
+def scan_merged(name, serial, merged, errors):
+    """ScanReducer callback, still on a worker thread: index the coins, then hand over to Tk."""
+    coin_index = CoinIndex(merged["coin_events"])
+    root.after(0, on_scan_done, name, serial, merged, coin_index, errors)
 
-def on_scan_done(fut):
-    try:
-        normal_ranks, special_creatures_data, skinned, share, coin_events, new_folder = fut.result()
-        print("DEBUG: on_scan_done special_creatures_data sample:", list(special_creatures_data.items())[:12])
-    except Exception as e:
-        import traceback
-        print("FUTURE EXCEPTION (on_scan_done):", repr(e))
-        traceback.print_exc()
-        # Also try to print the future's exception object if available
-        try:
-            exc = fut.exception()
-            if exc is not None:
-                print("fut.exception():", repr(exc))
-        except Exception:
-            pass
-        # Show the same messagebox so UI behavior is unchanged
-        messagebox.showerror("Scan Error", str(e))
-        return
 
-    global merged_counts, merged_creatures, merged_skinned, merged_share, merged_coin_events
+def on_scan_done(name, serial, merged, coin_index, errors):
+    """Publish a finished scan of all of a character's folders, one redraw per table."""
+    for folder, e in errors:
+        print(f"FUTURE EXCEPTION (on_scan_done) in {folder}:", repr(e))
+        traceback.print_exception(type(e), e, e.__traceback__)
+    if errors:
+        messagebox.showerror("Scan Error", "\n".join(str(e) for _, e in errors))
+    if serial != latest_scans.get(name):
+        return  # superseded by a scan of this character started later
+    publish_scan(name, merged, coin_index)
+    save_characters()
 
-    # Merge coin totals with diagnostics
-    try:
-        if not isinstance(skinned, int):
-            print("DIAG: skinned is not int:", repr(skinned)[:200], type(skinned))
-        if not isinstance(merged_skinned, int):
-            print("DIAG: merged_skinned is not int before add:", repr(merged_skinned)[:200], type(merged_skinned))
-        merged_skinned += skinned
-    except Exception:
-        print("FATAL: exception merging skinned")
-        _tb.print_exc()
-        raise
 
-    try:
-        if not isinstance(share, int):
-            print("DIAG: share is not int:", repr(share)[:200], type(share))
-        if not isinstance(merged_share, int):
-            print("DIAG: merged_share is not int before add:", repr(merged_share)[:200], type(merged_share))
-        merged_share += share
-    except Exception:
-        print("FATAL: exception merging share")
-        _tb.print_exc()
-        raise
-
-    # Merge detailed coin events
-    merged_coin_events.extend(coin_events)
-
-    # Merge normal ranks (defensive: log types and stack trace on unexpected types)
-    import traceback as _tb
-    for name, count in normal_ranks.items():
-        try:
-            # Print types before attempting arithmetic
-            cur_val = merged_counts.get(name, 0)
-            if not isinstance(cur_val, int) or not isinstance(count, int):
-                print("DIAGNOSTIC: about to add values for:", repr(name))
-                print("  merged_counts.get(name):", repr(cur_val), "type:", type(cur_val))
-                print("  normal_ranks[name]:", repr(count), "type:", type(count))
-                _tb.print_stack(limit=8)
-
-            # Try to coerce numeric-like strings
-            if not isinstance(count, int):
-                try:
-                    count = int(count)
-                    print("DIAGNOSTIC: coerced count to int for", repr(name), "->", count)
-                except Exception:
-                    print("DIAGNOSTIC: cannot coerce count to int, skipping:", repr(name), repr(count), type(count))
-                    continue
-
-            if not isinstance(cur_val, int):
-                print("DIAGNOSTIC: merged_counts has non-int for", repr(name), "resetting to 0 (was type: {})".format(type(cur_val)))
-                _tb.print_stack(limit=8)
-                cur_val = 0
-
-            merged_counts[name] = cur_val + count
-
-        except Exception as ex:
-            print("FATAL: exception while merging normal_ranks for", repr(name))
-            print("  count:", repr(count), "type:", type(count))
-            print("  merged_counts.get(name):", repr(merged_counts.get(name)), "type:", type(merged_counts.get(name)))
-            _tb.print_exc()
-            raise
-
-    # Merge special creatures (no arithmetic on dicts)
-    for name, count_kills in special_creatures_data.items():
-        # count_kills may be:
-        #   - tuple: (count, kills_str)
-        #   - dict:  {"count": ..., "kills": ...}
-        #   - legacy: plain string/int
-        if isinstance(count_kills, tuple):
-            count_val, kills_str = count_kills
-        elif isinstance(count_kills, dict):
-            count_val = count_kills.get("count", 0)
-            kills_str = count_kills.get("kills", "")
-        else:
-            count_val = count_kills
-            kills_str = ""
+def publish_scan(name, merged, coin_index):
+    """Make merged (see merge_scan_results()) the character's counts and show them."""
+    global merged_counts, merged_creatures, merged_skinned, merged_share, merged_coin_events
+    merged_counts = merged["ranks"]
+    merged_creatures = {
+        label: {"count": str(msg_num), "kills": str(kills)}
+        for label, (msg_num, kills) in merged["creatures"].items()
+    }
+    merged_skinned = merged["skinned"]
+    merged_share = merged["share"]
+    merged_coin_events = coin_index.events
 
-        merged_creatures[name] = {
-            "count": str(count_val),
-            "kills": str(kills_str),
-        }
+    # Save to character (copies: the merged_* dicts are cleared on selection)
+    character_ranks[name] = dict(merged_counts)
+    character_creatures[name] = dict(merged_creatures)
+    character_checkpoints.setdefault(name, {}).update(merged["checkpoints"])
+    coin_indexes[name] = coin_index
 
-    print("DEBUG: merged_creatures keys:", list(merged_creatures.keys())[:12])
+    if name != get_selected_character():
+        return
 
-    # Save to character
-    char_name = get_selected_character()
-    if char_name:
-        character_ranks[char_name] = merged_counts
-        character_creatures[char_name] = merged_creatures
-        save_characters()
+    show_ranks(merged_counts)
+    show_creatures(name, merged_creatures)
+    # Update coins table: every coin is indexed, the time filter picks a window
+    show_coins(coin_index)
 
-    # Update ranks table
-    for item in table.get_children():
-        table.delete(item)
-    for name, cnt in merged_counts.items():
-        table.insert("", "end", values=(name, cnt))
 
-    # Update creatures table
-    for item in creature_table.get_children():
-        creature_table.delete(item)
+def show_ranks(ranks):
+    ranks_view.set_rows((n, c) for n, c in ranks.items())
 
-    ignored_list = character_ignored.get(char_name, [])
 
-    for name, data in merged_creatures.items():
-        if name in ignored_list:
+def show_creatures(name, creatures):
+    """Fill the creatures table, leaving out the character's ignored creatures."""
+    ignored = set(character_ignored.get(name, []))
+    rows = []
+    for label, data in creatures.items():
+        if label in ignored:
             continue
-
         if isinstance(data, dict):
-            count_val = data.get("count", "")
-            kills_val = data.get("kills", "")
+            rows.append((label, data.get("count", ""), data.get("kills", "")))
         else:
-            count_val = str(data)
-            kills_val = ""
-
-        creature_table.insert("", "end", values=(name, count_val, kills_val))
-
-    # Update coins table
-    for item in coins_table.get_children():
-        coins_table.delete(item)
-
-    # Diagnostic before computing total coins
-    try:
-        print("DIAG: before total coins: merged_skinned type/value:", type(merged_skinned), repr(merged_skinned)[:200])
-        print("DIAG: before total coins: merged_share type/value:", type(merged_share), repr(merged_share)[:200])
-        total_coins = merged_skinned + merged_share
-        print("DIAG: computed total_coins:", total_coins, type(total_coins))
-    except Exception:
-        print("FATAL: exception computing total_coins")
-        _tb.print_exc()
-        raise
-
-    coins_table.insert("", "end", values=("Total Skinned", merged_skinned))
-    coins_table.insert("", "end", values=("Total Share", merged_share))
-    coins_table.insert("", "end", values=("Total Coins", merged_skinned + merged_share))
-    coins_table.insert("", "end", values=("", ""))  # spacer
-    coins_table.insert("", "end", values=("Monster", "Details"))
-
-    summary = summarize_coin_events(merged_coin_events)
-    for monster, data in summary.items():
-        label = monster
-        details = f"Total {data['total_worth']}c, share {data['total_share']}c, you skinned {data['your_skins']}"
-        coins_table.insert("", "end", values=(label, details))
+            rows.append((label, str(data), ""))
+    creatures_view.set_rows(rows)
 
 
 def load_files_and_count_words():
@@ -1055,20 +346,25 @@ def load_files_and_count_words():
         return
 
     character_folders[name] = valid_folders
+    folders = [f for f in valid_folders if os.path.isdir(f)]
+    if not folders:
+        return
 
-    global merged_counts, merged_creatures, merged_skinned, merged_share, merged_coin_events
-    merged_counts.clear()
-    merged_creatures.clear()
-    merged_skinned = 0
-    merged_share = 0
-    merged_coin_events = []
-
-    for folder in character_folders[name]:
-        if not os.path.isdir(folder):
-            continue
+    if live_watcher is not None:
+        start_live_mode()  # live mode keeps its own totals: build them again
+        return
 
-        fut = executor.submit(scan_and_aggregate, folder, name)
-        fut.add_done_callback(lambda f: root.after(0, on_scan_done, f))
+    # Folders are scanned in parallel and merged off the Tk thread; the
+    # tables are redrawn once, when the whole scan is in.
+    global scan_serial
+    scan_serial += 1
+    serial = latest_scans[name] = scan_serial
+    reducer = ScanReducer(
+        folders, lambda merged, errors: scan_merged(name, serial, merged, errors)
+    )
+    for folder in folders:
+        checkpoints = character_checkpoints.get(name, {}).get(folder)
+        reducer.watch(folder, executor.submit(scan_and_aggregate, folder, name, checkpoints))
 
 
 def rescan_all_logs():
@@ -1076,8 +372,153 @@ def rescan_all_logs():
     if not name:
         messagebox.showerror("Error", "Select a character first.")
         return
+    # Forget checkpoints so every log is parsed again from the start
+    character_checkpoints.pop(name, None)
     load_files_and_count_words()
 
+# -- Live mode ---------------------------------------------------------------
+#
+# While "Live" is ticked, a LogWatcher follows the character's folders and a
+# LiveScan (built on a worker from the saved checkpoints) keeps their totals.
+# Each log the watcher reports is updated on its own: only its new lines are
+# parsed, and the coins it gained or lost are put in the character's
+# CoinIndex. Logs reported while an update runs go into the next one.
+# characters.json and checkpoints.db are saved at most every SAVE_DELAY_MS.
+
+def start_live_mode():
+    global live_watcher, scan_serial, live_busy
+    stop_live_mode()
+    name = get_selected_character()
+    folders = [f for f in character_folders.get(name, []) if os.path.isdir(f)] if name else []
+    if not folders:
+        live_var.set(False)
+        messagebox.showerror("Error", "Select a character with log folders first.")
+        return
+    scan_serial += 1
+    latest_scans[name] = scan_serial  # full scans still running are not published
+    serial = live_serial
+    checkpoints = {f: character_checkpoints.get(name, {}).get(f) for f in folders}
+    live_saved.update(checkpoints)
+    live_watcher = LogWatcher(
+        folders, lambda folder, path: root.after(0, live_changed, serial, folder, path)
+    ).start()
+    live_busy = True
+    executor.submit(live_start, serial, name, folders, checkpoints)
+
+
+def live_start(serial, name, folders, checkpoints):
+    """Build the LiveScan on a worker thread, parsing what is new since the checkpoints."""
+    try:
+        rules = load_rules(words_file_path, replacement_file_path, special_file_path)
+        scan = LiveScan(name, folders, rules, checkpoints)
+        result = (scan, scan.merged(), CoinIndex(scan.coin_events()))
+    except Exception as e:
+        result = e
+    root.after(0, live_done, serial, result)
+
+
+def live_update(serial, scan, changes):
+    """Fold the reported logs into scan on a worker thread."""
+    try:
+        added, removed, coin_index = [], [], None
+        for folder, path in changes:
+            delta = scan.update(folder, path)
+            if delta is None:
+                coin_index = True  # a folder was rescanned: index every coin again
+            else:
+                added += delta[0]
+                removed += delta[1]
+        if coin_index:
+            coin_index = CoinIndex(scan.coin_events())
+        result = (scan, scan.merged(), coin_index, added, removed)
+    except Exception as e:
+        result = e
+    root.after(0, live_done, serial, result)
+
+
+def live_done(serial, result):
+    global live_scan, live_busy
+    if serial != live_serial:
+        return  # live mode was stopped or restarted meanwhile
+    live_busy = False
+    if isinstance(result, Exception):
+        traceback.print_exception(type(result), result, result.__traceback__)
+        messagebox.showerror("Live Mode Error", str(result))
+        live_var.set(False)
+        stop_live_mode()
+        return
+    live_scan, merged, coin_index = result[:3]
+    if coin_index is None:
+        coin_index = coin_indexes[live_scan.character_name]
+        coin_index.update(*result[3:])
+    publish_scan(live_scan.character_name, merged, coin_index)
+    schedule_save()
+    live_run()
+
+
+def live_changed(serial, folder, path):
+    if serial != live_serial:
+        return
+    live_pending[folder, path] = None
+    live_run()
+
+
+def live_run():
+    """Start an update for the reported logs, unless one is running."""
+    global live_busy
+    if live_busy or live_scan is None or not live_pending:
+        return
+    changes = list(live_pending)
+    live_pending.clear()
+    live_busy = True
+    executor.submit(live_update, live_serial, live_scan, changes)
+
+
+def schedule_save():
+    global save_after_id
+    if save_after_id is None:
+        save_after_id = root.after(SAVE_DELAY_MS, flush_save)
+
+
+def flush_save():
+    """Save characters.json, and the checkpoints live mode moved on since it last saved them."""
+    global save_after_id
+    if save_after_id is not None:
+        root.after_cancel(save_after_id)
+        save_after_id = None
+    save_characters()
+    if live_scan is None:
+        return
+    name = live_scan.character_name
+    for folder in live_scan.folders:
+        checkpoints = character_checkpoints.get(name, {}).get(folder)
+        if checkpoints is None or checkpoints is live_saved.get(folder):
+            continue
+        save_executor.submit(checkpoint_store.save_folder, name, folder, checkpoints,
+                             live_saved.get(folder))
+        live_saved[folder] = checkpoints
+
+
+def stop_live_mode():
+    global live_watcher, live_serial, live_scan, live_busy
+    if live_watcher is not None:
+        live_watcher.stop()
+        live_watcher = None
+    if save_after_id is not None:
+        flush_save()
+    live_serial += 1
+    live_scan = None
+    live_busy = False
+    live_pending.clear()
+    live_saved.clear()
+
+
+def toggle_live_mode():
+    if live_var.get():
+        start_live_mode()
+    else:
+        stop_live_mode()
+
 
 def save_output():
     if not merged_counts:
@@ -1105,11 +546,11 @@ def save_output():
 
 
 def ignore_selected_creature():
-    selected_item = creature_table.selection()
-    if not selected_item:
+    row = creatures_view.selected_row()
+    if not row:
         return
 
-    creature_name = creature_table.item(selected_item)['values'][0]
+    creature_name = row[0]
     char_name = get_selected_character()
 
     if not char_name:
@@ -1121,7 +562,7 @@ def ignore_selected_creature():
     if creature_name not in character_ignored[char_name]:
         character_ignored[char_name].append(creature_name)
         save_characters()
-        creature_table.delete(selected_item)
+        creatures_view.set_rows(r for r in creatures_view.rows if r[0] != creature_name)
         print(f"Ignored: {creature_name}")
 
 
@@ -1131,26 +572,8 @@ def on_character_selected_simple():
     if not name:
         return
 
-    # Ranks
-    for item in table.get_children():
-        table.delete(item)
-    for n, c in character_ranks.get(name, {}).items():
-        table.insert("", "end", values=(n, c))
-
-    # Creatures
-    for item in creature_table.get_children():
-        creature_table.delete(item)
-    ignored = character_ignored.get(name, [])
-    for n, data in character_creatures.get(name, {}).items():
-        if n in ignored:
-            continue
-        if isinstance(data, dict):
-            count_val = data.get("count", "")
-            kills_val = data.get("kills", "")
-        else:
-            count_val = str(data)
-            kills_val = ""
-        creature_table.insert("", "end", values=(n, count_val, kills_val))
+    show_ranks(character_ranks.get(name, {}))
+    show_creatures(name, character_creatures.get(name, {}))
 
 
 def open_ignore_manager():
@@ -1374,6 +797,8 @@ class CLTime:
         style.configure("Header.TLabel", font=("KIN668", 14, "bold"))
         style.configure("Body.TLabel", font=("KIN668", 11))
 
+        self.shown_day = None  # IC day the day-by-day labels are for
+
         self.build_layout()
         self.update_all()
 
@@ -1446,9 +871,17 @@ class CLTime:
         # Header
         self.lbl_header.config(text=fmt_cl_header(cl))
 
+        # Everything below only changes when the IC day does
+        if cl.ic_day != self.shown_day:
+            self.shown_day = cl.ic_day
+            self.update_day(cl.ic_day)
+
+        # Next refresh: the first IC second at least a real second away
+        return next_ic_tick(time.time() + 1, 1)
+
+    def update_day(self, ic_day):
         # Dawn/Dusk
-        sunrise, sunset = dawn_dusk_for_day(cl.ic_day)
-        sunrise2, sunset2 = dawn_dusk_for_day(cl.ic_day + 1)
+        (sunrise, sunset), (sunrise2, sunset2) = dawn_dusk_times(ic_day, 2)
         self.lbl_dawn.config(text=(
             "Today:\n"
             f"  Sunrise at: {fmt_real(sunrise)}\n"
@@ -1459,8 +892,8 @@ class CLTime:
         ))
 
         # Lunar
-        moon_day, moon_name = moon_phase_for_day(cl.ic_day)
-        next_day, start, noon, end = next_full_moon(cl.ic_day)
+        moon_day, moon_name = moon_phase_for_day(ic_day)
+        next_day, start, noon, end = next_full_moon(ic_day)
         lunar = f"{moon_name}, day {moon_day}\n\n"
         if start:
             lunar += (
@@ -1472,18 +905,16 @@ class CLTime:
         self.lbl_lunar.config(text=lunar)
 
         # Zodiac
-        sign, day_in_sign, days_until_next = zodiac_for_day(cl.ic_day)
+        sign, day_in_sign, days_until_next = zodiac_for_day(ic_day)
         self.lbl_zodiac.config(text=(
             f"Day {day_in_sign} of {sign}\n"
             f"Next sign rises in {days_until_next} days"
         ))
 
         # Coliseum (simple example)
-        next_col = cl_to_real(cl.ic_day + 1, 23, 10)
+        next_col = cl_to_real(ic_day + 1, 23, 10)
         self.lbl_coliseum.config(text=f"Coliseum opens at {fmt_real(next_col)}")
 
-        self.parent.after(1000, self.update_all)
-
     # -----------------------------
     # Converters
     # -----------------------------
@@ -1514,10 +945,187 @@ class CLTime:
             messagebox.showerror("Error", "Format must be: HH:MM Season-day-year")
             return
 
-        ic_day = year * IC_DAYS_PER_YEAR + season_index * IC_DAYS_PER_SEASON + (day - 1)
-        dt = cl_to_real(ic_day, hour, minute)
+        ic_day = ic_day_for(year, season_index * IC_DAYS_PER_SEASON + day)
+        dt = get_calendar().real_time(ic_day, hour, minute)
         self.lbl_ic_result.config(text=fmt_real(dt))
 
+# -- Virtual tables ----------------------------------------------------------
+#
+# A Treeview with one item per row freezes the window once tables reach
+# thousands of rows: every refresh deletes and re-inserts all of them. A
+# VirtualTable keeps only as many items as fit on screen and scrolls by
+# rewriting their values, so a refresh costs one screenful of Tk calls
+# however long the table is.
+
+class VirtualTable:
+    def __init__(self, tree, scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = []
+        self.top = 0          # index of the first row on screen
+        self._slots = []      # tree items, top to bottom
+        self._shown = []      # values each slot currently displays
+        self._selected = None # row shown as selected, by index
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", lambda e: self._render())
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        tree.bind("<Button-5>", lambda e: self.scroll(3))
+        tree.bind("<Up>", lambda e: self._on_arrow(-1))
+        tree.bind("<Down>", lambda e: self._on_arrow(1))
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+
+    def set_rows(self, rows):
+        """Show rows (tuples of column values); keeps the scroll position and selection."""
+        old = self.rows[self._selected] if self._selected is not None else None
+        self.rows = [tuple(r) for r in rows]
+        self._selected = None
+        if old is not None:
+            for i, row in enumerate(self.rows):
+                if row[0] == old[0]:
+                    self._selected = i
+                    break
+        self._render()
+
+    def select_item(self, item):
+        """Select the row a tree item is showing."""
+        if item in self._slots:
+            self._selected = self.top + self._slots.index(item)
+            self.tree.selection_set(item)
+
+    def selected_row(self):
+        return self.rows[self._selected] if self._selected is not None else None
+
+    def scroll(self, delta):
+        self.top += delta
+        self._render()
+
+    def _visible_rows(self):
+        box = self.tree.bbox(self._slots[0]) if self._slots else ""
+        header, row_height = (box[1], box[3]) if box else (25, 20)
+        return max(1, (self.tree.winfo_height() - header) // max(row_height, 1))
+
+    def _render(self):
+        visible = self._visible_rows()
+        self.top = max(0, min(self.top, len(self.rows) - visible))
+        want = self.rows[self.top:self.top + visible]
+
+        while len(self._slots) > len(want):
+            self.tree.delete(self._slots.pop())
+            self._shown.pop()
+        while len(self._slots) < len(want):
+            self._slots.append(self.tree.insert("", "end"))
+            self._shown.append(None)
+        # Only touch the items whose values changed
+        for k, values in enumerate(want):
+            if self._shown[k] != values:
+                self.tree.item(self._slots[k], values=values)
+                self._shown[k] = values
+
+        k = self._selected - self.top if self._selected is not None else -1
+        if 0 <= k < len(self._slots):
+            if self.tree.selection() != (self._slots[k],):
+                self.tree.selection_set(self._slots[k])
+        elif self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+
+        if self.rows:
+            self.scrollbar.set(self.top / len(self.rows), (self.top + len(want)) / len(self.rows))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scrollbar(self, *args):
+        visible = len(self._slots) or 1
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self._render()
+
+    def _on_wheel(self, event):
+        if event.delta:
+            self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_arrow(self, step):
+        # Arrow keys move within the items; past the first or last one they scroll
+        focus = self.tree.focus()
+        if not self._slots or focus not in (self._slots[0], self._slots[-1]):
+            return None
+        k = self._slots.index(focus)
+        if (step < 0 and k > 0) or (step > 0 and k < len(self._slots) - 1):
+            return None
+        row = self.top + k + step
+        if not 0 <= row < len(self.rows):
+            return "break"
+        self._selected = row
+        self.scroll(step)
+        self.tree.focus(self._slots[row - self.top])
+        return "break"
+
+    def _on_select(self, event):
+        sel = self.tree.selection()
+        if sel and sel[0] in self._slots:
+            self._selected = self.top + self._slots.index(sel[0])
+        elif not sel and self._selected is not None \
+                and 0 <= self._selected - self.top < len(self._slots):
+            # deselected on screen (not just scrolled out of view)
+            self._selected = None
+
+# -- Refresh scheduling ------------------------------------------------------
+#
+# The Time and Moon Calendar tabs show clocks. Rather than each polling on
+# its own timer, their refresh functions are registered here with the tab
+# they draw on. A refresh returns the Unix time its display next changes,
+# and one after() timer wakes at the earliest of those, for tabs on show
+# only. With another tab selected or the window minimized nothing runs;
+# showing a tab again refreshes it straight away.
+
+class RefreshScheduler:
+    def __init__(self, root, notebook):
+        self.root = root
+        self.notebook = notebook
+        self.jobs = {}     # name -> (tab, refresh)
+        self.due = {}      # name -> Unix time of its next refresh
+        self._timer = None
+        notebook.bind("<<NotebookTabChanged>>", self._on_shown, add="+")
+        root.bind("<Map>", self._on_map, add="+")
+
+    def add(self, name, tab, refresh):
+        self.jobs[name] = (tab, refresh)
+        self.due[name] = 0
+        self._run()
+
+    def _on_shown(self, event=None):
+        for name, (tab, _) in self.jobs.items():
+            if self._showing(tab):
+                self.due[name] = 0
+        self._run()
+
+    def _on_map(self, event):
+        if event.widget is self.root:  # de-iconified, not some child mapped
+            self._on_shown()
+
+    def _showing(self, tab):
+        return self.notebook.winfo_viewable() and str(self.notebook.select()) == str(tab)
+
+    def _run(self):
+        now = time.time() + 0.01  # a timer may fire a hair before its due time
+        for name, (tab, refresh) in self.jobs.items():
+            if self._showing(tab) and self.due[name] <= now:
+                self.due[name] = refresh()
+        self._schedule()
+
+    def _schedule(self):
+        if self._timer is not None:
+            # one timer at a time (cancelling one that already fired is harmless)
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        due = [self.due[name] for name, (tab, _) in self.jobs.items() if self._showing(tab)]
+        if due:
+            delay = max(0.0, min(due) - time.time())
+            self._timer = self.root.after(int(delay * 1000) + 1, self._run)
+
 # ----------------------------------------------------------------------
 # ------------------------- MAIN GUI SETUP -----------------------------
 # ----------------------------------------------------------------------
@@ -1557,6 +1165,9 @@ ttk.Button(button_frame, text="Scan New Logs", command=load_files_and_count_word
     .pack(side="left", padx=5)
 ttk.Button(button_frame, text="Rescan All Logs", command=rescan_all_logs)\
     .pack(side="left", padx=5)
+live_var = tk.BooleanVar(value=False)
+ttk.Checkbutton(button_frame, text="Live", variable=live_var, command=toggle_live_mode)\
+    .pack(side="left", padx=5)
 
 # Notebook
 notebook = ttk.Notebook(root)
@@ -1578,7 +1189,9 @@ notebook.add(frame_coins, text="Coins")
 notebook.add(frame_CLTime, text="Time")
 notebook.add(frame_moon, text="Moon Calendar")
 
-CLTime(frame_CLTime)
+time_tab = CLTime(frame_CLTime)
+refresher = RefreshScheduler(root, notebook)
+refresher.add("time", frame_CLTime, time_tab.update_all)
 
 # Time filter in Coins tab
 time_filter_var = tk.StringVar()
@@ -1615,44 +1228,44 @@ def get_moon_icon(phase_name):
         return tk.PhotoImage(file=path)
     return None
 
+def show_coins(coin_index):
+    """Fill the coins table with the coins inside the time filter's window."""
+    min_time = get_min_time_from_filter(time_filter_var.get())
+    skinned, share, coin_events = coin_index.window(min_time)
+
+    rows = [
+        ("Total Skinned", skinned),
+        ("Total Share", share),
+        ("Total Coins", skinned + share),
+        ("", ""),  # spacer
+        ("Monster", "Details"),
+    ]
+    summary = summarize_coin_events(coin_events)
+    for monster, data in summary.items():
+        label = monster
+        details = f"Total {data['total_worth']}c, share {data['total_share']}c, you skinned {data['your_skins']}"
+        rows.append((label, details))
+    coins_view.set_rows(rows)
+
 def refresh_coins_table():
     name = get_selected_character()
     if not name:
         messagebox.showerror("Error", "Select a character first.")
         return
 
-    global merged_skinned, merged_share, merged_coin_events
-    merged_skinned = 0
-    merged_share = 0
-    merged_coin_events = []
-
-    all_texts = []
-    for folder in character_folders.get(name, []):
-        if os.path.isdir(folder):
-            all_texts.extend(read_text_files(folder))
-
-    min_time = get_min_time_from_filter(time_filter_var.get())
-    skinned, share, coin_events = count_coins(all_texts, name, min_time)
-    merged_skinned = skinned
-    merged_share = share
-    merged_coin_events = coin_events
-
-    for item in coins_table.get_children():
-        coins_table.delete(item)
-
-    coins_table.insert("", "end", values=("Total Skinned", merged_skinned))
-    coins_table.insert("", "end", values=("Total Share", merged_share))
-    coins_table.insert("", "end", values=("Total Coins", merged_skinned + merged_share))
-    coins_table.insert("", "end", values=("", ""))
-    coins_table.insert("", "end", values=("Monster", "Details"))
-
-    summary = summarize_coin_events(merged_coin_events)
-    for monster, data in summary.items():
-        label = monster
-        details = f"Total {data['total_worth']}c, share {data['total_share']}c, you skinned {data['your_skins']}"
-        coins_table.insert("", "end", values=(label, details))
+    coin_index = coin_indexes.get(name)
+    if coin_index is None:
+        # Not scanned since start-up: a scan only parses what is new, then
+        # indexes every coin and shows them
+        load_files_and_count_words()
+        return
+    show_coins(coin_index)
 
 tk.Button(frame_coins, text="Refresh Coins", command=refresh_coins_table).pack(pady=5)
+time_filter_box.bind(
+    "<<ComboboxSelected>>",
+    lambda e: get_selected_character() and refresh_coins_table()
+)
 
 # Characters tab
 load_characters()
@@ -1673,25 +1286,13 @@ def on_character_selected(event):
     merged_creatures.clear()
 
     if name in character_ranks:
-        for item in table.get_children():
-            table.delete(item)
-        for n, c in character_ranks[name].items():
-            table.insert("", "end", values=(n, c))
+        show_ranks(character_ranks[name])
 
     if name in character_creatures:
-        for item in creature_table.get_children():
-            creature_table.delete(item)
-        ignored = character_ignored.get(name, [])
-        for n, data in character_creatures[name].items():
-            if n in ignored:
-                continue
-            if isinstance(data, dict):
-                count_val = data.get("count", "")
-                kills_val = data.get("kills", "")
-            else:
-                count_val = str(data)
-                kills_val = ""
-            creature_table.insert("", "end", values=(n, count_val, kills_val))
+        show_creatures(name, character_creatures[name])
+
+    if live_var.get():
+        start_live_mode()
 
 for name in character_folders.keys():
     character_list.insert(tk.END, name)
@@ -1719,11 +1320,17 @@ def remove_character():
         return
     name = character_list.get(sel[0])
     if messagebox.askyesno("Confirm", f"Remove character '{name}'?"):
+        if live_watcher is not None:
+            live_var.set(False)
+            stop_live_mode()
         character_list.delete(sel[0])
         character_folders.pop(name, None)
         character_ranks.pop(name, None)
         character_creatures.pop(name, None)
         character_ignored.pop(name, None)
+        character_checkpoints.pop(name, None)
+        save_executor.submit(checkpoint_store.drop, name)
+        coin_indexes.pop(name, None)
         save_characters()
 
 char_buttons_frame = ttk.Frame(char_area)
@@ -1767,6 +1374,8 @@ def add_folder_in_manager():
         character_folders[name].append(folder)
         update_folder_list_in_manager()
         save_characters()
+        if live_watcher is not None:
+            start_live_mode()
 
 def remove_folder_in_manager():
     sel = fm_folder_list.curselection()
@@ -1774,9 +1383,17 @@ def remove_folder_in_manager():
         folder = fm_folder_list.get(sel[0])
         name = get_selected_character()
         if name and folder in character_folders.get(name, []):
+            live = live_watcher is not None
+            if live:
+                stop_live_mode()  # saves what it has before the folder is dropped
             character_folders[name].remove(folder)
+            character_checkpoints.get(name, {}).pop(folder, None)
+            save_executor.submit(checkpoint_store.drop, name, folder)
+            coin_indexes.pop(name, None)
             update_folder_list_in_manager()
             save_characters()
+            if live:
+                start_live_mode()
 
 add_folder_btn = ttk.Button(fm_button_frame, text="Add Folder", command=add_folder_in_manager)
 add_folder_btn.pack(side="left", padx=5)
@@ -1804,14 +1421,19 @@ manage_folders_btn = ttk.Button(char_buttons_frame, text="Folders", command=open
 manage_folders_btn.pack(side="left", padx=5)
 
 # Ranks table
+ranks_scroll = ttk.Scrollbar(frame_ranks, orient="vertical")
+ranks_scroll.pack(side="right", fill="y", pady=10)
 table = ttk.Treeview(frame_ranks, columns=("Trainer", "Ranks"), show="headings")
 table.heading("Trainer", text="Trainer")
 table.heading("Ranks", text="Ranks")
 table.column("Trainer", width=300, stretch=True)
 table.column("Ranks", width=80, stretch=False)
 table.pack(pady=10, fill="both", expand=True)
+ranks_view = VirtualTable(table, ranks_scroll)
 
 # Creatures table
+creature_scroll = ttk.Scrollbar(frame_creatures, orient="vertical")
+creature_scroll.pack(side="right", fill="y", pady=10)
 creature_table = ttk.Treeview(frame_creatures, columns=("Creature", "MessageNumber", "KillsTillNext"), show="headings")
 creature_table.heading("Creature", text="Creature")
 creature_table.heading("MessageNumber", text="Message Number")
@@ -1820,6 +1442,7 @@ creature_table.column("Creature", width=420, anchor="w", stretch=True)
 creature_table.column("MessageNumber", width=120, anchor="center", stretch=False)
 creature_table.column("KillsTillNext", width=160, anchor="center", stretch=False)
 creature_table.pack(pady=10, fill="both", expand=True)
+creatures_view = VirtualTable(creature_table, creature_scroll)
 
 creature_context_menu = tk.Menu(root, tearoff=0)
 creature_context_menu.add_command(label="Ignore Creature", command=ignore_selected_creature)
@@ -1839,17 +1462,20 @@ btn_special_kills = ttk.Button(
 btn_special_kills.pack(padx=6, pady=4, side="right", anchor="ne")
 
 # Coins table
+coins_scroll = ttk.Scrollbar(frame_coins, orient="vertical")
+coins_scroll.pack(side="right", fill="y", pady=10)
 coins_table = ttk.Treeview(frame_coins, columns=("Event", "Details"), show="headings")
 coins_table.heading("Event", text="Event")
 coins_table.heading("Details", text="Details")
 coins_table.column("Event", width=300)
 coins_table.column("Details", width=200)
 coins_table.pack(fill="both", expand=True, pady=10)
+coins_view = VirtualTable(coins_table, coins_scroll)
 
 def show_creature_menu(event):
     item = creature_table.identify_row(event.y)
     if item:
-        creature_table.selection_set(item)
+        creatures_view.select_item(item)
         creature_context_menu.post(event.x_root, event.y_root)
 
 creature_table.bind("<Button-3>", show_creature_menu)
@@ -1906,21 +1532,50 @@ calendar_frame = ttk.Frame(moon_container)
 calendar_frame.pack(fill="both", expand=True)
 
 seasons = ["Winter", "Spring", "Summer", "Autumn"]
-season_frames = {}
 
-for s in seasons:
-    outer = tk.Frame(calendar_frame, bg=season_colors[s], bd=1, relief="solid")
-    outer.pack(fill="x", pady=4)
-    season_frames[s] = outer
+# The whole calendar is one Canvas: a band per season with its header and
+# 2 x 30 day cells. The items are made once; build_moon_calendar() and
+# update_moon_calendar() only reconfigure the ones that change.
+CAL_CELL = 32   # cell size, as the old 32x32 frames
+CAL_PITCH = 34  # cell plus 1px padding on each side
+CAL_HEADER = 24
+CAL_BAND = CAL_HEADER + 2 * CAL_PITCH + 6
+CAL_GAP = 8
+
+moon_canvas = tk.Canvas(
+    calendar_frame,
+    width=30 * CAL_PITCH + 10,
+    height=len(seasons) * (CAL_BAND + CAL_GAP),
+    highlightthickness=0,
+)
+moon_canvas.pack(pady=4)
+
+calendar_cells = []  # (rect, icon, text) canvas items per day cell
+calendar_shown = []  # (bg, phase, text) each cell shows now
+calendar_today = None  # index of the highlighted cell
 
+for i, s in enumerate(seasons):
+    top = i * (CAL_BAND + CAL_GAP)
+    moon_canvas.create_rectangle(
+        1, top + 1, 30 * CAL_PITCH + 9, top + CAL_BAND,
+        fill=season_colors[s], outline="black",
+    )
     # Season header
-    tk.Label(
-        outer,
-        text=s.upper(),
-        font=("KIN668", 12, "bold"),
-        bg=season_colors[s],
-        anchor="center"
-    ).pack(fill="x", pady=(3, 3))
+    moon_canvas.create_text(
+        (30 * CAL_PITCH + 10) // 2, top + CAL_HEADER // 2 + 2,
+        text=s.upper(), font=("KIN668", 12, "bold"),
+    )
+    for r in range(2):
+        for c in range(30):
+            x = 5 + c * CAL_PITCH + 1
+            y = top + CAL_HEADER + r * CAL_PITCH + 1
+            calendar_cells.append((
+                moon_canvas.create_rectangle(x, y, x + CAL_CELL, y + CAL_CELL,
+                                             fill=season_colors[s], outline="black"),
+                moon_canvas.create_image(x + CAL_CELL // 2, y + 10, state="hidden"),
+                moon_canvas.create_text(x + CAL_CELL // 2, y + 24, font=("KIN668", 8)),
+            ))
+            calendar_shown.append((None, None, None))
 
 # -------------------------------
 # Preload icons
@@ -1933,62 +1588,48 @@ for name, img_file in moon_icons.items():
 # -------------------------------
 # Moon phase for any IC day
 # -------------------------------
-def moon_phase_for_day(day_of_year):
-    lunar_day = day_of_year % 28
-    if lunar_day == 0:
-        return lunar_day, "New Moon"
-    elif lunar_day == 7:
-        return lunar_day, "First Quarter"
-    elif lunar_day == 14:
-        return lunar_day, "Full Moon"
-    elif lunar_day == 21:
-        return lunar_day, "Last Quarter"
-    else:
-        return lunar_day, None  # normal day
+# Days that get a moon icon, by lunar day (from the calendar table)
+CALENDAR_MARKS = {0: "New Moon", 7: "First Quarter", 14: "Full Moon", 21: "Last Quarter"}
 
 # -------------------------------
-# Build the 360‑day calendar
+# Fill the calendar for a year
 # -------------------------------
-day_cells = []
+calendar_days = []  # CalendarDay of each cell for the year on show
 
 def build_moon_calendar(year):
-    global day_cells
-    day_cells = []
-
-    day = 0
-    for season in seasons:
-        outer = season_frames[season]
-
-        grid = tk.Frame(outer, bg=season_colors[season])
-        grid.pack(padx=4, pady=(0, 6))
-
-        for r in range(2):        # 9 rows
-            for c in range(30):   # 10 columns
-                day += 1
-                lunar_day, phase = moon_phase_for_day(day)
-
-                bg = moon_bg if phase else season_colors[season]
-
-                cell = tk.Frame(
-                    grid,
-                    bg=bg,
-                    width=32,
-                    height=32,
-                    bd=1,
-                    relief="solid"
-                )
-                cell.grid(row=r, column=c, padx=1, pady=1)
-                cell.grid_propagate(False)
-
-                if phase:
-                    icon = icon_cache.get(phase)
-                    tk.Label(cell, image=icon, bg=bg).pack()
-                else:
-                    tk.Label(cell, bg=bg).pack()
-
-                tk.Label(cell, text=str(day), font=("KIN668", 8), bg=bg).pack()
-
-                day_cells.append(cell)
+    global calendar_days
+    calendar_days = get_calendar().year(year)[:len(calendar_cells)]
+
+    for i, day in enumerate(calendar_days):
+        season = seasons[i // 60]
+        phase = CALENDAR_MARKS.get(day.lunar_day)
+        shown = (moon_bg if phase else season_colors[season], phase, str(i + 1))
+        if shown == calendar_shown[i]:
+            continue
+        rect, icon, text = calendar_cells[i]
+        bg, _, label = shown
+        moon_canvas.itemconfigure(rect, fill=bg)
+        if phase:
+            moon_canvas.itemconfigure(icon, image=icon_cache.get(phase), state="normal")
+        else:
+            moon_canvas.itemconfigure(icon, state="hidden")
+        if label != calendar_shown[i][2]:
+            moon_canvas.itemconfigure(text, text=label)
+        calendar_shown[i] = shown
+
+    highlight_today(real_to_cl(datetime.now()).ic_day)
+
+def highlight_today(ic_day):
+    """Give today's cell, if it is on show, the thick border."""
+    global calendar_today
+    today = next((i for i, day in enumerate(calendar_days) if day.ic_day == ic_day), None)
+    if today == calendar_today:
+        return
+    if calendar_today is not None:
+        moon_canvas.itemconfigure(calendar_cells[calendar_today][0], width=1)
+    if today is not None:
+        moon_canvas.itemconfigure(calendar_cells[today][0], width=2)
+    calendar_today = today
 
 # -------------------------------
 # Legend (matches screenshot)
@@ -2016,15 +1657,10 @@ def update_moon_calendar():
     stats_labels["Moon Phase"].config(text=cl_time.moon_phase_name)
     stats_labels["Time"].config(text=f"{cl_time.ic_hour:02}:{cl_time.ic_minute:02}")
 
-    current_day = cl_time.day_of_year - 1
+    highlight_today(cl_time.ic_day)
 
-    for i, cell in enumerate(day_cells):
-        if i == current_day:
-            cell.config(bd=2, relief="solid")
-        else:
-            cell.config(bd=1, relief="solid")
-
-    frame_moon.after(60000, update_moon_calendar)
+    # Nothing shown changes before the next IC minute
+    return next_ic_tick(time.time())
 
 # -------------------------------
 # Initial build
@@ -2032,7 +1668,7 @@ def update_moon_calendar():
 cl_time = real_to_cl(datetime.now())
 year_var.set(cl_time.year)
 build_moon_calendar(cl_time.year)
-update_moon_calendar()
+refresher.add("moon", frame_moon, update_moon_calendar)
 
 # ----------------------------------------------------------------------
 # LOG SEARCH TAB — sentence-level search, file path hidden
@@ -2054,61 +1690,103 @@ tk.Entry(frame_logsearch, textvariable=ls_word_var, width=50)\
 # Hidden storage for file paths (parallel to Listbox)
 ls_hidden_paths = []
 
+# Results reach the listbox in batches while the search runs. Only
+# LS_PAGE_SIZE rows are shown at first; "Load more" shows the next page.
+LS_PAGE_SIZE = 1000
+LS_BATCH_SIZE = 200      # rows per hand-off to the Tk thread ...
+LS_BATCH_SECONDS = 0.05  # ... or sooner, so the first rows show at once
 
-# --- Sentence extractor ------------------------------------------------
-def ls_extract_sentences(file_path, word):
-    """Return list of (full_line, file_path) for each match."""
-    results = []
-    try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            for raw_line in f:
-                line = raw_line.rstrip("\r\n")
-                if word.lower() in line.lower():
-                    results.append((line, file_path))
-    except:
-        pass
-
-    return results
+ls_search_serial = 0  # bumped per search; an older search stops when it sees it
+ls_found = []         # every (sentence, file_path) of the current search
+ls_shown_limit = 0    # how many of ls_found may be in the listbox
+ls_searching = False
 
 
 # --- Background thread search -------------------------------------
-def ls_run_scan(name, word):
-    results = []
-
-    for folder in character_folders.get(name, []):
-        if not os.path.isdir(folder):
-            continue
+def ls_run_scan(serial, name, word):
+    def cancelled():
+        return serial != ls_search_serial
+
+    folders = character_folders.get(name, [])
+    t = time.perf_counter()
+    with LogIndex() as index:
+        # search what the index already knows (new log text is scanned) ...
+        batch, sent = [], time.perf_counter() - LS_BATCH_SECONDS
+        for result in index.iter_search(index.files(folders), word, stop=cancelled):
+            if cancelled():
+                return
+            batch.append(result)
+            if len(batch) >= LS_BATCH_SIZE or time.perf_counter() - sent >= LS_BATCH_SECONDS:
+                ls_results_list.after(0, ls_add_results, serial, batch)
+                batch, sent = [], time.perf_counter()
+        searched = f"Searched in {time.perf_counter() - t:.2f} s"
+        ls_results_list.after(0, ls_add_results, serial, batch)
+        ls_results_list.after(0, ls_search_done, serial, word, searched)
+        # ... then catch the index up for the next search
+        index.update(folders, stop=cancelled)
+        if not cancelled():
+            status = f"{searched}; {ls_index_status(index.stats())}"
+            ls_results_list.after(0, ls_show_status, serial, status)
+
+
+def ls_index_status(stats):
+    """One line about the index for the label above the results."""
+    mb = 1024 ** 2
+    text = (f"{stats['files']} files, {stats['log_bytes'] / mb:,.1f} MB of logs, "
+            f"index {stats['index_bytes'] / mb:,.1f} MB")
+    if stats["indexed_bytes"]:
+        text += (f"; indexed {stats['indexed_bytes'] / mb:,.1f} MB "
+                 f"at {stats['mb_per_s']:,.1f} MB/s")
+    return text
 
-        for root, dirs, files in os.walk(folder):
-            for filename in files:
-                if not filename.lower().endswith(".txt"):
-                    continue
 
-                full_path = os.path.join(root, filename)
-                matches = ls_extract_sentences(full_path, word)
-                results.extend(matches)
+# ---  Show sentences ------------------------------------------
+def ls_add_results(serial, batch):
+    if serial != ls_search_serial:
+        return
+    ls_found.extend(batch)
+    ls_fill_page()
+
+
+def ls_fill_page():
+    """Show found rows up to ls_shown_limit and update the count."""
+    shown = len(ls_hidden_paths) - 2  # minus the header rows
+    rows = ls_found[shown:ls_shown_limit]
+    if rows:
+        ls_results_list.insert(tk.END, *(sentence for sentence, _ in rows))
+        ls_hidden_paths.extend(file_path for _, file_path in rows)
+    shown += len(rows)
+    more = "..." if ls_searching else ""
+    ls_count_var.set(f"Showing {shown:,} of {len(ls_found):,}{more}")
+    if shown < len(ls_found):
+        ls_more_button.grid()
+    else:
+        ls_more_button.grid_remove()
 
-    ls_results_list.after(0, ls_update_results, results, word)
 
+def ls_load_more():
+    global ls_shown_limit
+    ls_shown_limit += LS_PAGE_SIZE
+    ls_fill_page()
 
-# ---  Show sentences ------------------------------------------
-def ls_update_results(results, word):
-    ls_results_list.delete(0, tk.END)
-    ls_hidden_paths.clear()
 
-    if not results:
-        ls_results_list.insert(tk.END, f"No sentences found containing '{word}'.")
+def ls_search_done(serial, word, searched):
+    global ls_searching
+    if serial != ls_search_serial:
         return
+    ls_searching = False
+    ls_fill_page()
+    if not ls_found:
+        ls_results_list.delete(0, tk.END)
+        ls_hidden_paths.clear()
+        ls_results_list.insert(tk.END, f"No sentences found containing '{word}'.")
+        ls_count_var.set("")
+    ls_status_var.set(f"{searched}; updating the index...")
 
-    ls_results_list.insert(tk.END, f"Sentences containing '{word}':")
-    ls_hidden_paths.append(None)  # placeholder for header
-
-    ls_results_list.insert(tk.END, "--------------------------------")
-    ls_hidden_paths.append(None)
 
-    for sentence, file_path in results:
-        ls_results_list.insert(tk.END, sentence)
-        ls_hidden_paths.append(file_path)  # store file path invisibly
+def ls_show_status(serial, status):
+    if serial == ls_search_serial:
+        ls_status_var.set(status)
 
 
 # --- Double-click opens file ---------------------
@@ -2126,6 +1804,7 @@ def ls_open_selected_file(event=None):
 
 # --- Search button handler --------------------------------------------------
 def ls_start_search():
+    global ls_search_serial, ls_shown_limit, ls_searching
     name = get_selected_character()
     if not name:
         messagebox.showerror("Error", "Select a character first.")
@@ -2140,11 +1819,23 @@ def ls_start_search():
         messagebox.showerror("Error", "Please enter a word to search for.")
         return
 
+    ls_search_serial += 1  # a search still running stops at its next result
+    ls_found.clear()
+    ls_shown_limit = LS_PAGE_SIZE
+    ls_searching = True
+
     ls_results_list.delete(0, tk.END)
-    ls_results_list.insert(tk.END, "Scanning all folders... Please wait.")
     ls_hidden_paths.clear()
+    ls_results_list.insert(tk.END, f"Sentences containing '{word}':")
+    ls_hidden_paths.append(None)  # placeholder for header
+    ls_results_list.insert(tk.END, "--------------------------------")
+    ls_hidden_paths.append(None)
+    ls_status_var.set("Searching...")
+    ls_fill_page()
 
-    threading.Thread(target=ls_run_scan, args=(name, word), daemon=True).start()
+    threading.Thread(
+        target=ls_run_scan, args=(ls_search_serial, name, word), daemon=True
+    ).start()
 
 
 # --- Search button ----------------------------------------------------------
@@ -2154,6 +1845,18 @@ tk.Button(frame_logsearch, text="Search", command=ls_start_search)\
 tk.Label(frame_logsearch, text="Matching Sentences:")\
     .grid(row=1, column=0, padx=5, pady=5, sticky="w")
 
+ls_status_var = tk.StringVar()
+tk.Label(frame_logsearch, textvariable=ls_status_var, fg="gray")\
+    .grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky="e")
+
+ls_count_var = tk.StringVar()
+tk.Label(frame_logsearch, textvariable=ls_count_var)\
+    .grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+
+ls_more_button = tk.Button(frame_logsearch, text="Load more", command=ls_load_more)
+ls_more_button.grid(row=3, column=2, padx=5, pady=5, sticky="e")
+ls_more_button.grid_remove()
+
 
 # --- Listbox expands in BOTH directions ------------------------------------
 ls_results_list = tk.Listbox(frame_logsearch, width=90, height=20)
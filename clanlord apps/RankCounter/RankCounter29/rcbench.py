@@ -0,0 +1,421 @@
+"""
+Benchmarks for the RankCounter log engine (rcengine.py).
+
+    python rcbench.py generate DIR --size 100MB
+    python rcbench.py run --size 10MB
+    python rcbench.py run --size 1GB --save          # write the baseline
+    python rcbench.py run --size 1GB                 # compare with it
+
+generate writes a deterministic set of synthetic Clan Lord text logs: the
+same seed and size always give the same bytes. run generates (or reuses)
+logs of the given size under bench_logs/, times every stage in a process
+of its own and prints wall time, lines/sec and peak RSS per stage. With
+--save the results become the JSON baseline; otherwise they are compared
+with it and stages more than --tolerance slower are reported (exit code 1).
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+from datetime import datetime, timedelta
+
+import rcengine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+BENCH_CHARACTER = "Bob"
+BENCH_SEARCH_WORD = "vermine"
+BASELINE_FILE = "bench_baseline.json"
+GENERATOR_VERSION = 1  # bump when the generated logs change
+
+# -- Sizes -------------------------------------------------------------------
+
+_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+def parse_size(text):
+    """'10MB' -> 10485760. Accepts B, KB, MB and GB."""
+    text = text.strip().upper()
+    num = text.rstrip("KMGB")
+    unit = text[len(num):]
+    if unit not in _UNITS or not num:
+        raise argparse.ArgumentTypeError(f"bad size: {text}")
+    return int(float(num) * _UNITS[unit])
+
+def fmt_size(n):
+    for unit in ("GB", "MB", "KB"):
+        if n >= _UNITS[unit] and n % _UNITS[unit] == 0:
+            return f"{n // _UNITS[unit]}{unit}"
+    return f"{n}B"
+
+# -- Synthetic logs ----------------------------------------------------------
+
+CREATURES = [
+    "Rat", "Vermine", "Large Vermine", "Dark Vermine", "Orga Warrior",
+    "Orga Berserk", "Greymyr", "Maha Ruknee", "Wendecka", "Feral Lok'Groton",
+]
+PEOPLE = ["Bob", "Faustus", "Sylvie", "Hrothgar", "Mira", "Tobin", "Quill"]
+CHAT = [
+    "anyone up for a hunt?", "heading to the ship", "need a heal here",
+    "that was close", "rats again...", "meet at the fountain", "gg all",
+    "who has a spare bandage?", "ok", "lol", "brb", "fallen at the pit",
+]
+MAC_CHAT = ["café at the inn?", "that orga was très big", "naïve question"]
+STUDY_GROUPS = [
+    "almost nothing", "a few", "more than a few", "some things",
+    "many things", "much to learn", "a lot to learn", "a vast amount",
+]
+KILL_VERBS = ["slaughtered", "dispatched", "killed", "vanquished"]
+PARTS = ["fur", "blood", "mandibles"]
+
+def _message_pool(rng, words, mac_roman):
+    """Message bodies, repeated in proportion to how often they show up."""
+    chat = CHAT + (MAC_CHAT if mac_roman else [])
+    pool = []
+    for person in PEOPLE:
+        for text in chat:
+            for verb in ("says", "yells", "thinks", "ponders"):
+                pool += [f'{person} {verb}, "{text}"'] * (6 if verb == "says" else 1)
+        pool += [f"({person} waves)", f"{person} is no longer clanning.",
+                 f"{person} has fallen to a {rng.choice(CREATURES)}."]
+        # rank messages quoted in chat are excluded from the counts
+        pool += [f'{person} says, "{w}"' for w in rng.sample(words, 3)]
+    for creature in CREATURES:
+        low = creature.lower()
+        for verb in KILL_VERBS:
+            pool += [f"•You {verb} the {creature}.", f"•You helped {verb} the {creature}."]
+        for group in STUDY_GROUPS:
+            for fn in ("movements", "ways", "essence"):
+                pool.append(f"•You have {group} to learn about the {fn} of the {low}.")
+        pool.append(f"•You abandon your study of the {low}.")
+        for who in ("You", rng.choice(PEOPLE)):
+            for part in PARTS:
+                worth = rng.randint(1, 120)
+                share = max(1, worth // rng.randint(2, 8))
+                recover = "recover" if who == "You" else "recovers"
+                pool.append(f"* {who} {recover} the {creature} {part}, worth {worth}c. "
+                            f"Your share is {share}c.")
+    pool += words * 2
+    return pool
+
+def _timestamp(t):
+    half = "a" if t.hour < 12 else "p"
+    return f"{t.month}/{t.day}/{t.year % 100:02d} {(t.hour % 12) or 12}:{t.minute:02d}:{t.second:02d}{half}"
+
+def generate_logs(out_dir, size, seed=1):
+    """
+    Write about `size` bytes of synthetic logs to out_dir, oldest first
+    (increasing mtimes). Every 7th file is mac_roman. Returns the manifest
+    {"files", "lines", "bytes", ...}, also saved as manifest.json.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    want = {"version": GENERATOR_VERSION, "size": size, "seed": seed}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if all(manifest.get(k) == v for k, v in want.items()):
+            return manifest
+
+    rng = random.Random(seed)
+    words = rcengine._data_lines(open(os.path.join(HERE, "rankmessages.txt"), "rb").read())
+    pools = {enc: _message_pool(random.Random(seed), words, enc == "mac_roman")
+             for enc in ("utf-8", "mac_roman")}
+
+    file_size = min(max(size // 16, 64 * 1024), 8 * 1024 ** 2)
+    clock = datetime(2026, 1, 1, 8, 0, 0)
+    mtime = 1767225600  # 2026-01-01
+    files = lines = written = 0
+    batch = 2000
+
+    while written < size:
+        enc = "mac_roman" if files % 7 == 3 else "utf-8"
+        newline = "\r\n" if files % 2 else "\n"
+        pool = pools[enc]
+        name = f"CL Log {clock:%Y-%m-%d %H.%M.%S}.txt"
+        path = os.path.join(out_dir, name)
+        target = min(file_size, size - written)
+        n_bytes = 0
+        with open(path, "wb") as f:
+            while n_bytes < target:
+                steps = rng.choices((0, 0, 1, 1, 2, 5), k=batch)
+                bodies = rng.choices(pool, k=batch)
+                out = []
+                stamp = _timestamp(clock)
+                for step, body in zip(steps, bodies):
+                    if step:
+                        clock += timedelta(seconds=step)
+                        stamp = _timestamp(clock)
+                    out.append(f"{stamp} {body}")
+                data = (newline.join(out) + newline).encode(enc)
+                f.write(data)
+                n_bytes += len(data)
+                lines += batch
+        os.utime(path, (mtime, mtime))
+        mtime += 3600
+        clock += timedelta(hours=rng.randint(1, 20))
+        written += n_bytes
+        files += 1
+
+    manifest = dict(want, files=files, lines=lines, bytes=written)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def log_files(folder):
+    """The generated logs, oldest first."""
+    paths = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".txt")]
+    return sorted(paths, key=os.path.getmtime)
+
+# -- Stages ------------------------------------------------------------------
+#
+# Each stage runs in a fresh `python rcbench.py _stage NAME DIR` process, so
+# peak RSS is per stage and no stage warms caches for the next one. A stage
+# returns the number of seconds its measured part took.
+
+def _rules():
+    return rcengine.load_rules(
+        os.path.join(HERE, "rankmessages.txt"),
+        os.path.join(HERE, "trainers.txt"),
+        os.path.join(HERE, "specialphrases.txt"),
+    )
+
+def _scan(folder, mode, workers, checkpoints=None):
+    rcengine.SCAN_MODE = mode
+    rcengine.PARSE_WORKERS = workers
+    return rcengine.scan_folder_checkpointed(
+        folder, _rules().words, BENCH_CHARACTER, checkpoints,
+        pool=rcengine.get_process_pool(),
+    )
+
+def stage_scan_mmap(folder):
+    t = time.perf_counter()
+    _scan(folder, "mmap", 1)
+    return time.perf_counter() - t
+
+def stage_scan_stream(folder):
+    t = time.perf_counter()
+    _scan(folder, "stream", 1)
+    return time.perf_counter() - t
+
+def stage_scan_pool(folder):
+    # at least two workers, so one-CPU machines still measure the pool overhead
+    workers = max(os.cpu_count() or 1, 2)
+    rcengine.PARSE_WORKERS = workers
+    rcengine.get_process_pool().submit(int).result()  # start-up is not scan time
+    t = time.perf_counter()
+    _scan(folder, "mmap", workers)
+    return time.perf_counter() - t
+
+def stage_rescan(folder):
+    checkpoints = _scan(folder, "mmap", 1)[6]
+    t = time.perf_counter()
+    _scan(folder, "mmap", 1, checkpoints)
+    return time.perf_counter() - t
+
+def stage_count_coins(folder):
+    def texts():
+        for path in log_files(folder):
+            with open(path, "rb") as f:
+                text, _ = rcengine._decode_log_bytes(f.read())
+            yield text, os.path.getmtime(path)
+    t = time.perf_counter()
+    rcengine.count_coins(texts(), BENCH_CHARACTER)
+    return time.perf_counter() - t
+
+def _log_index_path(folder):
+    return folder.rstrip(os.sep) + ".logindex.db"
+
+def stage_log_scan(folder):
+    # Log Search without the index: every line of every file
+    t = time.perf_counter()
+    for path in log_files(folder):
+        rcengine.search_log_file(path, BENCH_SEARCH_WORD)
+    return time.perf_counter() - t
+
+def stage_log_index(folder):
+    db = _log_index_path(folder)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db + suffix):
+            os.remove(db + suffix)
+    t = time.perf_counter()
+    with rcengine.LogIndex(db) as index:
+        index.update([folder])
+    return time.perf_counter() - t
+
+def stage_log_search(folder):
+    db = _log_index_path(folder)
+    with rcengine.LogIndex(db) as index:
+        index.update([folder])
+    t = time.perf_counter()
+    rcengine.search_logs([folder], BENCH_SEARCH_WORD, db)
+    return time.perf_counter() - t
+
+STAGES = {
+    "scan_mmap": stage_scan_mmap,
+    "scan_stream": stage_scan_stream,
+    "scan_pool": stage_scan_pool,
+    "rescan": stage_rescan,
+    "count_coins": stage_count_coins,
+    "log_scan": stage_log_scan,
+    "log_index": stage_log_index,
+    "log_search": stage_log_search,
+}
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        pass
+    if sys.platform.startswith("win"):
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                    "PagefileUsage", "PeakPagefileUsage",
+                )
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    return None
+
+def _run_stage_here(name, folder):
+    seconds = STAGES[name](folder)
+    print(json.dumps({"seconds": seconds, "peak_rss": peak_rss()}))
+
+def run_stage(name, folder):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "_stage", name, folder],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+# -- Reports -----------------------------------------------------------------
+
+def run_suite(folder, manifest, stages):
+    results = {
+        "meta": {
+            "size": manifest["size"], "seed": manifest["seed"],
+            "generator": manifest["version"], "files": manifest["files"],
+            "lines": manifest["lines"], "bytes": manifest["bytes"],
+            "python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count(), "date": datetime.now().isoformat(timespec="seconds"),
+        },
+        "stages": {},
+    }
+    print(f"{manifest['files']} files, {manifest['lines']:,} lines, "
+          f"{manifest['bytes'] / 1024 ** 2:,.1f} MB")
+    print(f"{'stage':<14}{'wall s':>10}{'lines/s':>14}{'MB/s':>10}{'peak RSS MB':>14}")
+    for name in stages:
+        r = run_stage(name, folder)
+        secs = r["seconds"]
+        rss = r["peak_rss"]
+        results["stages"][name] = stage = {
+            "wall_s": round(secs, 4),
+            "lines_per_s": round(manifest["lines"] / secs) if secs else None,
+            "mb_per_s": round(manifest["bytes"] / 1024 ** 2 / secs, 2) if secs else None,
+            "peak_rss_mb": round(rss / 1024 ** 2, 1) if rss else None,
+        }
+        print(f"{name:<14}{secs:>10.3f}{stage['lines_per_s'] or 0:>14,}"
+              f"{stage['mb_per_s'] or 0:>10.1f}{stage['peak_rss_mb'] or 0:>14.1f}")
+        if name == "log_index":
+            size = os.path.getsize(_log_index_path(folder))
+            stage["index_mb"] = round(size / 1024 ** 2, 1)
+            print(f"{'':<14}index {stage['index_mb']:,.1f} MB, "
+                  f"{size / manifest['bytes']:.2f}x the logs")
+    return results
+
+def compare(results, baseline, tolerance):
+    """Print stages slower than the baseline by more than tolerance; return them."""
+    if (baseline["meta"]["size"], baseline["meta"]["generator"]) != \
+            (results["meta"]["size"], results["meta"]["generator"]):
+        print(f"baseline is for {fmt_size(baseline['meta']['size'])} of logs: not compared")
+        return []
+    slower = []
+    for name, stage in results["stages"].items():
+        base = baseline["stages"].get(name)
+        if not base or not base["wall_s"]:
+            continue
+        change = stage["wall_s"] / base["wall_s"] - 1
+        flag = "REGRESSION" if change > tolerance else ""
+        print(f"{name:<14}{base['wall_s']:>10.3f} -> {stage['wall_s']:.3f} s  {change:+.0%}  {flag}")
+        if flag:
+            slower.append(name)
+    return slower
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RankCounter scan benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="write synthetic logs")
+    gen.add_argument("dir")
+    gen.add_argument("--size", type=parse_size, default=parse_size("10MB"))
+    gen.add_argument("--seed", type=int, default=1)
+
+    run = sub.add_parser("run", help="run the benchmark stages")
+    run.add_argument("--size", type=parse_size, default=parse_size("10MB"),
+                     help="log volume, 1MB to 10GB (default 10MB)")
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--logs", default="bench_logs", help="where generated logs are kept")
+    run.add_argument("--stages", default=",".join(STAGES),
+                     help="comma-separated subset of: " + ", ".join(STAGES))
+    run.add_argument("--baseline", default=BASELINE_FILE)
+    run.add_argument("--save", action="store_true", help="write results as the baseline")
+    run.add_argument("--tolerance", type=float, default=0.2,
+                     help="allowed slow-down before a stage counts as a regression")
+
+    stage = sub.add_parser("_stage")
+    stage.add_argument("name", choices=list(STAGES))
+    stage.add_argument("dir")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "_stage":
+        _run_stage_here(args.name, args.dir)
+        return 0
+
+    if args.command == "generate":
+        t = time.perf_counter()
+        manifest = generate_logs(args.dir, args.size, args.seed)
+        print(f"{manifest['files']} files, {manifest['lines']:,} lines, "
+              f"{manifest['bytes']:,} bytes in {time.perf_counter() - t:.1f} s")
+        return 0
+
+    stages = [s for s in args.stages.split(",") if s]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error("unknown stage(s): " + ", ".join(unknown))
+
+    folder = os.path.join(args.logs, f"{fmt_size(args.size)}-seed{args.seed}")
+    manifest = generate_logs(folder, args.size, args.seed)
+    results = run_suite(folder, manifest, stages)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        return 1 if compare(results, baseline, args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
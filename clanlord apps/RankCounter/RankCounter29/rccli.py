@@ -0,0 +1,190 @@
+"""
+Headless RankCounter: scan characters' log folders and write their ranks,
+creatures and coins as JSON or CSV. Uses rcengine only, so it runs without
+tkinter or a display.
+
+    python rccli.py                          # every character in characters.json
+    python rccli.py Bob Alice --format csv -o ranks.csv
+    python rccli.py Bob --folder /srv/logs/bob --hours 24
+    python rccli.py --state rccli_state.json --db events.db
+
+Characters, their folders and ignored creatures come from the GUI's
+characters.json (--characters), which is only read. With --state, per-file
+checkpoints are kept in that file between runs, so a nightly run only parses
+what was logged since the last one.
+
+CSV rows are: character, section, name, value, detail
+    rank      trainer        ranks
+    creature  study message  message number  kills left
+    coins     Total Skinned / Total Share / Total Coins
+    monster   monster        total worth     "share Nc, you skinned N"
+"""
+from __future__ import annotations
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from datetime import datetime
+
+import rcengine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_json(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_folder(folder):
+    """The folder as the GUI would accept it, or None if it is not there."""
+    norm = os.path.normpath(os.path.expanduser(folder.strip()))
+    if os.path.isdir(norm):
+        return norm
+    if os.path.isdir(folder):
+        return folder
+    return None
+
+
+def scan_character(name, folders, rules, checkpoints, min_time, store, pool):
+    """Scan every folder of one character; returns (merged results, bad folders)."""
+    results, missing = [], []
+    for folder in folders:
+        path = resolve_folder(folder)
+        if path is None:
+            missing.append(folder)
+            continue
+        results.append(rcengine.aggregate_folder(
+            path, name, rules, checkpoints.get(path), min_time, store, pool,
+        ))
+    merged = rcengine.merge_scan_results(results)
+    checkpoints.update(merged["checkpoints"])
+    return merged, missing
+
+
+def character_report(merged, folders, ignored):
+    summary = rcengine.summarize_coin_events(merged["coin_events"])
+    return {
+        "folders": folders,
+        "ranks": merged["ranks"],
+        "creatures": {
+            label: {"message": msg_num, "kills_left": kills_left}
+            for label, (msg_num, kills_left) in merged["creatures"].items()
+            if label not in ignored
+        },
+        "coins": {
+            "skinned": merged["skinned"],
+            "share": merged["share"],
+            "total": merged["skinned"] + merged["share"],
+            "monsters": summary,
+        },
+    }
+
+
+def build_report(names, characters, folder_override, rules, state, min_time, store, pool):
+    """Scan each character; returns (report, True if a folder was missing)."""
+    report = {"generated": datetime.now().isoformat(timespec="seconds"), "characters": {}}
+    failed = False
+    for name in names:
+        info = characters.get(name, {})
+        folders = folder_override or info.get("folders", [])
+        merged, missing = scan_character(
+            name, folders, rules, state.setdefault(name, {}), min_time, store, pool,
+        )
+        for folder in missing:
+            print(f"{name}: folder not found: {folder}", file=sys.stderr)
+            failed = True
+        report["characters"][name] = character_report(
+            merged, folders, info.get("ignored", []),
+        )
+    return report, failed
+
+
+def write_json(report, out):
+    json.dump(report, out, indent=2, ensure_ascii=False)
+    out.write("\n")
+
+
+def write_csv(report, out):
+    w = csv.writer(out)
+    w.writerow(["character", "section", "name", "value", "detail"])
+    for name, data in report["characters"].items():
+        for trainer, count in data["ranks"].items():
+            w.writerow([name, "rank", trainer, count, ""])
+        for label, c in data["creatures"].items():
+            w.writerow([name, "creature", label, c["message"], c["kills_left"]])
+        coins = data["coins"]
+        w.writerow([name, "coins", "Total Skinned", coins["skinned"], ""])
+        w.writerow([name, "coins", "Total Share", coins["share"], ""])
+        w.writerow([name, "coins", "Total Coins", coins["total"], ""])
+        for monster, m in coins["monsters"].items():
+            w.writerow([name, "monster", monster, m["total_worth"],
+                        f"share {m['total_share']}c, you skinned {m['your_skins']}"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan Clan Lord logs without the GUI.")
+    parser.add_argument("names", nargs="*", metavar="CHARACTER",
+                        help="characters to scan (default: all in --characters)")
+    parser.add_argument("--characters", default="characters.json",
+                        help="the GUI's character file (default: characters.json)")
+    parser.add_argument("--folder", action="append", default=[],
+                        help="scan this folder instead of the configured ones "
+                             "(repeatable, needs exactly one CHARACTER)")
+    parser.add_argument("--hours", type=float,
+                        help="only count coins logged in the last N hours (by line timestamp)")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--state", help="JSON file that keeps scan checkpoints between runs")
+    parser.add_argument("--db", help="also store every event in this SQLite file "
+                                     "(give it on every run that uses the same --state)")
+    parser.add_argument("--data", default=HERE,
+                        help="folder with rankmessages.txt, trainers.txt and specialphrases.txt")
+    args = parser.parse_args(argv)
+
+    characters = load_json(args.characters)
+    names = args.names or list(characters)
+    if args.folder and len(names) != 1:
+        parser.error("--folder needs exactly one CHARACTER")
+    if not names:
+        parser.error(f"no characters given and none in {args.characters}")
+    unknown = [n for n in names if n not in characters and not args.folder]
+    if unknown:
+        parser.error(f"not in {args.characters}: {', '.join(unknown)}")
+
+    rules = rcengine.load_rules(
+        os.path.join(args.data, "rankmessages.txt"),
+        os.path.join(args.data, "trainers.txt"),
+        os.path.join(args.data, "specialphrases.txt"),
+    )
+    min_time = time.time() - args.hours * 3600 if args.hours else None
+    state = load_json(args.state)
+    pool = rcengine.get_process_pool()
+
+    if args.db:
+        with rcengine.EventStore(args.db) as store:
+            report, failed = build_report(names, characters, args.folder, rules,
+                                          state, min_time, store, pool)
+    else:
+        report, failed = build_report(names, characters, args.folder, rules,
+                                      state, min_time, None, pool)
+
+    if args.state:
+        with open(args.state, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+    write = write_csv if args.format == "csv" else write_json
+    if args.output == "-":
+        write(report, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            write(report, f)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
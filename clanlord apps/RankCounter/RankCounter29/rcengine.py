@@ -0,0 +1,2272 @@
+"""
+Log parsing engine for RankCounter: rank, kill, study and coin parsing,
+per-file checkpoints and folder scans. Nothing here imports tkinter, so
+the module can be used headless and imported by parse worker processes.
+"""
+from __future__ import annotations
+import os
+import sys
+import re
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+import codecs
+import collections
+import array
+import bisect
+import hashlib
+import itertools
+import json
+import sqlite3
+import mmap
+import functools
+import threading
+import multiprocessing
+import concurrent.futures
+from datetime import date, datetime
+
+# -- Study stages ------------------------------------------------------------
+
+kills_to_next = {
+    "almost nothing left to learn about the movements of the": {1:4,2:2,3:2,4:2,5:2},
+    "almost nothing left to learn about the ways of the": {1:4,2:2,3:2,4:2,5:2},
+    "almost nothing left to learn about the essence of the": {1:4,2:2,3:2,4:2,5:2},
+
+    "a few things to learn about the movements of the": {1:3,2:3,3:3,4:3,5:3},
+    "a few things to learn about the ways of the": {1:3,2:3,3:3,4:3,5:3},
+    "a few things to learn about the essence of the": {1:3,2:3,3:3,4:3,5:3},
+
+    "more than a few things to learn about the ways of the": {1:7,2:7,3:7,4:7,5:8},
+    "more than a few things to learn about the essence of the": {1:7,2:7,3:7,4:7,5:8},
+
+    "some things to learn about the ways of the": {1:12,2:12,3:12,4:12,5:12,6:12,7:9},
+    "some things to learn about the essence of the": {1:12,2:12,3:12,4:12,5:12,6:12,7:9},
+
+    "many things to learn about the ways of the": {1:20,2:20,3:20,4:20,5:20,6:20,7:16},
+    "many things to learn about the essence of the": {1:20,2:20,3:20,4:20,5:20,6:20,7:16},
+
+    "much to learn about the ways of the": {1:30,2:30,3:30,4:30,5:30,6:30,7:20},
+    "much to learn about the essence of the": {1:30,2:30,3:30,4:30,5:30,6:30,7:20},
+
+    "a lot to learn about the ways of the": {1:100,2:30,3:30,4:30,5:30},
+    "a lot to learn about the essence of the": {1:100,2:30,3:30,4:30,5:30},
+
+    "a vast amount to learn about the ways of the": {1:100,2:100,3:100,4:100,5:100,6:100},
+    "a vast amount to learn about the essence of the": {1:100,2:100,3:100,4:100,5:100,6:100}
+}
+
+kills_table = [
+    (1,  "almost nothing", 2),
+    (2,  "almost nothing", 2),
+    (3,  "almost nothing", 2),
+    (4,  "almost nothing", 2),
+    (5,  "almost nothing", 4),
+
+    (6,  "a few", 3),
+    (7,  "a few", 3),
+    (8,  "a few", 3),
+    (9,  "a few", 3),
+    (10, "a few", 3),
+
+    (11, "more than a few", 8),
+    (12, "more than a few", 7),
+    (13, "more than a few", 7),
+    (14, "more than a few", 7),
+    (15, "more than a few", 7),
+
+    (16, "some things", 9),
+    (17, "some things", 12),
+    (18, "some things", 12),
+    (19, "some things", 12),
+    (20, "some things", 12),
+    (21, "some things", 12),
+    (23, "some things", 12),
+
+    (24, "many things", 16),
+    (25, "many things", 20),
+    (26, "many things", 20),
+    (27, "many things", 20),
+    (28, "many things", 20),
+    (29, "many things", 20),
+    (30, "many things", 20),
+
+    (31, "much to learn", 20),
+    (32, "much to learn", 30),
+    (33, "much to learn", 30),
+    (34, "much to learn", 30),
+    (35, "much to learn", 30),
+    (36, "much to learn", 30),
+    (37, "much to learn", 30),
+
+    (38, "a lot to learn", 30),
+    (39, "a lot to learn", 30),
+    (40, "a lot to learn", 30),
+    (41, "a lot to learn", 30),
+    (42, "a lot to learn", 100),
+
+    (43, "a vast amount", 100),
+    (44, "a vast amount", 100),
+    (45, "a vast amount", 100),
+    (46, "a vast amount", 100),
+    (47, "a vast amount", 100),
+    (48, "a vast amount", 100),
+]
+
+phrase_to_msgnums = {}
+for msg_num, phrase_group, _kills_required in kills_table:
+    phrase_to_msgnums.setdefault(phrase_group, []).append(msg_num)
+
+
+# -- Shared Exclusion Helper -------------------------------------------------
+
+EXCLUDED_MARKERS = ("says,", "growls,", "yells,", "ponders,", "thinks,")
+
+def is_excluded(line: str) -> bool:
+    """Return True if the line should be skipped."""
+    return _is_excluded_low(line.lower().strip())
+
+def _is_excluded_low(low: str) -> bool:
+    """is_excluded() for a line that is already lowercased and stripped."""
+    if any(exc in low for exc in EXCLUDED_MARKERS):
+        return True
+    if low.startswith("(") and low.endswith(")"):
+        return True
+    if "):" in low:
+        return True
+    return False
+
+# -- Line patterns (compiled once) ------------------------------------------
+
+# Timestamp format: 5/10/26 8:35:19a • You have many things...
+TS_RE = re.compile(r"^(\d+/\d+/\d+ \d+:\d+:\d+[ap])\s*[•>:-]*\s*(.*)$")
+
+# Study message regex
+STUDY_RE = re.compile(
+    r"You have (almost nothing|a few|more than a few|some things|many things|much to learn|a lot to learn|a vast amount)"
+    r" to learn about the (movements|ways|essence) of the (.+?)\.",
+    re.IGNORECASE
+)
+
+# Kill message regex
+KILL_RE = re.compile(
+    r"(?:you|you helped)\s+(?:slaughtered|dispatched|killed|vanquished)\s+the\s+(.+?)\.",
+    re.IGNORECASE
+)
+KILL_VERBS = ("slaughtered", "dispatched", "killed", "vanquished")
+
+ABANDON_RE = re.compile(r"you abandon your study of the (.+?)\.")
+
+COIN_RE = re.compile(
+    r"\*\s*(You|.+?) recover[s]? the (.+?) (?:fur|blood|mandibles), worth (\d+)c\. Your share is (\d+)c",
+    re.IGNORECASE
+)
+
+# -- Timestamps --------------------------------------------------------------
+#
+# Lines start with a timestamp like "5/10/26 8:35:19a" (month/day/year,
+# 12-hour clock, a/p). strptime's %p only knows AM/PM, so these are split by
+# hand: consecutive lines share a date, which is looked up once and cached,
+# and the time of day is plain integer arithmetic.
+
+LINE_TS_RE = re.compile(r"\s*(\d+/\d+/\d+) (\d+:\d+:\d+[ap])")
+
+_log_dates = {}
+
+def _log_date(date_part):
+    """'5/10/26' -> (2026, 5, 10, '2026-05-10T'), or None."""
+    hit = _log_dates.get(date_part, False)
+    if hit is False:
+        hit = None
+        month, _, rest = date_part.partition("/")
+        day, _, year = rest.partition("/")
+        if len(year) == 2:
+            try:
+                year = int(year)
+                d = date(year + (1900 if year >= 69 else 2000), int(month), int(day))
+                hit = (d.year, d.month, d.day, d.isoformat() + "T")
+            except ValueError:
+                pass
+        if len(_log_dates) >= 4096:
+            _log_dates.clear()
+        _log_dates[date_part] = hit
+    return hit
+
+def _log_seconds(time_part):
+    """'8:35:19a' -> seconds since midnight, or None."""
+    hours, _, rest = time_part.partition(":")
+    minutes, _, seconds = rest.partition(":")
+    half = seconds[-1:]
+    try:
+        h, m, sec = int(hours), int(minutes), int(seconds[:-1])
+    except ValueError:
+        return None
+    if half not in ("a", "p") or not (1 <= h <= 12 and m < 60 and sec < 60):
+        return None
+    return ((h % 12) + (12 if half == "p" else 0)) * 3600 + m * 60 + sec
+
+def parse_log_timestamp(ts_raw):
+    """'5/10/26 8:35:19a' -> datetime, or None if it is not a valid timestamp."""
+    date_part, _, time_part = ts_raw.partition(" ")
+    day = _log_date(date_part)
+    secs = _log_seconds(time_part)
+    if day is None or secs is None:
+        return None
+    return datetime(day[0], day[1], day[2], secs // 3600, secs // 60 % 60, secs % 60)
+
+def log_timestamp_iso(ts_raw):
+    """Like parse_log_timestamp(ts_raw).isoformat(), without building a datetime."""
+    date_part, _, time_part = ts_raw.partition(" ")
+    day = _log_date(date_part)
+    secs = _log_seconds(time_part)
+    if day is None or secs is None:
+        return None
+    return "%s%02d:%02d:%02d" % (day[3], secs // 3600, secs // 60 % 60, secs % 60)
+
+def line_timestamp(line):
+    """ISO timestamp a log line starts with, or None."""
+    m = LINE_TS_RE.match(line)
+    return log_timestamp_iso(f"{m.group(1)} {m.group(2)}") if m else None
+
+# Line timestamps are the player's local time, so time windows are compared
+# as local ISO strings, which sort like the times they stand for.
+
+def iso_time(epoch):
+    """Seconds since the epoch as a local ISO timestamp."""
+    return datetime.fromtimestamp(epoch).isoformat(timespec="seconds")
+
+def event_time(ts, file_time):
+    """When an event was logged: its line timestamp, else its file's mtime."""
+    return ts or iso_time(file_time)
+
+# -- Rank phrase matcher (Aho-Corasick) --------------------------------------
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of phrases. One walk over a line
+    finds every phrase in it, so the cost no longer grows with the number of
+    phrases. count() gives the same numbers as line.count(phrase) for each
+    phrase: different phrases may overlap each other, but repeats of the
+    same phrase are counted non-overlapping, left to right.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = []
+        self.multiplicity = []
+        index = {}
+        for p in phrases:
+            if not p:
+                continue
+            if p in index:
+                # duplicate lines in rankmessages.txt count once per copy
+                self.multiplicity[index[p]] += 1
+                continue
+            index[p] = len(self.phrases)
+            self.phrases.append(p)
+            self.multiplicity.append(1)
+        self.lengths = [len(p) for p in self.phrases]
+
+        goto = [{}]
+        out = [()]
+        for i, p in enumerate(self.phrases):
+            state = 0
+            for ch in p:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (i,)
+
+        # Breadth-first failure links; outputs of the failure state are
+        # merged in so every match is reported at the state where it ends.
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def count(self, text, counts):
+        """Add occurrences of each phrase in text to counts (list by phrase index)."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self.lengths
+        last_end = {}
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for idx in out[state]:
+                    if end - lengths[idx] >= last_end.get(idx, 0):
+                        counts[idx] += 1
+                        last_end[idx] = end
+        return counts
+
+    def counts_by_phrase(self, counts):
+        """Turn an index-based counts list into {phrase: count}."""
+        return {p: counts[i] * self.multiplicity[i] for i, p in enumerate(self.phrases)}
+
+
+_phrase_matchers = {}
+
+def get_phrase_matcher(words):
+    """Build the matcher for a phrase list once and reuse it afterwards."""
+    key = tuple(words)
+    matcher = _phrase_matchers.get(key)
+    if matcher is None:
+        matcher = _phrase_matchers[key] = PhraseMatcher(key)
+    return matcher
+
+# -- Line consumers ----------------------------------------------------------
+#
+# Each consumer gets every line once from dispatch_lines() as
+# (line, low, file_time), where low is line.lower(). The cheap substring
+# checks at the top of each feed() skip the regex for lines that cannot match.
+# When a consumer's sink is a list, every event it counts is also appended
+# to it as (type, subject, detail, n, worth, share, skinned, timestamp),
+# timestamp being the line's line_timestamp().
+
+class RankConsumer:
+    """Counts rank messages (case-sensitive, same counts as line.count per phrase)."""
+
+    def __init__(self, words, sink=None):
+        self.words = list(words)
+        self.sink = sink
+        self.matcher = get_phrase_matcher(self.words)
+        self._counts = [0] * len(self.matcher.phrases)
+        # Every rankmessages.txt line starts with the bullet, so lines without
+        # it can be skipped before the exclusion check.
+        firsts = {w[0] for w in self.words if w}
+        self.anchor = firsts.pop() if len(firsts) == 1 else None
+
+    @property
+    def counts(self):
+        by_phrase = self.matcher.counts_by_phrase(self._counts)
+        return {w: by_phrase.get(w, 0) for w in self.words}
+
+    def feed(self, line, low, file_time):
+        if self.anchor is not None and self.anchor not in line:
+            return
+        if _is_excluded_low(low.strip()):
+            return
+        if self.sink is None:
+            self.matcher.count(line, self._counts)
+            return
+        hits = self.matcher.count(line, collections.defaultdict(int))
+        ts = line_timestamp(line) if hits else None
+        for idx, c in hits.items():
+            self._counts[idx] += c
+            phrase = self.matcher.phrases[idx]
+            n = c * self.matcher.multiplicity[idx]
+            self.sink.append(("rank", phrase, None, n, None, None, None, ts))
+
+
+class KillConsumer:
+    """Counts kills per creature (lowercased creature name)."""
+
+    def __init__(self, sink=None):
+        self.counts = {}
+        self.sink = sink
+
+    def feed(self, line, low, file_time):
+        if not any(v in low for v in KILL_VERBS):
+            return
+        m = KILL_RE.search(line)
+        if m:
+            creature = m.group(1).strip().lower()
+            self.counts[creature] = self.counts.get(creature, 0) + 1
+            if self.sink is not None:
+                self.sink.append(("kill", creature, None, 1, None, None, None, line_timestamp(line)))
+
+
+class StudyConsumer:
+    """
+    Collects study messages per creature. kills_left depends on the kill
+    totals for the whole scan, so it is filled in by finish().
+    """
+
+    def __init__(self, sink=None):
+        self.special_occ = {}
+        self.abandoned = set()
+        self.sink = sink
+
+    def feed(self, line, low, file_time):
+        if "to learn about the" not in low and "you abandon your study of the" not in low:
+            return
+
+        raw_line = line.strip()
+        if not raw_line:
+            return
+
+        # Extract timestamp + message
+        m = TS_RE.match(raw_line)
+        if not m:
+            return
+
+        ts_raw, msg = m.groups()
+        msg_low = msg.lower()
+
+        # Abandon study (this is the ONLY old rule we keep)
+        if "you abandon your study of the" in msg_low:
+            m_ab = ABANDON_RE.search(msg_low)
+            if m_ab:
+                creature = m_ab.group(1).strip().lower()
+                self.special_occ.pop(creature, None)
+                self.abandoned.add(creature)
+                if self.sink is not None:
+                    self.sink.append(("abandon", creature, None, 1, None, None, None,
+                                      log_timestamp_iso(ts_raw)))
+            return
+
+        # Study progression message
+        m2 = STUDY_RE.search(msg)
+        if not m2:
+            return
+
+        # Convert timestamp
+        timestamp = parse_log_timestamp(ts_raw)
+
+        phrase_group = m2.group(1).lower()
+        function     = m2.group(2).lower()
+        creature     = m2.group(3).strip().lower()
+
+        self.special_occ.setdefault(creature, []).append({
+            "phrase_group": phrase_group,
+            "function": function,
+            "timestamp": timestamp,
+            "creature": creature,
+        })
+        if self.sink is not None:
+            ts = timestamp.isoformat() if timestamp else None
+            self.sink.append(("study", creature, f"{phrase_group}|{function}", 1, None, None, None, ts))
+
+    def finish(self, kill_counts):
+        return build_study_entries(self.special_occ, kill_counts)
+
+
+def build_study_entries(raw_occ, kill_counts):
+    """
+    Turn raw study messages { creature: [raw, ...] } into the entries
+    count_special_lines() returns, with kills_left from the kill totals.
+    """
+    special_occ = {}
+    for trainer_clean, entries in raw_occ.items():
+        kills_done = kill_counts.get(trainer_clean, 0)
+        out = special_occ.setdefault(trainer_clean, [])
+        for e in entries:
+            phrase_group = e["phrase_group"]
+            function = e["function"]
+
+            # Build kills_to_next lookup key
+            kt_key = f"{phrase_group} to learn about the {function} of the"
+            stage_table = kills_to_next.get(kt_key, {})
+
+            if stage_table:
+                total_required = sum(stage_table.values())
+                kills_left = max(total_required - kills_done, 0)
+            else:
+                kills_left = None
+
+            # Build display label
+            display_label = f"You have {phrase_group} to learn about the {function} of the {e['creature']}."
+            if kills_left is not None:
+                display_label += f" — {kills_left} kills left"
+
+            out.append({
+                "phrase_group": phrase_group,
+                "function": function,
+                "timestamp": e["timestamp"],
+                "kills_left": kills_left,
+                "count": 1,
+                "display_label": display_label,
+            })
+    return special_occ
+
+
+class CoinConsumer:
+    """Sums coin recoveries, skipping lines logged before min_time."""
+
+    def __init__(self, character_name, min_time=None, sink=None):
+        self.character_name = character_name
+        self.min_time = min_time
+        self.since = iso_time(min_time) if min_time else None
+        self.sink = sink
+        self.skinned_total = 0
+        self.share_total = 0
+        self.events = []
+
+    def feed(self, line, low, file_time):
+        # nothing in a file can be newer than the file itself
+        if self.min_time and file_time < self.min_time:
+            return
+        if "recover" not in low:
+            return
+        m = COIN_RE.search(line)
+        if not m:
+            return
+        ts = line_timestamp(line)
+        if self.since and event_time(ts, file_time) < self.since:
+            return
+
+        player, monster, worth, share = m.groups()
+        did_skin = (player == "You" or player == self.character_name)
+
+        worth = int(worth)
+        share = int(share)
+
+        if did_skin:
+            self.skinned_total += worth
+        self.share_total += share
+
+        self.events.append({
+            "monster": monster,
+            "worth": worth,
+            "share": share,
+            "skinned": did_skin,
+            "file_time": file_time,
+            "timestamp": ts,
+        })
+        if self.sink is not None:
+            self.sink.append(("coin", monster, None, 1, worth, share, int(did_skin), ts))
+
+
+def dispatch_lines(texts, consumers):
+    """Read every line of every text once and hand it to all consumers."""
+    feeds = [c.feed for c in consumers]
+    for content, file_time in texts:
+        for line in content.splitlines():
+            low = line.lower()
+            for feed in feeds:
+                feed(line, low, file_time)
+    return consumers
+
+
+def count_special_lines(texts):
+    """
+    Extracts all study-related lines and returns:
+        special_occ: { trainer_clean: [entry, entry, ...] }
+        exclude: set()   (kept for compatibility)
+
+    Each entry contains:
+        phrase_group, function, timestamp, kills_left, count, display_label
+    """
+    kills = KillConsumer()
+    study = StudyConsumer()
+    dispatch_lines(texts, [kills, study])
+    return study.finish(kills.counts), set()
+
+# -- Coin Scanning -----------------------------------------------------------
+
+def count_coins(texts, character_name, min_time=None):
+    coins = CoinConsumer(character_name, min_time)
+    dispatch_lines(texts, [coins])
+    return coins.skinned_total, coins.share_total, coins.events
+
+# -- Incremental scan checkpoints --------------------------------------------
+#
+# character_checkpoints[name][folder][file_path] = {
+#     "format", "size", "mtime", "offset", "encoding", "state"
+# }
+# "state" is what the parsers found in bytes [0, offset) of that file:
+#     ranks  {phrase: count}
+#     kills  {creature: count}
+#     study  {creature: [abandoned, phrase_group, function, timestamp]}
+#     coins  [[monster, worth, share, skinned, timestamp], ...]
+# Coins logged more than COIN_DETAIL_SECONDS before a scan are folded into
+# one [monster, worth, share, skinned, timestamp, n] row per monster and
+# skinned flag (worth and share summed, timestamp the latest, n coins), so
+# an entry stays small however many coins its log holds. No time filter
+# reaches back that far; "All logs" sees the sums. A window that does reach
+# further back counts a folded row at its timestamp.
+# offset always sits just after a line break. A trailing partial line is
+# parsed on every scan but only committed once the game finishes writing it.
+# "encoding" is None before anything is committed and "ascii" while every
+# committed byte is ASCII. UTF-8 and mac_roman read ASCII the same, so the
+# first non-ASCII block settles "utf-8" or "mac_roman" without re-reading
+# the file; only a non-UTF-8 block after UTF-8 text means starting over.
+# Files are read SCAN_BLOCK_SIZE bytes at a time, so memory use does not
+# grow with the size of the log archive (or of a single huge log).
+# Entries whose "format" is not CHECKPOINT_FORMAT are parsed again.
+
+# 2: timestamps are parsed (they were always None before) and kept on coins
+CHECKPOINT_FORMAT = 2
+
+SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+COIN_DETAIL_SECONDS = 24 * 60 * 60  # the longest time filter
+
+# "mmap": map each log and decode only lines containing an ASCII anchor some
+#         consumer looks for (matched ASCII case-insensitively);
+# "stream": decode every block. Both give the same counts.
+SCAN_MODE = "mmap"
+
+def _empty_file_state():
+    return {"ranks": {}, "kills": {}, "study": {}, "coins": []}
+
+def _new_file_entry(encoding=None):
+    return {"format": CHECKPOINT_FORMAT, "size": 0, "mtime": 0, "offset": 0,
+            "encoding": encoding, "state": _empty_file_state()}
+
+def _study_key(ts):
+    # Same order as sorting on (timestamp is None, timestamp): untimed last
+    return (ts is None, ts or "")
+
+def _later_study(old, new):
+    """Pick the more recent of two [phrase_group, function, timestamp] records."""
+    if old is None:
+        return new
+    if new is None:
+        return old
+    return new if _study_key(new[2]) >= _study_key(old[2]) else old
+
+def _merge_file_state(state, part):
+    """Fold part (parsed after state) into state, in place."""
+    ranks = state["ranks"]
+    for w, c in part["ranks"].items():
+        ranks[w] = ranks.get(w, 0) + c
+
+    kills = state["kills"]
+    for k, c in part["kills"].items():
+        kills[k] = kills.get(k, 0) + c
+
+    study = state["study"]
+    for creature, (abandoned, *rec) in part["study"].items():
+        rec = rec if rec[0] is not None else None
+        prev = study.get(creature)
+        if abandoned or prev is None or prev[1] is None:
+            # An abandon drops everything before it; re-adding moves the
+            # creature to the end, like popping it from special_occ did.
+            study.pop(creature, None)
+            was_abandoned = abandoned or bool(prev and prev[0])
+            study[creature] = [was_abandoned] + (rec or [None, None, None])
+        else:
+            study[creature] = [prev[0]] + _later_study(prev[1:], rec)
+
+    state["coins"].extend(part["coins"])
+    return state
+
+def _parse_chunk(text, words, character_name, sink=None):
+    """Parse a block of complete lines into a fresh file state."""
+    rank  = RankConsumer(words, sink)
+    kills = KillConsumer(sink)
+    study = StudyConsumer(sink)
+    coins = CoinConsumer(character_name, sink=sink)
+    dispatch_lines([(text, 0)], [rank, kills, study, coins])
+
+    study_state = {}
+    for creature in study.abandoned:
+        if creature not in study.special_occ:
+            study_state[creature] = [True, None, None, None]
+    for creature, entries in study.special_occ.items():
+        best = None
+        for e in entries:
+            ts = e["timestamp"].isoformat() if e["timestamp"] else None
+            best = _later_study(best, [e["phrase_group"], e["function"], ts])
+        study_state[creature] = [creature in study.abandoned] + best
+
+    return {
+        "ranks": {w: c for w, c in rank.counts.items() if c},
+        "kills": kills.counts,
+        "study": study_state,
+        "coins": [[e["monster"], e["worth"], e["share"], e["skinned"], e["timestamp"]]
+                  for e in coins.events],
+    }
+
+def _decode_log_bytes(data, encoding=None, trusted=False):
+    """
+    Decode as UTF-8, else mac_roman; returns (text, encoding used). encoding
+    is what the file read as so far; trusted means it is known to hold for
+    these bytes too, so nothing is validated.
+    """
+    if trusted and encoding == "ascii":
+        return data.decode("latin-1"), "ascii"
+    if encoding == "mac_roman":
+        return codecs.getincrementaldecoder("mac_roman")().decode(data), "mac_roman"
+    if data.isascii():
+        return data.decode("ascii"), encoding or "ascii"
+    try:
+        # Like codecs.open().read(), an incomplete trailing sequence
+        # (a line still being written) is dropped rather than an error
+        return codecs.getincrementaldecoder("utf-8")().decode(data), "utf-8"
+    except UnicodeDecodeError:
+        if encoding == "utf-8":
+            raise
+    return codecs.getincrementaldecoder("mac_roman")().decode(data), "mac_roman"
+
+# -- Byte-level candidate scan (SCAN_MODE "mmap") ----------------------------
+
+_candidate_anchors = {}
+
+def get_candidate_anchors(words):
+    """
+    Lowercase byte strings, one of which is in every line any consumer could
+    match, or None when the rank phrases share no first character.
+    """
+    key = tuple(words)
+    if key not in _candidate_anchors:
+        anchors = None
+        firsts = {w[0] for w in words if w}
+        if len(firsts) == 1:
+            anchor = firsts.pop()
+            anchors = [b"recover", b"to learn about the", b"you abandon your study of the"]
+            anchors += [v.encode("ascii") for v in KILL_VERBS]
+            # the bullet is E2 80 A2 in UTF-8 logs and A5 in mac_roman ones
+            for enc in ("utf-8", "mac_roman"):
+                try:
+                    anchors.append(anchor.encode(enc).lower())
+                except UnicodeEncodeError:
+                    pass
+            anchors = tuple(anchors)
+        _candidate_anchors[key] = anchors
+    return _candidate_anchors[key]
+
+def _decode_candidates(buf, start, end, anchors, encoding=None, trusted=False):
+    """
+    Like _decode_log_bytes(buf[start:end], encoding, trusted), but the text
+    only holds the lines containing one of the anchors; no str is built for
+    the rest. Unless trusted, UTF-8 validity is still checked for the whole
+    range, in C.
+    """
+    low = buf[start:end].lower()  # ASCII-only lowering, like the anchors
+
+    if encoding == "mac_roman" or (trusted and encoding is not None):
+        enc = encoding
+    elif low.isascii():
+        enc = encoding or "ascii"
+    else:
+        enc = "utf-8"
+        try:
+            codecs.utf_8_decode(low, "strict", False)
+        except UnicodeDecodeError:
+            if encoding == "utf-8":
+                raise
+            enc = "mac_roman"
+
+    # bytes.find per anchor runs at memchr speed; only hits reach Python
+    size = len(low)
+    spans = {}
+    for anchor in anchors:
+        i = low.find(anchor)
+        while i != -1:
+            line_start = low.rfind(b"\n", 0, i) + 1
+            line_start = low.rfind(b"\r", line_start, i) + 1 or line_start
+            line_end = low.find(b"\n", i)
+            if line_end == -1:
+                line_end = size
+            cr = low.find(b"\r", i, line_end)
+            if cr != -1:
+                line_end = cr
+            spans[line_start] = line_end
+            i = low.find(anchor, line_end)
+
+    lines = [buf[start + ls:start + spans[ls]] for ls in sorted(spans)]
+    codec = "latin-1" if enc == "ascii" else enc
+    return codecs.getincrementaldecoder(codec)().decode(b"\n".join(lines)), enc
+
+def _fold_coins(entry, before):
+    """entry with its coins logged before the ISO time before folded (see above)."""
+    coins = entry["state"]["coins"]
+    folded = {}
+    keep = []
+    rows = raw = 0
+    for row in coins:
+        monster, worth, share, skinned, ts = row[:5]
+        ts = event_time(ts, entry["mtime"])
+        if ts >= before:
+            keep.append(row)
+            continue
+        rows += 1
+        raw += len(row) == 5
+        n = row[5] if len(row) > 5 else 1
+        acc = folded.get((monster, skinned))
+        if acc is None:
+            folded[monster, skinned] = [monster, worth, share, skinned, ts, n]
+        else:
+            acc[1] += worth
+            acc[2] += share
+            acc[4] = max(acc[4], ts)
+            acc[5] += n
+    if not raw and rows == len(folded):
+        return entry  # nothing new to fold
+    state = dict(entry["state"], coins=list(folded.values()) + keep)
+    return dict(entry, state=state)
+
+def _copy_file_state(state):
+    return {
+        "ranks": dict(state["ranks"]),
+        "kills": dict(state["kills"]),
+        "study": {k: list(v) for k, v in state["study"].items()},
+        "coins": list(state["coins"]),
+    }
+
+def iter_line_blocks(f, start, end, block_size=None):
+    """
+    Read bytes [start, end) of a binary file a block at a time and yield
+    (pos, data, complete). Complete blocks end on a line break; a trailing
+    partial line comes last with complete=False. Only one block is held in
+    memory at a time, however large the file.
+    """
+    block_size = block_size or SCAN_BLOCK_SIZE
+    f.seek(start)
+    pos = start
+    carry = b""
+    remaining = end - start
+    while remaining > 0:
+        data = f.read(min(block_size, remaining))
+        if not data:
+            break
+        remaining -= len(data)
+        data = carry + data
+        cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+        carry = data[cut:]
+        if cut:
+            yield pos, data[:cut], True
+            pos += cut
+    if carry:
+        yield pos, carry, False
+
+def iter_log_chunks(f, start, end, words):
+    """
+    Yield (pos, length, complete, decode) for bytes [start, end) of an open
+    log, where decode(encoding) returns (text, encoding) like
+    _decode_log_bytes(). In "mmap" mode the file is mapped and the text only
+    holds lines a consumer could match.
+    """
+    anchors = get_candidate_anchors(words) if SCAN_MODE == "mmap" else None
+    if anchors is None or end <= start:
+        for pos, data, complete in iter_line_blocks(f, start, end):
+            yield pos, len(data), complete, functools.partial(_decode_log_bytes, data)
+        return
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = min(end, len(mm))
+        pos = start
+        while pos < end:
+            # windows of about SCAN_BLOCK_SIZE, cut after a line break
+            stop = min(pos + SCAN_BLOCK_SIZE, end)
+            cut = max(mm.rfind(b"\n", pos, stop), mm.rfind(b"\r", pos, stop)) + 1
+            if cut <= pos:
+                ends = [e for e in (mm.find(b"\n", stop, end), mm.find(b"\r", stop, end)) if e != -1]
+                if not ends:
+                    yield pos, end - pos, False, functools.partial(_decode_candidates, mm, pos, end, anchors)
+                    return
+                cut = min(ends) + 1
+            yield pos, cut - pos, True, functools.partial(_decode_candidates, mm, pos, cut, anchors)
+            pos = cut
+
+def update_file_checkpoint(fpath, entry, words, character_name, store=None, known=None):
+    """
+    Bring one file's checkpoint up to date, parsing only bytes past its
+    offset. Returns (entry, state) where state also covers any trailing
+    partial line. The entry passed in is never modified, so the Tk thread
+    can keep saving the old checkpoints while a scan runs. Committed events
+    are written to store (an EventStore) when one is given. known is the
+    file's encoding cache record, used when it is parsed from the start.
+    """
+    st = os.stat(fpath)
+    if entry is not None and (
+        entry.get("format") != CHECKPOINT_FORMAT
+        or st.st_size < entry["size"]
+        or (st.st_size == entry["size"] and st.st_mtime != entry["mtime"])
+    ):
+        entry = None  # old format, truncated or rewritten: start over
+
+    trusted = False
+    if entry is None:
+        trusted = known is not None and known[:2] == (st.st_size, st.st_mtime)
+        entry = _new_file_entry(known[2] if trusted else None)
+        if store is not None:
+            store.write_chunk(character_name, fpath, 0, st.st_mtime, [])
+    entry = dict(entry, size=st.st_size, mtime=st.st_mtime)
+
+    if st.st_size == entry["offset"]:
+        return entry, entry["state"]
+
+    partial = None
+    with open(fpath, "rb") as f:
+        for pos, length, complete, decode in iter_log_chunks(f, entry["offset"], st.st_size, words):
+            try:
+                text, enc = decode(entry["encoding"], trusted)
+            except UnicodeDecodeError:
+                if complete:
+                    # Appended bytes are not UTF-8, but earlier non-ASCII text
+                    # was: the whole file reads as mac_roman
+                    entry = _new_file_entry("mac_roman")
+                    return update_file_checkpoint(fpath, entry, words, character_name, store)
+                # Not UTF-8 (yet): for this scan the whole file reads as
+                # mac_roman, but nothing is committed in case the line is
+                # still being written.
+                state = _empty_file_state()
+                for _pos, _length, _complete, whole in iter_log_chunks(f, 0, st.st_size, words):
+                    text, _ = whole("mac_roman")
+                    _merge_file_state(state, _parse_chunk(text, words, character_name))
+                return entry, state
+
+            if not complete:
+                partial = text
+                break
+
+            events = [] if store is not None else None
+            state = _copy_file_state(entry["state"])
+            _merge_file_state(state, _parse_chunk(text, words, character_name, events))
+            if store is not None:
+                store.write_chunk(character_name, fpath, pos, st.st_mtime, events)
+            entry.update(state=state, encoding=enc, offset=pos + length)
+
+    if partial is None:
+        return entry, entry["state"]
+
+    state = _copy_file_state(entry["state"])
+    return entry, _merge_file_state(state, _parse_chunk(partial, words, character_name))
+
+# -- Compiled rules ----------------------------------------------------------
+#
+# rankmessages.txt, trainers.txt and specialphrases.txt are compiled once
+# into a RuleSet: the rank phrase matcher and candidate anchors, plus the
+# phrase -> trainer mapping. load_rules() only reads the files' bytes to
+# hash them, so a scan reuses the RuleSet until one of them changes; new
+# trainer lines need no code changes. The line patterns above are compiled
+# at import.
+
+class RuleSet:
+    """Scan rules built from the data files. Use load_rules() to get one."""
+
+    def __init__(self, words, trainers, special_phrases):
+        if len(words) != len(trainers):
+            raise ValueError(
+                f"File Alignment Error: rankmessages.txt ({len(words)} lines) and "
+                f"trainers.txt ({len(trainers)} lines) must match exactly."
+            )
+        self.words = words
+        self.trainer_for = dict(zip(words, trainers))
+        self.special_phrases = special_phrases
+        self.matcher = get_phrase_matcher(words)
+        self.anchors = get_candidate_anchors(words)
+
+    def trainer_ranks(self, word_occ):
+        """Sum {phrase: count} into {trainer: count}."""
+        ranks = {}
+        for w, c in word_occ.items():
+            if c:
+                t = self.trainer_for.get(w, "Unknown")
+                ranks[t] = ranks.get(t, 0) + c
+        return ranks
+
+def _data_lines(data):
+    """Non-empty stripped lines of a data file, decoded as UTF-8, else mac_roman."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("mac_roman")
+    return [l for l in (line.strip() for line in text.splitlines()) if l]
+
+_rule_sets = {}
+
+def load_rules(words_path, trainers_path, special_path):
+    """The RuleSet for these files, compiled only when their contents change."""
+    blobs = []
+    for path in (words_path, trainers_path, special_path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        with open(path, "rb") as f:
+            blobs.append(f.read())
+    key = tuple(hashlib.sha256(b).hexdigest() for b in blobs)
+    rules = _rule_sets.get(key)
+    if rules is None:
+        rules = _rule_sets[key] = RuleSet(*(_data_lines(b) for b in blobs))
+    return rules
+
+# -- Encoding cache ----------------------------------------------------------
+#
+# path -> (size, mtime, encoding) for logs that were read to the end. An
+# unchanged log is decoded straight away with what it was last time, with
+# no UTF-8 attempt for mac_roman logs and no validation for ASCII or UTF-8
+# ones, even when its checkpoint is gone (Rescan All, a new character on
+# the same folder).
+
+_encoding_cache = {}
+
+def remember_encoding(path, size, mtime, encoding):
+    if encoding:
+        _encoding_cache[path] = (size, mtime, encoding)
+
+# -- Process-pool parsing ----------------------------------------------------
+#
+# Files only meet in the reduce at the end of scan_folder_checkpointed(), so
+# files with a lot of new data are parsed in worker processes, one file per
+# task. Workers only import this module and never open the event store: the
+# chunks they would have written come back with their result and the caller
+# writes them. Results are folded in file order, not completion order, so
+# totals, study order and stored rows match a serial scan exactly.
+
+PARSE_WORKERS = os.cpu_count() or 1  # 1 parses everything in the calling thread
+
+# Less new data than this is parsed in the calling thread (a rescan that
+# only picks up the tail of the current log is not worth a round trip)
+PARSE_POOL_MIN_BYTES = 256 * 1024
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def get_process_pool():
+    """The shared parse pool, started on first use; None if PARSE_WORKERS <= 1."""
+    global _process_pool
+    if PARSE_WORKERS <= 1:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn everywhere: forking a process that runs Tk and scan
+            # threads is not safe, and Windows/macOS spawn anyway
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _process_pool
+
+class _ChunkRecorder:
+    """Takes an EventStore's place in a worker and keeps the chunks written."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write_chunk(self, character, path, pos, file_time, events):
+        self.chunks.append((character, path, pos, file_time, events))
+
+def _parse_file_task(fpath, entry, words, character_name, record_events, known):
+    """Worker side of update_file_checkpoint(); returns (entry, state, chunks)."""
+    recorder = _ChunkRecorder() if record_events else None
+    entry, state = update_file_checkpoint(fpath, entry, words, character_name, recorder, known)
+    return entry, state, recorder.chunks if recorder else []
+
+def _pending_bytes(fpath, entry):
+    st = os.stat(fpath)
+    if entry is None or st.st_size < entry["size"]:
+        return st.st_size
+    return st.st_size - entry["offset"]
+
+def _folder_files(folder_path):
+    """(mtime, path) of the files in a folder, oldest first: the order they are merged in."""
+    files = []
+    for fname in os.listdir(folder_path):
+        fpath = os.path.join(folder_path, fname)
+        if os.path.isfile(fpath):
+            files.append((os.path.getmtime(fpath), fpath))
+    files.sort(key=lambda x: x[0])
+    return files
+
+def _file_scanned(fpath, prev, entry, character_name, store):
+    """Bookkeeping once a file's checkpoint has been brought up to date."""
+    if entry["offset"] == entry["size"]:
+        remember_encoding(fpath, entry["size"], entry["mtime"], entry["encoding"])
+    if store is not None and prev is not None and prev["mtime"] != entry["mtime"]:
+        store.touch_file(character_name, fpath, entry["mtime"])
+
+def _coin_events(coins, file_time, since=None):
+    """A file state's coin rows as coin event dicts, leaving out those logged before since."""
+    events = []
+    for monster, worth, share, skinned, ts, *n in coins:
+        if since and event_time(ts, file_time) < since:
+            continue
+        events.append({
+            "monster": monster,
+            "worth": worth,
+            "share": share,
+            "skinned": skinned,
+            "file_time": file_time,
+            "timestamp": ts,
+            "count": n[0] if n else 1,
+        })
+    return events
+
+def _coin_totals(events):
+    """(skinned, share) summed over coin events."""
+    return (sum(ev["worth"] for ev in events if ev["skinned"]),
+            sum(ev["share"] for ev in events))
+
+def _scan_totals(total, words):
+    """(word_occ, raw_study, kill_counts) of a folder's merged file state."""
+    word_occ = {w: total["ranks"].get(w, 0) for w in words}
+
+    raw_study = {}
+    for creature, (_abandoned, phrase_group, function, ts) in total["study"].items():
+        if phrase_group is None:
+            continue
+        raw_study[creature] = [{
+            "phrase_group": phrase_group,
+            "function": function,
+            "timestamp": datetime.fromisoformat(ts) if ts else None,
+            "creature": creature,
+        }]
+    return word_occ, raw_study, total["kills"]
+
+def scan_folder_checkpointed(folder_path, words, character_name, checkpoints=None,
+                             min_time=None, store=None, pool=None, states=None):
+    """
+    Parse a folder, reusing per-file checkpoints so only new files and
+    appended data are read. Returns (word_occ, raw_study, kill_counts,
+    skinned, share, coin_events, checkpoints). With a pool (see
+    get_process_pool()), large files are parsed in parallel. A states
+    dict, if given, is filled with each file's state in merge order,
+    trailing partial lines included.
+    """
+    old = checkpoints or {}
+    new = {}
+    files = _folder_files(folder_path)
+
+    total = _empty_file_state()
+    coin_events = []
+    since = iso_time(min_time) if min_time else None
+    detail_since = time.time() - COIN_DETAIL_SECONDS
+    fold_before = iso_time(min(detail_since, min_time) if min_time else detail_since)
+
+    tasks = {}
+    if pool is not None:
+        for file_time, fpath in files:
+            prev = old.get(fpath)
+            try:
+                if _pending_bytes(fpath, prev) < PARSE_POOL_MIN_BYTES:
+                    continue
+            except OSError:
+                continue
+            tasks[fpath] = pool.submit(_parse_file_task, fpath, prev, words,
+                                       character_name, store is not None,
+                                       _encoding_cache.get(fpath))
+
+    for file_time, fpath in files:
+        prev = old.get(fpath)
+        try:
+            if fpath in tasks:
+                entry, state, chunks = tasks[fpath].result()
+                if store is not None:
+                    for chunk in chunks:
+                        store.write_chunk(*chunk)
+            else:
+                entry, state = update_file_checkpoint(fpath, prev, words, character_name,
+                                                      store, _encoding_cache.get(fpath))
+        except OSError:
+            continue
+        new[fpath] = _fold_coins(entry, fold_before)
+        _file_scanned(fpath, prev, entry, character_name, store)
+        if states is not None:
+            states[fpath] = state
+
+        _merge_file_state(total, dict(state, coins=[]))
+        if min_time and entry["mtime"] < min_time:
+            continue
+        coin_events.extend(_coin_events(state["coins"], entry["mtime"], since))
+
+    if store is not None:
+        store.drop_files(character_name, [f for f in old if f not in new])
+
+    word_occ, raw_study, kill_counts = _scan_totals(total, words)
+    skinned_total, share_total = _coin_totals(coin_events)
+    return word_occ, raw_study, kill_counts, skinned_total, share_total, coin_events, new
+
+# -- Checkpoint store --------------------------------------------------------
+#
+# checkpoints.db keeps the GUI's checkpoints (see above), one row per
+# character, folder and file, with the entry as compact JSON. A scan only
+# rewrites the rows of files it parsed further (or whose coins it folded)
+# and deletes those of files that are gone, so saving after a rescan that
+# picked up one appended log writes one row. Like EventStore, one store is
+# shared between threads and every save is its own short transaction.
+
+CHECKPOINTS_DB = "checkpoints.db"
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    character TEXT NOT NULL,
+    folder    TEXT NOT NULL,
+    file      TEXT NOT NULL,
+    entry     TEXT NOT NULL,
+    PRIMARY KEY (character, folder, file)
+) WITHOUT ROWID;
+"""
+
+def _entry_version(entry):
+    # what changes whenever update_file_checkpoint() or _fold_coins() does
+    return (entry.get("format"), entry["size"], entry["mtime"], entry["offset"],
+            entry["encoding"], len(entry["state"]["coins"]))
+
+class CheckpointStore:
+    """SQLite store of scan checkpoints. Use as a context manager, or close() it."""
+
+    def __init__(self, path=CHECKPOINTS_DB):
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_CHECKPOINT_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def load(self):
+        """{character: {folder: {file_path: entry}}} of everything stored."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT character, folder, file, entry FROM checkpoints").fetchall()
+        found = {}
+        for character, folder, fpath, entry in rows:
+            found.setdefault(character, {}).setdefault(folder, {})[fpath] = json.loads(entry)
+        return found
+
+    def save_folder(self, character, folder, checkpoints, previous=None):
+        """
+        Store a folder's checkpoints, as returned by a scan that was given
+        previous: entries the scan did not change are not written again.
+        With no previous (a scan from scratch) the folder's rows are replaced.
+        """
+        replace = previous is None
+        previous = previous or {}
+        changed = [
+            (character, folder, fpath, json.dumps(entry, separators=(",", ":")))
+            for fpath, entry in checkpoints.items()
+            if fpath not in previous or _entry_version(previous[fpath]) != _entry_version(entry)
+        ]
+        gone = [(character, folder, fpath) for fpath in previous if fpath not in checkpoints]
+        if not changed and not gone and not replace:
+            return
+        with self._lock, self.conn:
+            if replace:
+                self.conn.execute("DELETE FROM checkpoints WHERE character = ? AND folder = ?",
+                                  (character, folder))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO checkpoints (character, folder, file, entry)"
+                " VALUES (?, ?, ?, ?)", changed)
+            self.conn.executemany(
+                "DELETE FROM checkpoints WHERE character = ? AND folder = ? AND file = ?",
+                gone)
+
+    def drop(self, character, folder=None):
+        """Forget a character's checkpoints, or only those of one folder."""
+        with self._lock, self.conn:
+            if folder is None:
+                self.conn.execute("DELETE FROM checkpoints WHERE character = ?", (character,))
+            else:
+                self.conn.execute("DELETE FROM checkpoints WHERE character = ? AND folder = ?",
+                                  (character, folder))
+
+# -- Event store -------------------------------------------------------------
+#
+# Every committed event can also be kept in an SQLite database, one row per
+# event, for tools that want to query events rather than totals (rccli.py
+# --db). file_time follows the file's mtime, like the in-memory coin
+# filter. pos is the byte offset of the chunk an event came from:
+# re-parsing a file from some offset first deletes whatever was stored past
+# it, so a scan that is interrupted before its checkpoints are saved cannot
+# leave duplicates.
+#
+# Each write is its own transaction, one chunk of a file at a time, and
+# writes through one EventStore are serialized on a lock, so scans sharing
+# a store only wait for each other a chunk at a time.
+
+EVENTS_DB = "events.db"
+
+_EVENT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    character TEXT NOT NULL,
+    file      TEXT NOT NULL,
+    pos       INTEGER NOT NULL,
+    file_time REAL NOT NULL,
+    ts        TEXT,
+    type      TEXT NOT NULL,
+    subject   TEXT,
+    detail    TEXT,
+    n         INTEGER NOT NULL DEFAULT 1,
+    worth     INTEGER,
+    share     INTEGER,
+    skinned   INTEGER
+);
+CREATE INDEX IF NOT EXISTS events_file ON events (character, file, pos);
+CREATE INDEX IF NOT EXISTS events_type ON events (character, type, file_time);
+CREATE INDEX IF NOT EXISTS events_ts   ON events (character, ts);
+"""
+
+class EventStore:
+    """
+    SQLite store of parsed log events. One store can be shared by every
+    scan thread of a process. Use as a context manager, or close() it.
+    """
+
+    def __init__(self, path=EVENTS_DB):
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_EVENT_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def write_chunk(self, character, path, pos, file_time, events):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM events WHERE character = ? AND file = ? AND pos >= ?",
+                (character, path, pos),
+            )
+            self.conn.executemany(
+                "INSERT INTO events (character, file, pos, file_time, type, subject,"
+                " detail, n, worth, share, skinned, ts)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(character, path, pos, file_time) + ev for ev in events],
+            )
+
+    def touch_file(self, character, path, file_time):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE events SET file_time = ? WHERE character = ? AND file = ?",
+                (file_time, character, path),
+            )
+
+    def drop_files(self, character, paths):
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "DELETE FROM events WHERE character = ? AND file = ?",
+                [(character, p) for p in paths],
+            )
+
+    def drop_character(self, character):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM events WHERE character = ?", (character,))
+
+# -- Coin time windows -------------------------------------------------------
+
+class CoinIndex:
+    """
+    Coin events sorted by when they were logged, with running totals, so
+    the coins of any time window are found by bisection instead of a pass
+    over every event. Build it from all of a character's coins; the time
+    filter only picks a window.
+    """
+
+    def __init__(self, events):
+        keyed = sorted(
+            (event_time(ev["timestamp"], ev["file_time"]), i)
+            for i, ev in enumerate(events)
+        )
+        self.times = [t for t, _ in keyed]
+        self.events = [events[i] for _, i in keyed]
+        self._skinned = [0]
+        self._share = [0]
+        self._recount(0)
+
+    def __len__(self):
+        return len(self.events)
+
+    def _recount(self, start):
+        # running totals from position start on; those before it still hold
+        del self._skinned[start + 1:], self._share[start + 1:]
+        tail = self.events[start:]
+        self._skinned.extend(itertools.islice(itertools.accumulate(
+            (ev["worth"] if ev["skinned"] else 0 for ev in tail), initial=self._skinned[start]), 1, None))
+        self._share.extend(itertools.islice(itertools.accumulate(
+            (ev["share"] for ev in tail), initial=self._share[start]), 1, None))
+
+    def update(self, added=(), removed=()):
+        """
+        Index added and drop removed (the very event dicts indexed before).
+        Live mode's changes are recent coins near the end, so only the tail
+        of the running totals is recounted.
+        """
+        start = len(self.events)
+        for ev in removed:
+            i = bisect.bisect_left(self.times, event_time(ev["timestamp"], ev["file_time"]))
+            while self.events[i] is not ev:
+                i += 1
+            del self.times[i], self.events[i]
+            start = min(start, i)
+        for ev in added:
+            t = event_time(ev["timestamp"], ev["file_time"])
+            i = bisect.bisect_right(self.times, t)
+            self.times.insert(i, t)
+            self.events.insert(i, ev)
+            start = min(start, i)
+        self._recount(start)
+
+    def window(self, min_time=None):
+        """(skinned, share, events) for the coins logged at or after min_time."""
+        start = bisect.bisect_left(self.times, iso_time(min_time)) if min_time else 0
+        return (self._skinned[-1] - self._skinned[start],
+                self._share[-1] - self._share[start],
+                self.events[start:])
+
+# -- Folder results ----------------------------------------------------------
+
+def get_min_time_from_filter(filter_value):
+    now = time.time()
+    mapping = {
+        "Last 5 minutes": 5 * 60,
+        "Last 10 minutes": 10 * 60,
+        "Last 30 minutes": 30 * 60,
+        "Last 1 hour": 60 * 60,
+        "Last 3 hours": 3 * 60 * 60,
+        "Last 6 hours": 6 * 60 * 60,
+        "Last 12 hours": 12 * 60 * 60,
+        "Last 24 hours": 24 * 60 * 60
+    }
+    if filter_value in mapping:
+        return now - mapping[filter_value]
+    return None  # "All logs" or unknown
+
+def aggregate_folder(folder_path, character_name, rules, checkpoints=None,
+                     min_time=None, store=None, pool=None):
+    """
+    Scan one folder and turn the counts into what the rank, creature and
+    coin tabs show:
+        (normal_ranks, special_creatures, skinned, share, coin_events,
+         folder_name, (folder_path, checkpoints))
+    rules is a RuleSet from load_rules(); the other arguments are passed
+    on to scan_folder_checkpointed().
+    """
+    # --------------------------------------------------------------
+    # Parse new files / appended data, reuse checkpoints for the rest
+    # --------------------------------------------------------------
+    scan = scan_folder_checkpointed(folder_path, rules.words, character_name, checkpoints,
+                                    min_time, store, pool)
+    return _folder_result(folder_path, rules, *scan)
+
+def _folder_result(folder_path, rules, word_occ, raw_study, kill_counts, skinned, share,
+                   coin_events, checkpoints):
+    """aggregate_folder()'s result from scan_folder_checkpointed()'s."""
+    special_occ = build_study_entries(raw_study, kill_counts)
+
+    # --------------------------------------------------------------
+    # NORMAL RANKS
+    # --------------------------------------------------------------
+    normal_ranks = rules.trainer_ranks(word_occ)
+
+    # --------------------------------------------------------------
+    # SPECIAL CREATURE PROCESSING (MOST RECENT STAGE)
+    # --------------------------------------------------------------
+    latest_per_creature = {}
+
+    for trainer_clean, entries in special_occ.items():
+        if not entries:
+            continue
+
+        # Attach msg_num to each entry
+        for e in entries:
+            phrase_group = e["phrase_group"]
+            msgnums = phrase_to_msgnums.get(phrase_group)
+            if msgnums:
+                e["msg_num"] = min(msgnums)
+            else:
+                e["msg_num"] = None
+
+        # ----------------------------------------------------------
+        # Determine current stage using MOST RECENT message
+        # ----------------------------------------------------------
+        entries_sorted = sorted(
+            entries,
+            key=lambda e: (e["timestamp"] is None, e["timestamp"])
+        )
+        current_stage = entries_sorted[-1]["function"]
+
+        # Filter to only messages of the current stage
+        stage_entries = [e for e in entries if e["function"] == current_stage]
+
+        # ----------------------------------------------------------
+        # Pick the most recent message WITHIN the current stage
+        # ----------------------------------------------------------
+        stage_entries_sorted = sorted(
+            stage_entries,
+            key=lambda e: (e["timestamp"] is None, e["timestamp"])
+        )
+        best = stage_entries_sorted[-1]
+
+        latest_per_creature[trainer_clean] = best
+
+    # --------------------------------------------------------------
+    # Convert to UI format
+    # --------------------------------------------------------------
+    special_creatures = {}
+
+    for trainer_clean, e in latest_per_creature.items():
+        lbl = e["display_label"]
+        msg_num = e["msg_num"]
+        kl  = e["kills_left"]
+
+        if isinstance(kl, int):
+            kl_str = str(kl)
+        elif kl is None:
+            kl_str = ""
+        else:
+            kl_str = str(kl)
+
+        special_creatures[lbl] = (msg_num, kl_str)
+
+    return (normal_ranks, special_creatures, skinned, share, coin_events,
+            os.path.basename(folder_path), (folder_path, checkpoints))
+
+def summarize_coin_events(events):
+    summary = {}
+    for ev in events:
+        monster = ev["monster"]
+        if monster not in summary:
+            summary[monster] = {
+                "total_worth": 0,
+                "total_share": 0,
+                "your_skins": 0
+            }
+        summary[monster]["total_worth"] += ev["worth"]
+        summary[monster]["total_share"] += ev["share"]
+        if ev["skinned"]:
+            summary[monster]["your_skins"] += ev.get("count", 1)
+    return summary
+
+def merge_scan_results(results):
+    """
+    Combine aggregate_folder() results for one character's folders, the
+    same way the GUI does: ranks and coins add up, and a creature seen in
+    several folders keeps the entry of the last one.
+    """
+    ranks, creatures, coin_events, checkpoints = {}, {}, [], {}
+    skinned = share = 0
+    for normal_ranks, special_creatures, f_skinned, f_share, f_events, _name, f_cp in results:
+        for name, count in normal_ranks.items():
+            ranks[name] = ranks.get(name, 0) + count
+        creatures.update(special_creatures)
+        skinned += f_skinned
+        share += f_share
+        coin_events.extend(f_events)
+        folder_path, folder_checkpoints = f_cp
+        checkpoints[folder_path] = folder_checkpoints
+    return {
+        "ranks": ranks,
+        "creatures": creatures,
+        "skinned": skinned,
+        "share": share,
+        "coin_events": coin_events,
+        "checkpoints": checkpoints,
+    }
+
+
+class ScanReducer:
+    """
+    Collects the aggregate_folder() futures of one scan. Once the last
+    folder is done, on_done(merged, errors) is called once, on that
+    folder's worker thread: merged comes from merge_scan_results() over the
+    folders that succeeded, in the order they were given, and errors is a
+    list of (folder, exception).
+    """
+
+    def __init__(self, folders, on_done):
+        self.folders = list(folders)
+        self.on_done = on_done
+        self._results = {}
+        self._errors = []
+        self._pending = len(self.folders)
+        self._lock = threading.Lock()
+
+    def watch(self, folder, fut):
+        fut.add_done_callback(functools.partial(self._folder_done, folder))
+
+    def _folder_done(self, folder, fut):
+        try:
+            result, error = fut.result(), None
+        except Exception as e:
+            result, error = None, e
+        with self._lock:
+            if error is None:
+                self._results[folder] = result
+            else:
+                self._errors.append((folder, error))
+            self._pending -= 1
+            if self._pending:
+                return
+        merged = merge_scan_results(
+            [self._results[f] for f in self.folders if f in self._results]
+        )
+        self.on_done(merged, self._errors)
+
+# -- Live log watching -------------------------------------------------------
+#
+# LogWatcher calls on_change(folder, path) from its own thread whenever a
+# log in one of the folders grows or a new log appears. On Linux it blocks
+# on inotify (through libc, no extra packages); elsewhere, or if inotify is
+# not available, it polls the newest log of each folder every `interval`
+# seconds and re-lists a folder when its mtime changes (or every few
+# seconds) to notice a new session log.
+# Changes seen together are reported once per file. LiveScan keeps each
+# folder's totals in memory, so a report costs parsing what was appended
+# to that one log, not a pass over the folder.
+
+LIVE_POLL_INTERVAL = 0.1
+LIVE_RELIST_INTERVAL = 2.0
+
+_IN_MODIFY      = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO    = 0x080
+_IN_CREATE      = 0x100
+
+def _newest_file(folder):
+    newest = None
+    for fname in os.listdir(folder):
+        fpath = os.path.join(folder, fname)
+        try:
+            st = os.stat(fpath)
+        except OSError:
+            continue
+        if os.path.isfile(fpath) and (newest is None or st.st_mtime >= newest[1]):
+            newest = (fpath, st.st_mtime)
+    return newest[0] if newest else None
+
+class LogWatcher:
+    """Follows a set of log folders and reports the logs that changed."""
+
+    def __init__(self, folders, on_change, interval=LIVE_POLL_INTERVAL):
+        self.folders = list(folders)
+        self.on_change = on_change
+        self.interval = interval
+        self.mode = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        fd = self._inotify_open()
+        if fd is None:
+            self.mode = "poll"
+            self._poll()
+            return
+        self.mode = "inotify"
+        try:
+            self._watch(fd)
+        finally:
+            os.close(fd)
+
+    def _inotify_open(self):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            self._wds = {}
+            mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+            for folder in self.folders:
+                wd = libc.inotify_add_watch(fd, os.fsencode(folder), mask)
+                if wd < 0:
+                    os.close(fd)
+                    return None
+                self._wds[wd] = folder
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _watch(self, fd):
+        header = struct.Struct("iIII")
+        while not self._stop.is_set():
+            # wake up now and then to notice stop()
+            ready, _, _ = select.select([fd], [], [], 0.5)
+            if not ready:
+                continue
+            data = os.read(fd, 64 * 1024)
+            changed = {}
+            pos = 0
+            while pos + header.size <= len(data):
+                wd, _mask, _cookie, length = header.unpack_from(data, pos)
+                pos += header.size
+                # the file's name, padded with NULs
+                name = data[pos:pos + length].rstrip(b"\0")
+                pos += length
+                folder = self._wds.get(wd)
+                if folder is not None and name:
+                    changed[folder, os.path.join(folder, os.fsdecode(name))] = None
+            for folder, fpath in changed:
+                if self._stop.is_set():
+                    return
+                self.on_change(folder, fpath)
+
+    def _poll(self):
+        newest = {}
+        folder_mtimes = {}
+        seen = {}
+        last_list = 0.0
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            relist = now - last_list >= LIVE_RELIST_INTERVAL
+            if relist:
+                last_list = now
+            for folder in self.folders:
+                try:
+                    # a new log changes the folder's mtime on most systems
+                    folder_mtime = os.stat(folder).st_mtime
+                    if relist or folder_mtimes.get(folder) != folder_mtime or folder not in newest:
+                        folder_mtimes[folder] = folder_mtime
+                        newest[folder] = _newest_file(folder)
+                    fpath = newest[folder]
+                    if fpath is None:
+                        continue
+                    st = os.stat(fpath)
+                except OSError:
+                    newest.pop(folder, None)
+                    continue
+                sig = (fpath, st.st_size, st.st_mtime)
+                if folder in seen and seen[folder] != sig:
+                    self.on_change(folder, fpath)
+                seen[folder] = sig
+
+class LiveFolder:
+    """
+    One folder followed in live mode. The merged state of every log but the
+    newest is kept, so an append to the newest (the session being played)
+    only parses the new lines and merges one file's state on top. A change
+    to any older log rescans the folder, which still only parses what is
+    new since its checkpoints.
+    """
+
+    def __init__(self, folder_path, character_name, rules, checkpoints=None, store=None):
+        self.folder_path = folder_path
+        self.character_name = character_name
+        self.rules = rules
+        self.store = store
+        self.rescan(checkpoints)
+
+    def rescan(self, checkpoints=None):
+        states = {}
+        self.checkpoints = scan_folder_checkpointed(
+            self.folder_path, self.rules.words, self.character_name, checkpoints,
+            store=self.store, states=states)[6]
+        self.base = _empty_file_state()
+        self.base_events = []
+        self.base_coins = (0, 0)  # (skinned, share) of base_events
+        self.newest, self.newest_state, self.newest_events = None, _empty_file_state(), []
+        for fpath, state in states.items():
+            self._retire_newest()
+            self.newest, self.newest_state = fpath, state
+            self.newest_events = _coin_events(state["coins"], self.checkpoints[fpath]["mtime"])
+
+    def _retire_newest(self):
+        # a newer log started: the newest one joins the others
+        if self.newest is not None:
+            _merge_file_state(self.base, dict(self.newest_state, coins=[]))
+            self.base_events.extend(self.newest_events)
+            skinned, share = _coin_totals(self.newest_events)
+            self.base_coins = (self.base_coins[0] + skinned, self.base_coins[1] + share)
+
+    def update(self, path):
+        """
+        Fold in what changed in path. Returns (added, removed) coin events,
+        or None if the folder was rescanned and its coins must be indexed
+        again (see coin_events()).
+        """
+        try:
+            mtime = os.path.getmtime(path)
+            is_file = os.path.isfile(path)
+        except OSError:
+            mtime, is_file = None, False
+        if not is_file:
+            if path in self.checkpoints:
+                self.rescan(self.checkpoints)  # a log was removed
+                return None
+            return [], []
+        if path != self.newest:
+            if path in self.checkpoints or (
+                    self.newest in self.checkpoints
+                    and mtime < self.checkpoints[self.newest]["mtime"]):
+                self.rescan(self.checkpoints)
+                return None
+            self._retire_newest()
+            self.newest, self.newest_state, self.newest_events = path, _empty_file_state(), []
+
+        prev = self.checkpoints.get(path)
+        try:
+            entry, state = update_file_checkpoint(path, prev, self.rules.words,
+                                                  self.character_name, self.store,
+                                                  _encoding_cache.get(path))
+        except OSError:
+            return [], []
+        _file_scanned(path, prev, entry, self.character_name, self.store)
+        # a new dict, so the checkpoints handed out before are left as they were
+        self.checkpoints = dict(self.checkpoints)
+        self.checkpoints[path] = _fold_coins(entry, iso_time(time.time() - COIN_DETAIL_SECONDS))
+        removed = self.newest_events
+        self.newest_state = state
+        self.newest_events = _coin_events(state["coins"], entry["mtime"])
+        return self.newest_events, removed
+
+    def coin_events(self):
+        return self.base_events + self.newest_events
+
+    def result(self):
+        """
+        aggregate_folder()'s result for the folder as it is now, except that
+        the coin events are left out: see coin_events().
+        """
+        total = _copy_file_state(self.base)
+        _merge_file_state(total, dict(self.newest_state, coins=[]))
+        word_occ, raw_study, kill_counts = _scan_totals(total, self.rules.words)
+        skinned, share = _coin_totals(self.newest_events)
+        return _folder_result(self.folder_path, self.rules, word_occ, raw_study, kill_counts,
+                              self.base_coins[0] + skinned, self.base_coins[1] + share, [],
+                              self.checkpoints)
+
+class LiveScan:
+    """
+    Live mode's view of one character's folders, kept up to date one
+    changed log at a time. update() is called with what LogWatcher reported;
+    merged() gives what merge_scan_results() would for a full scan, minus
+    the coin events, which the caller keeps in a CoinIndex.
+    """
+
+    def __init__(self, character_name, folders, rules, checkpoints=None, store=None):
+        checkpoints = checkpoints or {}
+        self.character_name = character_name
+        self.folders = {
+            folder: LiveFolder(folder, character_name, rules, checkpoints.get(folder), store)
+            for folder in folders
+        }
+        self._results = {folder: live.result() for folder, live in self.folders.items()}
+
+    def update(self, folder, path):
+        """LiveFolder.update() for one reported log."""
+        live = self.folders.get(folder)
+        if live is None:
+            return [], []
+        delta = live.update(path)
+        self._results[folder] = live.result()
+        return delta
+
+    def coin_events(self):
+        return [ev for live in self.folders.values() for ev in live.coin_events()]
+
+    def merged(self):
+        return merge_scan_results([self._results[folder] for folder in self.folders])
+
+# -- Log search index --------------------------------------------------------
+#
+# logindex.db maps the three-character strings of the logs, lowercased, to
+# the blocks of lines they appear in, so a search only reads candidate
+# blocks. There is one index for everyone: files are keyed by path, so a
+# folder shared by several characters is indexed once.
+#
+# Files are indexed incrementally, like scan checkpoints: files.offset is
+# how far a file has been indexed (always just after a line break) and an
+# update only reads past it. A file that shrank, or kept its size but got a
+# new mtime, is indexed again from the start. The partial line at the end
+# of a file that is still being written is not indexed; searches scan it.
+#
+# trigrams has one row per three-character string per chunk; "blocks" is
+# an array("I") of the offsets of the blocks of that chunk holding it. A
+# block is a run of whole lines at least LOG_INDEX_BLOCK bytes long. For
+# rcbench.py's 4.2 MB of logs the index takes 1.9 MB (0.44x); on logs with
+# more varied text we measured up to 0.7x.
+#
+# Only blocks holding every trigram of a query are read, and the lines in
+# them are checked against the query exactly. A query shorter than three
+# characters cannot be narrowed down and is scanned for in every log.
+
+LOG_INDEX_DB = "logindex.db"
+LOG_INDEX_VERSION = 3  # an index with another PRAGMA user_version is rebuilt
+LOG_INDEX_CHUNK = 4 * 1024 * 1024
+LOG_INDEX_BLOCK = 16 * 1024
+LOG_INDEX_LINE_READ = 4096  # read this much at a time to finish a block's last line
+LOG_INDEX_MAX_FILE = 2 ** 32  # offsets are stored as 32-bit integers
+
+_BYTES_LINE_RE = re.compile(rb"[^\r\n]+")
+_LINE_END_RE = re.compile(rb"[\r\n]")
+_TEXT_LINE_END_RE = re.compile(r"[\r\n]")
+
+_LOG_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id     INTEGER PRIMARY KEY,
+    path   TEXT NOT NULL UNIQUE,
+    size   INTEGER NOT NULL,
+    mtime  REAL NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trigrams (
+    gram   TEXT NOT NULL,
+    file   INTEGER NOT NULL,
+    start  INTEGER NOT NULL,
+    blocks BLOB NOT NULL,
+    PRIMARY KEY (gram, file, start)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trigrams_file ON trigrams (file);
+"""
+
+def _index_text(data):
+    """data decoded the way search_log_file() reads it, lowercased."""
+    if data.isascii():
+        return data.decode("latin-1").lower()
+    return data.decode("utf-8", "ignore").lower()
+
+def _block_end(data, start, end):
+    """Where the block of data starting at start ends (see above)."""
+    m = _LINE_END_RE.search(data, start + LOG_INDEX_BLOCK, end)
+    return m.end() if m else end
+
+class LogIndex:
+    """The Log Search index (see above). Use as a context manager."""
+
+    def __init__(self, path=LOG_INDEX_DB):
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != LOG_INDEX_VERSION:
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS trigrams; DROP TABLE IF EXISTS postings;"
+                "DROP TABLE IF EXISTS tokens; DROP TABLE IF EXISTS files;"
+            )
+            self.conn.execute(f"PRAGMA user_version = {LOG_INDEX_VERSION}")
+        self.conn.executescript(_LOG_INDEX_SCHEMA)
+        self.indexed_bytes = 0
+        self.index_seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.commit()
+        self.conn.close()
+
+    # -- Updating
+
+    def update(self, folders, stop=None):
+        """
+        Index what is new in the .txt files under folders. Returns the files
+        as [(path, file_id, offset, size)] in os.walk order; file_id is None
+        for files that cannot be indexed. stop() is checked between files;
+        when it returns True the update ends early.
+        """
+        started = time.perf_counter()
+        files = []
+        for folder in folders:
+            if not os.path.isdir(folder):
+                continue
+            seen = set()
+            for path in _log_paths([folder]):
+                if stop is not None and stop():
+                    self.index_seconds += time.perf_counter() - started
+                    return files
+                seen.add(path)
+                try:
+                    files.append(self._update_file(path))
+                except OSError:
+                    continue
+            self._forget_missing(folder, seen)
+        self.index_seconds += time.perf_counter() - started
+        return files
+
+    def files(self, folders):
+        """
+        The .txt files under folders as update() returns them, without
+        indexing anything: what is new in a file is left to be scanned, and
+        a file that was replaced gets file_id None.
+        """
+        files = []
+        for path in _log_paths(folders):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            row = self.conn.execute(
+                "SELECT id, size, mtime, offset FROM files WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None or st.st_size < row[1] or (
+                st.st_size == row[1] and st.st_mtime != row[2]
+            ):
+                files.append((path, None, 0, st.st_size))
+            else:
+                files.append((path, row[0], row[3], st.st_size))
+        return files
+
+    def stats(self):
+        """
+        Size of the index and how fast this LogIndex has been building it:
+        {"files", "log_bytes", "index_bytes", "indexed_bytes", "seconds",
+        "mb_per_s"}. log_bytes is how much of the logs is indexed.
+        """
+        files, log_bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(offset), 0) FROM files"
+        ).fetchone()
+        pages = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        secs = self.index_seconds
+        return {
+            "files": files,
+            "log_bytes": log_bytes,
+            "index_bytes": pages * page_size,
+            "indexed_bytes": self.indexed_bytes,
+            "seconds": secs,
+            "mb_per_s": self.indexed_bytes / 1024 ** 2 / secs if secs else None,
+        }
+
+    def _update_file(self, path):
+        st = os.stat(path)
+        row = self.conn.execute(
+            "SELECT id, size, mtime, offset FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if st.st_size >= LOG_INDEX_MAX_FILE:
+            return path, None, 0, st.st_size
+        with self.conn:
+            if row is None:
+                file_id = self.conn.execute(
+                    "INSERT INTO files (path, size, mtime, offset) VALUES (?, ?, ?, 0)",
+                    (path, st.st_size, st.st_mtime),
+                ).lastrowid
+                offset = 0
+            else:
+                file_id, size, mtime, offset = row
+                if (size, mtime) == (st.st_size, st.st_mtime):
+                    return path, file_id, offset, size
+                if st.st_size < size or (st.st_size == size and st.st_mtime != mtime):
+                    self.conn.execute("DELETE FROM trigrams WHERE file = ?", (file_id,))
+                    offset = 0
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while offset < st.st_size:
+                    data = f.read(min(LOG_INDEX_CHUNK, st.st_size - offset))
+                    cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+                    if not cut:
+                        break  # only a partial line is left
+                    self._index_trigrams(file_id, offset, data[:cut])
+                    self.indexed_bytes += cut
+                    offset += cut
+                    f.seek(offset)
+            self.conn.execute(
+                "UPDATE files SET size = ?, mtime = ?, offset = ? WHERE id = ?",
+                (st.st_size, st.st_mtime, offset, file_id),
+            )
+        return path, file_id, offset, st.st_size
+
+    def _index_trigrams(self, file_id, start, data):
+        postings = {}
+        get = postings.get
+        pos = 0
+        while pos < len(data):
+            end = _block_end(data, pos, len(data))
+            text = _index_text(data[pos:end])
+            for gram in set(zip(text, text[1:], text[2:])):
+                blocks = get(gram)
+                if blocks is None:
+                    postings[gram] = blocks = array.array("I")
+                blocks.append(start + pos)
+            pos = end
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO trigrams (gram, file, start, blocks) VALUES (?, ?, ?, ?)",
+            [("".join(g), file_id, start, blocks.tobytes()) for g, blocks in postings.items()],
+        )
+
+    def _forget_missing(self, folder, seen):
+        prefix = os.path.join(folder, "")
+        gone = [
+            (file_id,) for file_id, path in self.conn.execute(
+                "SELECT id, path FROM files WHERE path >= ? AND path < ?",
+                (prefix, prefix + "\U0010ffff"),
+            )
+            if path not in seen
+        ]
+        if gone:
+            with self.conn:
+                self.conn.executemany("DELETE FROM trigrams WHERE file = ?", gone)
+                self.conn.executemany("DELETE FROM files WHERE id = ?", gone)
+
+    # -- Searching
+
+    def candidate_blocks(self, query, file_ids):
+        """
+        {file_id: set of block offsets} that may contain query, or None if
+        the query is shorter than a trigram.
+        """
+        q = query.lower()
+        grams = {q[i:i + 3] for i in range(len(q) - 2)}
+        if not grams:
+            return None
+        marks = ",".join("?" * len(grams))
+        sizes = dict(self.conn.execute(
+            f"SELECT gram, SUM(length(blocks)) FROM trigrams WHERE gram IN ({marks}) GROUP BY gram",
+            list(grams),
+        ))
+        if len(sizes) < len(grams):
+            return {}
+        found = None
+        for gram in sorted(grams, key=sizes.get):
+            blocks = {}
+            for file_id, blob in self.conn.execute(
+                "SELECT file, blocks FROM trigrams WHERE gram = ?", (gram,)
+            ):
+                if file_id in (file_ids if found is None else found):
+                    starts = array.array("I")
+                    starts.frombytes(blob)
+                    blocks.setdefault(file_id, set()).update(starts)
+            if found is None:
+                found = blocks
+            else:
+                found = {f: found[f] & s for f, s in blocks.items() if found[f] & s}
+            if not found:
+                break
+        return found
+
+    def search(self, files, word):
+        """Like search_log_file() over files (from update()), using the index."""
+        return list(self.iter_search(files, word))
+
+    def iter_search(self, files, word, stop=None):
+        """
+        search() as a generator: each (line, path) as soon as it is found.
+        stop() is checked before each file and each block read; once it
+        returns true the search ends early.
+        """
+        q = word.lower()
+        indexed = {file_id for _, file_id, _, _ in files if file_id is not None}
+        blocks = self.candidate_blocks(word, indexed)
+        for path, file_id, offset, size in files:
+            if stop is not None and stop():
+                return
+            if file_id is None or blocks is None:
+                yield from search_log_file(path, word, stop)
+                continue
+            found = blocks.get(file_id)
+            if not found and offset >= size:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    for line in _match_blocks(f, sorted(found or ()), offset, q, stop):
+                        yield line, path
+                    if stop is not None and stop():
+                        return
+                    # the unindexed tail: a line still being written
+                    f.seek(offset)
+                    tail = f.read(max(size - offset, 0))
+            except OSError:
+                continue
+            for line in _match_lines(tail, (m.start() for m in _BYTES_LINE_RE.finditer(tail)), q):
+                yield line, path
+
+def _log_paths(folders):
+    """The .txt files under folders, in os.walk order."""
+    for folder in folders:
+        if not os.path.isdir(folder):
+            continue
+        for root, dirs, names in os.walk(folder):
+            for name in names:
+                if name.lower().endswith(".txt"):
+                    yield os.path.join(root, name)
+
+def _read_to_line_end(f, start, at, end):
+    """
+    Bytes [start, x) of the open file f, where x is just past the first
+    line break at or after offset at, or end if there is none before it.
+    """
+    f.seek(start)
+    parts = [f.read(max(min(at, end) - start, 0))]
+    pos = start + len(parts[0])
+    while pos < end:
+        more = f.read(min(LOG_INDEX_LINE_READ, end - pos))
+        if not more:
+            break
+        m = _LINE_END_RE.search(more)
+        if m:
+            parts.append(more[:m.end()])
+            break
+        parts.append(more)
+        pos += len(more)
+    return b"".join(parts)
+
+def _match_lines(data, starts, q):
+    """The lines of data starting at starts that contain q."""
+    for pos in starts:
+        m = _LINE_END_RE.search(data, pos)
+        line = data[pos:m.start() if m else len(data)].decode("utf-8", "ignore")
+        if q in line.lower():
+            yield line
+
+def _match_blocks(f, starts, offset, q, stop=None):
+    """The lines in the blocks of f starting at starts that contain q."""
+    done = 0  # a block cut short by the end of a chunk overlaps the next one
+    for start in starts:
+        start = max(start, done)
+        if start >= offset:
+            continue
+        if stop is not None and stop():
+            return
+        block = _read_to_line_end(f, start, start + LOG_INDEX_BLOCK, offset)
+        done = start + len(block)
+        decoded = (block.decode("latin-1") if block.isascii()
+                   else block.decode("utf-8", "ignore"))
+        text = decoded.lower()
+        if len(text) != len(decoded):
+            # lowercasing moved characters around: go line by line
+            if q in text:
+                yield from _match_lines(
+                    block, (m.start() for m in _BYTES_LINE_RE.finditer(block)), q)
+            continue
+        # find q in the block and cut out the lines it falls on
+        at = text.find(q)
+        while at >= 0:
+            line_start = max(text.rfind("\n", 0, at), text.rfind("\r", 0, at)) + 1
+            m = _TEXT_LINE_END_RE.search(text, at)
+            line_end = m.start() if m else len(text)
+            yield decoded[line_start:line_end]
+            at = text.find(q, line_end)
+
+# -- Log search --------------------------------------------------------------
+
+SEARCH_STOP_LINES = 256  # lines between stop() checks, about one index block
+
+def search_log_file(file_path, word, stop=None):
+    """
+    Return list of (full_line, file_path) for each line containing word.
+    stop() is checked every SEARCH_STOP_LINES lines; once it returns true
+    the lines found so far are returned.
+    """
+    results = []
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            for n, raw_line in enumerate(f):
+                if stop is not None and not n % SEARCH_STOP_LINES and stop():
+                    break
+                line = raw_line.rstrip("\r\n")
+                if word.lower() in line.lower():
+                    results.append((line, file_path))
+    except:
+        pass
+
+    return results
+
+def search_logs(folders, word, index_path=LOG_INDEX_DB):
+    """search_log_file() over every .txt file under the folders, through the index."""
+    with LogIndex(index_path) as index:
+        return index.search(index.update(folders), word)
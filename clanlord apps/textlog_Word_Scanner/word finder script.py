@@ -1,36 +1,90 @@
 import os
 import sys
+import codecs
+import queue
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-def search_word_in_file(file_path, word):
+# Files are searched by a pool of threads: reading a file leaves the other
+# threads free to search theirs, so many files are read from disk at once.
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+CHUNK_SIZE = 1024 * 1024
+BATCH_SECONDS = 0.1  # how often found files are handed to the listbox
+
+def search_word_in_file(file_path, word, stop=None):
     """
-    Opens the file and checks if the specified word exists.
-    Returns True if found, False otherwise.
+    Reads the file in chunks until the specified word shows up.
+    Returns True if found, False otherwise (also when the stop event is
+    set before the end of the file).
     """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    keep = len(word) - 1  # a match can straddle two chunks
+    tail = ''
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            contents = f.read()
-            if word in contents:
-                return True
+        with open(file_path, 'rb') as f:
+            while True:
+                if stop is not None and stop.is_set():
+                    return False
+                chunk = f.read(CHUNK_SIZE)
+                text = tail + decoder.decode(chunk, final=not chunk)
+                if word in text:
+                    return True
+                if not chunk:
+                    return False
+                tail = text[-keep:] if keep else ''
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
     return False
 
+def walk_text_files(directory):
+    """Yields every .txt file under directory."""
+    for root, dirs, files in os.walk(directory):
+        for filename in files:
+            if filename.lower().endswith('.txt'):
+                yield os.path.join(root, filename)
+
+def iter_matching_files(directory, word, workers=SCAN_WORKERS, stop=None):
+    """
+    Searches the .txt files under directory on a pool of threads and
+    yields each file containing the word as soon as it is found, so not in
+    walk order. Closing the generator, or setting the stop event, stops the
+    search: files not started yet are dropped and files being read give up
+    at their next chunk.
+    """
+    stop = stop or threading.Event()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending = {}
+
+    def finished(limit):
+        # wait until no more than limit files are still being searched
+        while len(pending) > limit and not stop.is_set():
+            done, _ = wait(pending, timeout=BATCH_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                if future.result():
+                    yield path
+
+    try:
+        for path in walk_text_files(directory):
+            if stop.is_set():
+                break
+            pending[pool.submit(search_word_in_file, path, word, stop)] = path
+            yield from finished(workers * 4)
+        yield from finished(0)
+    except GeneratorExit:
+        stop.set()  # closed early: files still being read give up too
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 def scan_directory(directory, word):
     """
     Recursively scans the directory for .txt files containing the search word.
     Returns a list of matching file paths.
     """
-    found_files = []
-    for root, dirs, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith('.txt'):
-                full_path = os.path.join(root, filename)
-                if search_word_in_file(full_path, word):
-                    found_files.append(full_path)
-    return found_files
+    return list(iter_matching_files(directory, word))
 
 def open_file_with_default_app(file_path):
     """
@@ -56,6 +110,9 @@ class LogScannerApp(tk.Tk):
         self.title("Text Log Scanner")
         self.geometry("700x500")
         self.resizable(False, False)
+        self.search_serial = 0
+        self.search_stop = threading.Event()
+        self.found_count = 0
         self.create_widgets()
 
     def create_widgets(self):
@@ -116,26 +173,69 @@ class LogScannerApp(tk.Tk):
             messagebox.showerror("Error", "Please enter a word to search for.")
             return
 
+        # A search that is still running stops now; its results are dropped
+        # when they show up with an old serial
+        self.search_stop.set()
+        self.search_stop = threading.Event()
+        self.search_serial += 1
+        self.found_count = 0
+
         # Clear previous results and show message
         self.results_list.delete(0, tk.END)
         self.results_list.insert(tk.END, "Scanning... Please wait.")
-        
-        # Run scan in a separate thread to keep GUI responsive
-        threading.Thread(target=self.run_scan, args=(folder, word), daemon=True).start()
 
-    def run_scan(self, folder, word):
-        found_files = scan_directory(folder, word)
-        # Update the results in the GUI thread
-        self.results_list.after(0, self.update_results, found_files, word)
+        # Run scan in a separate thread to keep GUI responsive; the GUI
+        # thread picks up what it found every BATCH_SECONDS
+        found = queue.Queue()
+        threading.Thread(target=self.run_scan,
+                         args=(self.search_stop, found, folder, word),
+                         daemon=True).start()
+        self.after(int(BATCH_SECONDS * 1000), self.drain_results,
+                   self.search_serial, found, word)
 
-    def update_results(self, found_files, word):
-        self.results_list.delete(0, tk.END)
-        if found_files:
+    def run_scan(self, stop, found, folder, word):
+        matches = iter_matching_files(folder, word, stop=stop)
+        try:
+            for path in matches:
+                found.put(path)
+        finally:
+            matches.close()
+            found.put(None)  # the scan is over
+
+    def drain_results(self, serial, found, word):
+        if serial != self.search_serial:
+            return  # a newer search took over
+        batch, done = [], False
+        while not done:
+            try:
+                path = found.get_nowait()
+            except queue.Empty:
+                break
+            if path is None:
+                done = True
+            else:
+                batch.append(path)
+        self.add_results(serial, batch, word)
+        if done:
+            self.finish_results(serial, word)
+        else:
+            self.after(int(BATCH_SECONDS * 1000), self.drain_results, serial, found, word)
+
+    def add_results(self, serial, found_files, word):
+        if serial != self.search_serial or not found_files:
+            return
+        if not self.found_count:
+            self.results_list.delete(0, tk.END)
             self.results_list.insert(tk.END, f"Found the word '{word}' in:")
             self.results_list.insert(tk.END, "-------------------------------")
-            for file in found_files:
-                self.results_list.insert(tk.END, file)
-        else:
+        self.results_list.insert(tk.END, *found_files)
+        self.found_count += len(found_files)
+
+    def finish_results(self, serial, word):
+        if serial != self.search_serial:
+            return
+        if not self.found_count:
+            self.results_list.delete(0, tk.END)
             self.results_list.insert(tk.END, f"No files found containing the word '{word}'.")
 
     def open_selected_file(self, event=None):